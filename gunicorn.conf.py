@@ -0,0 +1,22 @@
+"""Gunicorn settings for the web app, read automatically from the working directory.
+
+Background match tasks and their event streams live in the serving process,
+so the app runs as one process whose threads serve requests concurrently: a
+status or event request must reach the process that accepted the match, and
+a long-lived event stream must not occupy the only request handler.
+"""
+import os
+
+workers = 1
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+# Event streams stay open for the whole match; keep-alive comments are sent
+# well inside this limit.
+timeout = 120
+
+
+def on_starting(server):
+    if server.cfg.workers != 1:
+        raise RuntimeError("Run the web app with a single gunicorn worker; match tasks are kept in-process.")
+    if server.cfg.worker_class_str == "sync" or server.cfg.threads < 2:
+        raise RuntimeError("Run the web app with a threaded worker (--worker-class gthread --threads N).")
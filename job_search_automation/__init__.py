@@ -1,14 +1,24 @@
 """Job Search Automation package."""
-from .automation import JobSearchAutomator, AutomationReport
+from .automation import JobSearchAutomator, AutomationReport, AutomationUpdate
 from .config import AutomationConfig, JobSearchConfig, LLMConfig, ResumeConfig
 from .resume_parser import ResumeParser
-from .retriever import ResumeRetriever
-from .matcher import JobMatcher, MatchSettings
-from .llm import LLMClient
+from .retriever import JobCorpus, ResumeRetriever
+from .matcher import JobMatcher, MatchSettings, MatchStats
+from .llm import LLMClient, MatchRequest
+from .metrics import NULL_METRICS, Metrics
 from .apply import JobApplicationService
+from .outbox import ApplicationOutbox
+from .catalogue import JobCatalogue
+from .service import MatchingService
+from .parallel import BatchMatcher, ResumeReport
+from .profiling import ProfileSession, SamplingProfiler
 from .job_fetchers.base import JobFetcher, StaticJobFetcher
+from .job_fetchers.composite import CompositeJobFetcher
+from .job_fetchers.index import JobIndex
 from .job_fetchers.local import LocalJobFetcher
 from .job_fetchers.serpapi import SerpApiJobFetcher
+from .job_fetchers.store import JobStoreFetcher
+from .job_store import JobStore, JobView
 
 try:  # pragma: no cover - optional dependency
     from .webapp import create_app
@@ -20,6 +30,7 @@ except ModuleNotFoundError as exc:  # pragma: no cover - used when Flask is miss
 
 __all__ = [
     "AutomationReport",
+    "AutomationUpdate",
     "AutomationConfig",
     "JobSearchConfig",
     "LLMConfig",
@@ -27,13 +38,30 @@ __all__ = [
     "JobSearchAutomator",
     "ResumeParser",
     "ResumeRetriever",
+    "JobCorpus",
     "JobMatcher",
     "MatchSettings",
+    "MatchStats",
     "LLMClient",
+    "MatchRequest",
+    "Metrics",
+    "NULL_METRICS",
     "JobApplicationService",
+    "ApplicationOutbox",
+    "JobCatalogue",
+    "MatchingService",
+    "BatchMatcher",
+    "ResumeReport",
+    "ProfileSession",
+    "SamplingProfiler",
     "JobFetcher",
     "StaticJobFetcher",
+    "CompositeJobFetcher",
+    "JobIndex",
     "SerpApiJobFetcher",
     "LocalJobFetcher",
+    "JobStoreFetcher",
+    "JobStore",
+    "JobView",
     "create_app",
 ]
@@ -1,14 +1,52 @@
 """Services to automate job applications."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Sequence
+from urllib.parse import urlparse
 
+from .metrics import NULL_METRICS, Metrics
 from .models import ApplicationResult, CandidateProfile, JobPosting
+from .outbox import FAILED, SUBMITTED, ApplicationOutbox, OutboxEntry
 
 try:  # pragma: no cover - optional dependency
     import requests
+    from requests.adapters import HTTPAdapter
 except Exception:  # pragma: no cover - library optional
     requests = None  # type: ignore
+    HTTPAdapter = None  # type: ignore
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` requests per second."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
 
 
 @dataclass(slots=True)
@@ -16,6 +54,23 @@ class JobApplicationService:
     """Automates applying to job postings via HTTP endpoints."""
 
     application_webhook: str | None = None
+    timeout: float = 20
+    # Submissions in flight at once for apply_many; also sizes the connection pool.
+    max_concurrency: int = 4
+    # Retries for connection errors and 429/5xx responses, with exponential backoff.
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    # Upper bound, in seconds, on any single wait, including server-sent Retry-After.
+    max_backoff: float = 60.0
+    # Requests per second allowed to each webhook host; None disables limiting.
+    rate_limit: float | None = None
+    rate_burst: int = 1
+    # Durable record of submissions; reruns skip jobs it marks as submitted.
+    outbox: ApplicationOutbox | None = None
+    metrics: Metrics = field(default=NULL_METRICS, repr=False, compare=False)
+    _session: Any = field(default=None, init=False, repr=False, compare=False)
+    _buckets: dict[str, _TokenBucket] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     def apply_to_job(self, job: JobPosting, profile: CandidateProfile) -> ApplicationResult:
         if not job.url:
@@ -53,10 +108,188 @@ class JobApplicationService:
                 ),
             )
 
+        key = None
+        if self.outbox is not None:
+            candidate = _candidate_identity(payload["candidate"])
+            key = self.outbox.make_key(job.url, candidate)
+            if not self.outbox.claim(key, job.url, candidate, payload):
+                entry = self.outbox.get(key)
+                if entry is not None and entry.status == SUBMITTED:
+                    self.metrics.increment("applications_total", outcome="already_submitted")
+                    return ApplicationResult(job=job, applied=True, message="Application already submitted")
+                self.metrics.increment("applications_total", outcome="in_progress")
+                return ApplicationResult(job=job, applied=False, message="Application is already being submitted")
+
+        return self._submit(job, payload, key)
+
+    def drain_outbox(self, include_failed: bool = False) -> list[ApplicationResult]:
+        """Resubmit outbox entries left pending by an interrupted run.
+
+        Entries are sent with their recorded payload and the same
+        ``Idempotency-Key`` header as the original attempt, so a webhook that
+        already received one can discard the duplicate. Each entry is claimed
+        first, so entries another sender picked up meanwhile are skipped.
+        """
+
+        if self.outbox is None or not self.application_webhook or requests is None:
+            return []
+        return [
+            self._submit(_job_from_entry(entry), entry.payload, entry.key)
+            for entry in self.outbox.pending(include_failed=include_failed)
+            if self.outbox.claim(entry.key, entry.job_url, entry.candidate, entry.payload)
+        ]
+
+    def start_drain(self, include_failed: bool = False) -> threading.Thread:
+        """Run :meth:`drain_outbox` on a background daemon thread."""
+
+        thread = threading.Thread(
+            target=self.drain_outbox,
+            kwargs={"include_failed": include_failed},
+            name="job-application-outbox",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def apply_many(self, jobs: Sequence[JobPosting], profile: CandidateProfile) -> list[ApplicationResult]:
+        """Apply to ``jobs`` concurrently and return the results in input order.
+
+        Submissions share one keep-alive connection pool, run at most
+        ``max_concurrency`` at a time and are throttled per webhook host when
+        ``rate_limit`` is set. Jobs repeating an earlier job's URL are sent
+        once and share its result.
+        """
+
+        jobs = list(jobs)
+        first: dict[str, int] = {}
+        distinct: list[JobPosting] = []
+        positions: list[int] = []
+        for job in jobs:
+            if job.url and job.url in first:
+                positions.append(first[job.url])
+                continue
+            if job.url:
+                first[job.url] = len(distinct)
+            positions.append(len(distinct))
+            distinct.append(job)
+
+        if len(distinct) <= 1 or self.max_concurrency <= 1:
+            results = [self.apply_to_job(job, profile) for job in distinct]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(distinct)), thread_name_prefix="job-application"
+            ) as executor:
+                results = list(executor.map(lambda job: self.apply_to_job(job, profile), distinct))
+        return [
+            results[position] if job is distinct[position] else replace(results[position], job=job)
+            for job, position in zip(jobs, positions)
+        ]
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _submit(self, job: JobPosting, payload: dict, key: str | None) -> ApplicationResult:
         try:
-            response = requests.post(self.application_webhook, json=payload, timeout=20)
-            response.raise_for_status()
-        except requests.RequestException as exc:  # type: ignore[attr-defined]
+            self._post(self.application_webhook, payload, key)  # type: ignore[arg-type]
+        except requests.RequestException as exc:  # type: ignore[union-attr]
+            self.metrics.increment("applications_total", outcome="failed")
+            if key is not None:
+                self.outbox.mark(key, FAILED, str(exc))  # type: ignore[union-attr]
             return ApplicationResult(job=job, applied=False, message=str(exc))
 
+        self.metrics.increment("applications_total", outcome="submitted")
+        if key is not None:
+            self.outbox.mark(key, SUBMITTED)  # type: ignore[union-attr]
         return ApplicationResult(job=job, applied=True, message="Application submitted")
+
+    def _post(self, url: str, payload: dict, idempotency_key: str | None = None) -> None:
+        session = self._get_session()
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        bucket = self._get_bucket(url)
+        attempt = 0
+        while True:
+            if bucket is not None:
+                bucket.acquire()
+            try:
+                with self.metrics.timer("http_request_seconds", target="application"):
+                    response = session.post(url, json=payload, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as exc:  # type: ignore[union-attr]
+                # A read timeout may fire after the webhook received the POST,
+                # so without an idempotency key only failures to connect
+                # (including ConnectTimeout) are safe to resend.
+                retryable = idempotency_key is not None or isinstance(
+                    exc, requests.ConnectionError  # type: ignore[union-attr]
+                )
+                if attempt >= self.max_retries or not retryable:
+                    raise
+                delay = self._backoff(attempt)
+                self.metrics.increment("http_retries_total", target="application", reason="connection")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    return
+                delay = self._backoff(attempt, response.headers.get("Retry-After"))
+                response.close()
+                self.metrics.increment("http_retries_total", target="application", reason=str(response.status_code))
+            time.sleep(delay)
+            attempt += 1
+
+    def _backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        delay = self.backoff_factor * (2**attempt)
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                except (TypeError, ValueError):
+                    pass
+                else:
+                    if retry_at.tzinfo is None:
+                        retry_at = retry_at.replace(tzinfo=timezone.utc)
+                    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(0.0, delay), self.max_backoff)
+
+    def _get_session(self) -> Any:
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()  # type: ignore[union-attr]
+                pool_size = max(1, self.max_concurrency)
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def _get_bucket(self, url: str) -> _TokenBucket | None:
+        if not self.rate_limit:
+            return None
+        host = urlparse(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = _TokenBucket(self.rate_limit, self.rate_burst)
+            return bucket
+
+
+def _candidate_identity(candidate: dict) -> str:
+    """Identify a candidate by email, falling back to a hash of their details."""
+
+    if candidate.get("email"):
+        return str(candidate["email"]).lower()
+    serialized = json.dumps(candidate, sort_keys=True, default=str)
+    return "sha256:" + hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _job_from_entry(entry: OutboxEntry) -> JobPosting:
+    return JobPosting(
+        title=entry.payload.get("job_title", ""),
+        company=entry.payload.get("company", ""),
+        description="",
+        url=entry.job_url,
+    )
@@ -1,21 +1,47 @@
 """High-level orchestration for the job search automation pipeline."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, Sequence
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from typing import Iterable, Iterator, Sequence
 
 from .apply import JobApplicationService
 from .config import AutomationConfig
 from .job_fetchers.base import JobFetcher
-from .matcher import JobMatcher
-from .models import ApplicationResult, MatchingResult
+from .matcher import JobMatcher, MatchStats
+from .metrics import NULL_METRICS, Metrics
+from .models import ApplicationResult, CandidateProfile, JobPosting, MatchingResult
 from .resume_parser import ResumeParser
 
+_END_OF_JOBS = object()
+
 
 @dataclass(slots=True)
 class AutomationReport:
     matched_jobs: Sequence[MatchingResult]
     applications: Sequence[ApplicationResult]
+    match_stats: MatchStats | None = None
+    # Snapshot of the automator's metrics registry, when one is configured.
+    metrics: dict | None = None
+
+
+@dataclass(slots=True)
+class AutomationUpdate:
+    """Incremental progress emitted by :meth:`JobSearchAutomator.run_streaming`.
+
+    ``matched_jobs`` and ``applications`` cover the latest batch only; the
+    counters are running totals for the whole run.
+    """
+
+    matched_jobs: Sequence[MatchingResult]
+    applications: Sequence[ApplicationResult]
+    jobs_processed: int
+    applications_submitted: int
+    match_stats: MatchStats = field(default_factory=MatchStats)
 
 
 class JobSearchAutomator:
@@ -28,30 +54,160 @@ class JobSearchAutomator:
         job_fetcher: JobFetcher,
         matcher: JobMatcher,
         application_service: JobApplicationService,
+        metrics: Metrics | None = None,
     ) -> None:
         self.config = config
         self.resume_parser = resume_parser
         self.job_fetcher = job_fetcher
         self.matcher = matcher
         self.application_service = application_service
+        self.metrics = metrics or NULL_METRICS
 
     def run(self) -> AutomationReport:
+        metrics = self.metrics
+        with metrics.timer("run_seconds"):
+            with metrics.timer("stage_seconds", stage="resume"):
+                profile = self._prepare()
+
+            with metrics.timer("stage_seconds", stage="fetch"):
+                jobs = list(self.job_fetcher.search())
+            metrics.increment("jobs_fetched_total", len(jobs))
+            with metrics.timer("stage_seconds", stage="match"):
+                matches = self.matcher.score_jobs(jobs)
+
+            # Finish submissions an interrupted run left pending before starting
+            # new ones; jobs it completes are then skipped by the outbox check.
+            resumed = self.application_service.drain_outbox()
+            recommended = [match.job for match in matches if match.is_recommended]
+            applications = [*resumed, *self._apply(recommended, profile)]
+
+        return AutomationReport(
+            matched_jobs=matches,
+            applications=applications,
+            match_stats=self.matcher.last_stats,
+            metrics=metrics.snapshot() if metrics.enabled else None,
+        )
+
+    def run_streaming(self, batch_size: int = 25, buffer_size: int = 2) -> Iterator[AutomationUpdate]:
+        """Run the pipeline as overlapping stages and yield one update per batch.
+
+        Fetching runs on its own thread, feeding batches of ``batch_size``
+        jobs through a queue holding at most ``buffer_size`` batches. Each
+        batch is scored (retrieval plus LLM reasoning) as it arrives and its
+        recommended jobs are handed to an application thread, with at most
+        ``buffer_size`` batches awaiting submission. Memory therefore stays
+        bounded by the buffers rather than the number of jobs, and the first
+        applications go out while later pages are still being fetched.
+        """
+
+        with self.metrics.timer("stage_seconds", stage="resume"):
+            profile = self._prepare()
+        resumed = self.application_service.drain_outbox()
+
+        batches: queue.Queue = queue.Queue(maxsize=max(1, buffer_size))
+        stop = threading.Event()
+        fetch_thread = threading.Thread(
+            target=self._fetch_batches,
+            args=(batches, stop, max(1, batch_size)),
+            name="job-search-fetch",
+            daemon=True,
+        )
+        apply_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-search-apply")
+        in_flight: deque[tuple[Sequence[MatchingResult], Future]] = deque()
+        totals = MatchStats()
+        jobs_processed = 0
+        submitted = sum(1 for application in resumed if application.applied)
+
+        def completed(matches: Sequence[MatchingResult], future: Future) -> AutomationUpdate:
+            nonlocal submitted
+            applications = future.result()
+            submitted += sum(1 for application in applications if application.applied)
+            return AutomationUpdate(
+                matched_jobs=matches,
+                applications=applications,
+                jobs_processed=jobs_processed,
+                applications_submitted=submitted,
+                match_stats=replace(totals),
+            )
+
+        if resumed:
+            # Submissions resumed from an interrupted run come first, in an
+            # update of their own.
+            yield AutomationUpdate(
+                matched_jobs=[],
+                applications=resumed,
+                jobs_processed=0,
+                applications_submitted=submitted,
+                match_stats=MatchStats(),
+            )
+        fetch_thread.start()
+        try:
+            while True:
+                batch = batches.get()
+                if batch is _END_OF_JOBS:
+                    break
+                if isinstance(batch, BaseException):
+                    raise batch
+
+                with self.metrics.timer("stage_seconds", stage="match"):
+                    matches = self.matcher.score_jobs(batch)
+                jobs_processed += len(batch)
+                stats = self.matcher.last_stats
+                totals.jobs_scored += stats.jobs_scored
+                totals.llm_calls += stats.llm_calls
+                totals.llm_calls_skipped += stats.llm_calls_skipped
+                totals.jobs_reused += stats.jobs_reused
+
+                recommended = [match.job for match in matches if match.is_recommended]
+                in_flight.append(
+                    (matches, apply_executor.submit(self._apply, recommended, profile))
+                )
+                while in_flight and (len(in_flight) >= max(1, buffer_size) or in_flight[0][1].done()):
+                    yield completed(*in_flight.popleft())
+
+            while in_flight:
+                yield completed(*in_flight.popleft())
+        finally:
+            stop.set()
+            apply_executor.shutdown(wait=True, cancel_futures=True)
+
+    def _apply(self, jobs: Sequence[JobPosting], profile: CandidateProfile) -> list[ApplicationResult]:
+        with self.metrics.timer("stage_seconds", stage="apply"):
+            return self.application_service.apply_many(jobs, profile)
+
+    def _prepare(self) -> CandidateProfile:
         resume = self.resume_parser.load(self.config.resume.path)
         profile = self.resume_parser.extract_profile(resume)
         self.matcher.prepare(
             resume,
             chunk_size=self.config.resume.chunk_size,
             overlap=self.config.resume.chunk_overlap,
+            cache_dir=self.config.resume.index_cache_dir,
         )
+        return profile
 
-        jobs = list(self.job_fetcher.search())
-        matches = self.matcher.score_jobs(jobs)
-
-        applications: list[ApplicationResult] = []
-        for match in matches:
-            if not match.is_recommended:
-                continue
-            result = self.application_service.apply_to_job(match.job, profile)
-            applications.append(result)
+    def _fetch_batches(self, batches: queue.Queue, stop: threading.Event, batch_size: int) -> None:
+        def put(item: object) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
 
-        return AutomationReport(matched_jobs=matches, applications=applications)
+        jobs: Iterable[JobPosting] = self.job_fetcher.search()
+        try:
+            iterator = iter(jobs)
+            while batch := list(islice(iterator, batch_size)):
+                self.metrics.increment("jobs_fetched_total", len(batch))
+                if not put(batch):
+                    return
+        except Exception as exc:  # surfaced to the consumer thread
+            put(exc)
+            return
+        finally:
+            close = getattr(jobs, "close", None)
+            if close is not None:
+                close()
+        put(_END_OF_JOBS)
@@ -0,0 +1,12 @@
+"""Synthetic corpora and a timing suite for the matching pipeline."""
+from .suite import BENCHMARKS, BenchmarkResult, run_suite
+from .synthetic import generate_jobs, generate_resume, write_jobs
+
+__all__ = [
+    "BENCHMARKS",
+    "BenchmarkResult",
+    "generate_jobs",
+    "generate_resume",
+    "run_suite",
+    "write_jobs",
+]
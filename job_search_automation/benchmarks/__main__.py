@@ -0,0 +1,41 @@
+"""Command line entry point: ``python -m job_search_automation.benchmarks``."""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from .suite import BENCHMARKS, dump, run_suite
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the job matching pipeline on synthetic data.")
+    parser.add_argument("--jobs", type=int, default=1000, help="Synthetic job postings per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic corpora")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark")
+    parser.add_argument(
+        "--benchmarks",
+        default=",".join(BENCHMARKS),
+        help=f"Comma-separated benchmarks to run (default: {','.join(BENCHMARKS)})",
+    )
+    parser.add_argument(
+        "--llm-latency", type=float, default=0.0, help="Seconds the fake LLM sleeps per end-to-end analysis"
+    )
+    parser.add_argument("--output", type=Path, help="Also write the JSON report to this file")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = build_argument_parser()
+    args = parser.parse_args(argv)
+    names = [name.strip() for name in args.benchmarks.split(",") if name.strip()]
+    try:
+        report = run_suite(
+            jobs=args.jobs, seed=args.seed, repeat=args.repeat, benchmarks=names, llm_latency=args.llm_latency
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(dump(report, args.output))
+
+
+if __name__ == "__main__":  # pragma: no cover - manual invocation
+    main()
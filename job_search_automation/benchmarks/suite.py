@@ -0,0 +1,227 @@
+"""Benchmarks for the retrieval, fetching and end-to-end pipeline."""
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Sequence
+
+from ..apply import JobApplicationService
+from ..automation import JobSearchAutomator
+from ..config import AutomationConfig, JobSearchConfig, LLMConfig, ResumeConfig
+from ..job_fetchers.base import StaticJobFetcher
+from ..job_fetchers.local import LocalJobFetcher, load_job_index
+from ..llm import LLMClient
+from ..matcher import JobMatcher, MatchSettings
+from ..resume_parser import ResumeParser
+from ..retriever import JobCorpus, ResumeRetriever
+from .synthetic import generate_jobs, generate_resume, write_jobs
+
+BENCHMARKS = ("index", "query", "fetch", "end_to_end")
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Timings for one benchmark, in seconds."""
+
+    name: str
+    params: dict
+    runs: list[float]
+    # Items processed per run, used to derive throughput.
+    items: int = 0
+    extra: dict = field(default_factory=dict)
+
+    @property
+    def best(self) -> float:
+        return min(self.runs)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.runs)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["best"] = self.best
+        data["median"] = self.median
+        if self.items:
+            data["items_per_second"] = self.items / self.median if self.median else None
+        return data
+
+
+class FakeLLM(LLMClient):
+    """LLM stand-in that answers instantly, or after ``latency`` seconds."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        super().__init__(LLMConfig(provider="benchmark"))
+        self.latency = latency
+
+    def generate_match_analysis(self, job_title, job_description, resume_snippets, similarity_score) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        verdict = "YES" if similarity_score >= 0.3 else "NO"
+        return f"{job_title}: synthetic review. Recommendation: {verdict}."
+
+
+class StubWebhook:
+    """In-process HTTP server accepting application submissions."""
+
+    def __init__(self) -> None:
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/apply"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def run_suite(
+    jobs: int = 1000,
+    seed: int = 0,
+    repeat: int = 3,
+    benchmarks: Sequence[str] = BENCHMARKS,
+    llm_latency: float = 0.0,
+) -> dict:
+    """Run the selected benchmarks and return a JSON-serializable report."""
+
+    unknown = set(benchmarks) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    runners: dict[str, Callable[[], BenchmarkResult]] = {
+        "index": lambda: bench_index(seed, repeat),
+        "query": lambda: bench_query(jobs, seed, repeat),
+        "fetch": lambda: bench_fetch(jobs, seed, repeat),
+        "end_to_end": lambda: bench_end_to_end(jobs, seed, repeat, llm_latency),
+    }
+    results = [runners[name]().to_dict() for name in BENCHMARKS if name in benchmarks]
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "jobs": jobs,
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def bench_index(seed: int, repeat: int, resume_words: int = 2000) -> BenchmarkResult:
+    resume = generate_resume(seed, words=resume_words)
+
+    def run() -> None:
+        ResumeRetriever().index(resume, chunk_size=200, overlap=40)
+
+    return BenchmarkResult("index", {"resume_words": resume_words}, _time(run, repeat), items=1)
+
+
+def bench_query(jobs: int, seed: int, repeat: int) -> BenchmarkResult:
+    postings = list(generate_jobs(jobs, seed=seed))
+    retriever = ResumeRetriever()
+    retriever.index(generate_resume(seed), chunk_size=200, overlap=40)
+    corpus_runs = _time(lambda: retriever.query_corpus(JobCorpus(postings)), repeat)
+    corpus = JobCorpus(postings)
+    projection_runs = _time(lambda: retriever.query_corpus(corpus), repeat)
+    return BenchmarkResult(
+        "query",
+        {"jobs": jobs},
+        _time(lambda: retriever.query_many(postings), repeat),
+        items=jobs,
+        extra={
+            "corpus_build_and_query_median": statistics.median(corpus_runs),
+            "corpus_query_median": statistics.median(projection_runs),
+        },
+    )
+
+
+def bench_fetch(jobs: int, seed: int, repeat: int) -> BenchmarkResult:
+    config = JobSearchConfig(provider="local", keywords=["python", "kafka"], location="Remote", max_results=25)
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_jobs(Path(directory) / "jobs.jsonl", jobs, seed=seed)
+        started = time.perf_counter()
+        load_job_index(path)
+        load_seconds = time.perf_counter() - started
+        fetcher = LocalJobFetcher(config, dataset_path=path)
+        runs = _time(lambda: list(fetcher.search()), repeat)
+        streaming = LocalJobFetcher(config, dataset_path=path, streaming=True)
+        streaming_runs = _time(lambda: list(streaming.search()), repeat)
+    return BenchmarkResult(
+        "fetch",
+        {"jobs": jobs, "keywords": config.keywords, "location": config.location},
+        runs,
+        extra={"index_load": load_seconds, "streaming_median": statistics.median(streaming_runs)},
+    )
+
+
+def bench_end_to_end(jobs: int, seed: int, repeat: int, llm_latency: float = 0.0) -> BenchmarkResult:
+    postings = list(generate_jobs(jobs, seed=seed))
+    webhook = StubWebhook()
+    applications = 0
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            resume_path = Path(directory) / "resume.txt"
+            resume_path.write_text(generate_resume(seed).raw_text, encoding="utf-8")
+            config = AutomationConfig(
+                resume=ResumeConfig(path=resume_path, chunk_size=200, chunk_overlap=40),
+                job_search=JobSearchConfig(provider="static", keywords=[], max_results=jobs),
+                llm=LLMConfig(provider="benchmark"),
+            )
+
+            def run() -> None:
+                nonlocal applications
+                automator = JobSearchAutomator(
+                    config=config,
+                    resume_parser=ResumeParser(),
+                    job_fetcher=StaticJobFetcher(postings),
+                    matcher=JobMatcher(ResumeRetriever(), FakeLLM(llm_latency), MatchSettings(max_concurrency=8)),
+                    application_service=JobApplicationService(application_webhook=webhook.url),
+                )
+                report = automator.run()
+                applications = sum(1 for application in report.applications if application.applied)
+                automator.application_service.close()
+
+            runs = _time(run, repeat)
+    finally:
+        webhook.close()
+    return BenchmarkResult(
+        "end_to_end",
+        {"jobs": jobs, "llm_latency": llm_latency},
+        runs,
+        items=jobs,
+        extra={"applications": applications},
+    )
+
+
+def _time(function: Callable[[], object], repeat: int) -> list[float]:
+    runs = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        function()
+        runs.append(time.perf_counter() - started)
+    return runs
+
+
+def dump(report: dict, path: Path | None = None) -> str:
+    text = json.dumps(report, indent=2)
+    if path is not None:
+        Path(path).write_text(text + "\n", encoding="utf-8")
+    return text
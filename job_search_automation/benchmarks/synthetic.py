@@ -0,0 +1,86 @@
+"""Deterministic synthetic resumes and job postings for benchmarks."""
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Iterator
+
+from ..models import JobPosting, Resume
+
+SKILLS = (
+    "python", "flask", "django", "fastapi", "aws", "gcp", "azure", "docker", "kubernetes", "terraform",
+    "spark", "kafka", "airflow", "sql", "postgresql", "redis", "react", "typescript", "java", "go",
+    "rust", "pytorch", "tensorflow", "pandas", "mlops", "etl", "graphql", "grpc", "linux", "ci",
+)
+ROLES = (
+    "Backend Engineer", "Data Engineer", "Machine Learning Engineer", "DevOps Engineer", "Full Stack Developer",
+    "Platform Engineer", "Site Reliability Engineer", "Data Scientist", "Analytics Engineer", "Software Engineer",
+)
+SENIORITY = ("Junior", "", "Senior", "Staff", "Lead")
+COMPANIES = tuple(
+    f"{prefix} {suffix}"
+    for prefix in ("Acme", "Nimbus", "Vertex", "Orbit", "Quanta", "Lumen")
+    for suffix in ("Labs", "Analytics", "Systems", "Cloud", "AI")
+)
+LOCATIONS = ("Remote - US", "Remote - EU", "New York, NY", "Austin, TX", "San Francisco, CA", "London, UK", "Berlin")
+FILLER = (
+    "design", "build", "ship", "own", "scale", "operate", "maintain", "improve", "collaborate", "mentor",
+    "services", "pipelines", "platform", "features", "teams", "customers", "reliability", "performance",
+    "experience", "required", "preferred", "production", "systems", "data", "apis", "tooling", "cloud",
+)
+
+
+def generate_jobs(count: int, seed: int = 0, description_words: int = 60) -> Iterator[JobPosting]:
+    """Yield ``count`` reproducible job postings.
+
+    Postings are generated lazily so corpora of a million jobs can be
+    streamed to disk without holding them in memory.
+    """
+
+    rng = random.Random(seed)
+    for number in range(count):
+        skills = rng.sample(SKILLS, 5)
+        words = rng.choices(FILLER + tuple(skills) * 3, k=description_words)
+        role = rng.choice(ROLES)
+        seniority = rng.choice(SENIORITY)
+        low = rng.randrange(80, 180, 5)
+        yield JobPosting(
+            title=f"{seniority} {role}".strip(),
+            company=rng.choice(COMPANIES),
+            description=f"{' '.join(words).capitalize()}. Required: {', '.join(skills)}.",
+            url=f"https://jobs.example.com/{seed}/{number}",
+            location=rng.choice(LOCATIONS),
+            salary=f"${low}k - ${low + 30}k",
+            source="synthetic",
+        )
+
+
+def generate_resume(seed: int = 0, words: int = 400) -> Resume:
+    """Return a reproducible resume of roughly ``words`` words."""
+
+    rng = random.Random(f"resume-{seed}")
+    skills = rng.sample(SKILLS, 8)
+    body = " ".join(rng.choices(FILLER + tuple(skills) * 4, k=words))
+    text = f"Summary\n{body}\nSkills\n{', '.join(skills)}"
+    return Resume(raw_text=text, sections={"summary": body, "skills": ", ".join(skills)})
+
+
+def write_jobs(path: Path, count: int, seed: int = 0) -> Path:
+    """Write ``count`` synthetic postings to ``path`` as JSON Lines."""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        for job in generate_jobs(count, seed=seed):
+            record = {
+                "title": job.title,
+                "company": job.company,
+                "description": job.description,
+                "url": job.url,
+                "location": job.location,
+                "salary": job.salary,
+                "source": job.source,
+            }
+            handle.write(json.dumps(record) + "\n")
+    return path
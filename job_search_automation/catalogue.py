@@ -0,0 +1,120 @@
+"""Persistent catalogue of scored job postings for incremental refreshes."""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Sequence
+
+from .job_fetchers.dedupe import normalize_url
+from .models import JobPosting, MatchingResult
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    scope TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    similarity REAL NOT NULL,
+    reasoning TEXT,
+    recommended INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (scope, fingerprint)
+);
+"""
+
+# Stay well below SQLite's limit on host parameters per statement.
+_LOOKUP_CHUNK = 500
+
+
+class JobCatalogue:
+    """SQLite store of matching results keyed by a stable job fingerprint.
+
+    Each row holds a posting's content hash together with the similarity and
+    LLM verdict it received. Rows are grouped by a ``scope`` string that
+    identifies the resume index and matching settings, so results are only
+    reused when both the posting and the inputs used to judge it are
+    unchanged.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    @staticmethod
+    def fingerprint(job: JobPosting) -> str:
+        """Identify a posting by its normalized URL, or by title, company and location."""
+
+        identity = normalize_url(job.url) or "\0".join((job.title, job.company, job.location or ""))
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def content_hash(job: JobPosting) -> str:
+        fields = (job.title, job.company, job.description, job.location, job.salary)
+        return hashlib.sha256(json.dumps(fields).encode("utf-8")).hexdigest()
+
+    def lookup(self, scope: str, jobs: Sequence[JobPosting]) -> list[MatchingResult | None]:
+        """Return the stored result for each job, or ``None`` if it is new or changed."""
+
+        fingerprints = [self.fingerprint(job) for job in jobs]
+        rows: dict[str, tuple] = {}
+        with self._lock:
+            for start in range(0, len(fingerprints), _LOOKUP_CHUNK):
+                chunk = fingerprints[start : start + _LOOKUP_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                for row in self._connection.execute(
+                    "SELECT fingerprint, content_hash, similarity, reasoning, recommended "
+                    f"FROM jobs WHERE scope = ? AND fingerprint IN ({placeholders})",
+                    (scope, *chunk),
+                ):
+                    rows[row[0]] = row[1:]
+
+        results: list[MatchingResult | None] = []
+        for job, fingerprint in zip(jobs, fingerprints):
+            row = rows.get(fingerprint)
+            if row is None or row[0] != self.content_hash(job):
+                results.append(None)
+                continue
+            _, similarity, reasoning, recommended = row
+            results.append(
+                MatchingResult(job=job, similarity=similarity, llm_reasoning=reasoning, is_recommended=bool(recommended))
+            )
+        return results
+
+    def store(self, scope: str, results: Sequence[MatchingResult]) -> None:
+        now = time.time()
+        rows = [
+            (
+                scope,
+                self.fingerprint(result.job),
+                self.content_hash(result.job),
+                result.similarity,
+                result.llm_reasoning,
+                int(result.is_recommended),
+                now,
+            )
+            for result in results
+        ]
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO jobs "
+                    "(scope, fingerprint, content_hash, similarity, reasoning, recommended, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
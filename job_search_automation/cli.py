@@ -2,83 +2,199 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from .apply import JobApplicationService
 from .automation import JobSearchAutomator
+from .catalogue import JobCatalogue
 from .config import AutomationConfig, JobSearchConfig, LLMConfig, ResumeConfig
-from .job_fetchers.base import StaticJobFetcher
+from .job_fetchers.base import JobFetcher, StaticJobFetcher, StreamingJobFetcher
+from .job_fetchers.composite import CompositeJobFetcher
 from .job_fetchers.serpapi import SerpApiJobFetcher
+from .job_fetchers.store import JobStoreFetcher
+from .job_fetchers.streaming import iter_json_records
 from .llm import LLMClient
-from .matcher import JobMatcher
-from .models import JobPosting
+from .matcher import JobMatcher, MatchSettings, MatchStats
+from .metrics import NULL_METRICS, Metrics
+from .models import ApplicationResult, JobPosting, MatchingResult
+from .outbox import ApplicationOutbox
+from .parallel import RESUME_SUFFIXES, BatchMatcher, find_resumes
+from .profiling import PROFILE_MODES, ProfileSession
 from .resume_parser import ResumeParser
 from .retriever import ResumeRetriever
 
 
 def build_argument_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Automate job search and applications with RAG.")
-    parser.add_argument("resume", type=Path, help="Path to the resume file (txt or pdf)")
+    parser.add_argument(
+        "resume", type=Path, help="Path to the resume file (txt or pdf), or a directory of resumes with --batch"
+    )
     parser.add_argument("keywords", nargs="+", help="Keywords to search for")
     parser.add_argument("--location", help="Location filter for job search")
-    parser.add_argument("--provider", default="serpapi", help="Job provider (serpapi or static)")
+    parser.add_argument("--provider", default="serpapi", help="Job provider (serpapi, static or store); separate several with commas to query them concurrently")
     parser.add_argument("--max-results", type=int, default=20)
+    parser.add_argument(
+        "--provider-cache", type=Path, help="Directory for caching job provider responses for an hour"
+    )
     parser.add_argument("--webhook", help="Webhook URL to submit applications to")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Overlap fetching, matching and applying, printing results batch by batch",
+    )
+    parser.add_argument("--stream-batch-size", type=int, default=25)
+    parser.add_argument(
+        "--catalogue", type=Path, help="SQLite file of scored jobs; unchanged postings are not rescored"
+    )
+    parser.add_argument("--outbox", type=Path, help="SQLite file recording submitted applications across runs")
     parser.add_argument("--llm-model", default="gpt-4o-mini")
     parser.add_argument("--temperature", type=float, default=0.2)
+    parser.add_argument("--llm-cache", type=Path, help="SQLite file for caching LLM responses across runs")
+    parser.add_argument("--llm-concurrency", type=int, default=1, help="Maximum number of LLM calls in flight")
+    parser.add_argument("--llm-timeout", type=float, help="Seconds to wait for each LLM call")
+    parser.add_argument(
+        "--llm-cascade",
+        action="store_true",
+        help="Only send jobs above the similarity threshold to the LLM",
+    )
+    parser.add_argument("--llm-top-n", type=int, help="With --llm-cascade, review at most this many jobs")
+    parser.add_argument("--llm-batch-size", type=int, default=1, help="Jobs analysed per LLM request")
     parser.add_argument("--resume-chunk", type=int, default=400)
     parser.add_argument("--resume-overlap", type=int, default=50)
+    parser.add_argument("--index-cache", type=Path, help="Directory for caching resume indexes between runs")
     parser.add_argument("--static-jobs", help="Path to a JSON file with static job postings for testing")
+    parser.add_argument(
+        "--stream-jobs",
+        action="store_true",
+        help="Read --static-jobs incrementally (JSON array or JSON Lines) instead of loading it up front",
+    )
+    parser.add_argument("--job-store", type=Path, help="Path to a columnar job store for the store provider")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Match every resume in the resume directory against one fetch of jobs; no applications are sent",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes: one resume each with --batch (defaults to the CPU count), "
+        "otherwise shards of jobs for retrieval (defaults to 1)",
+    )
+    parser.add_argument("--worker-batch-size", type=int, default=256, help="Jobs sent to a worker process per task")
+    parser.add_argument("--top-n", type=int, help="With --batch, report only each resume's N most similar jobs")
+    parser.add_argument(
+        "--metrics", type=Path, help="Write per-stage timings and counters to this file in Prometheus text format"
+    )
+    parser.add_argument(
+        "--profile-dir", type=Path, help="Profile the run and write the output to this directory"
+    )
+    parser.add_argument(
+        "--profile-mode",
+        choices=PROFILE_MODES,
+        default="sample",
+        help="Collapsed stacks from a sampling profiler (flame-graph ready) or cProfile statistics",
+    )
     return parser
 
 
-def load_static_jobs(path: Path) -> list[JobPosting]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    jobs: list[JobPosting] = []
-    for item in payload:
-        jobs.append(
-            JobPosting(
-                title=item["title"],
-                company=item.get("company", ""),
-                description=item.get("description", ""),
-                url=item.get("url", ""),
-                location=item.get("location"),
-                salary=item.get("salary"),
-                source=item.get("source"),
-            )
+def load_static_jobs(path: Path, streaming: bool = False) -> Iterable[JobPosting]:
+    """Load job postings from a JSON array or JSON Lines file.
+
+    With ``streaming`` the postings are returned as a lazy iterator that reads
+    the file as it is consumed; otherwise they are loaded into a list.
+    """
+
+    jobs = _iter_static_jobs(path)
+    return jobs if streaming else list(jobs)
+
+
+def _iter_static_jobs(path: Path) -> Iterator[JobPosting]:
+    for item in iter_json_records(path):
+        yield JobPosting(
+            title=item["title"],
+            company=item.get("company", ""),
+            description=item.get("description", ""),
+            url=item.get("url", ""),
+            location=item.get("location"),
+            salary=item.get("salary"),
+            source=item.get("source"),
         )
-    return jobs
 
 
 def main(argv: list[str] | None = None) -> None:
     parser = build_argument_parser()
     args = parser.parse_args(argv)
+    if args.batch:
+        unsupported = [
+            flag
+            for flag, value in (("--catalogue", args.catalogue), ("--metrics", args.metrics), ("--stream", args.stream))
+            if value
+        ]
+        if unsupported:
+            parser.error(f"{', '.join(unsupported)} cannot be combined with --batch")
+
+    if not args.profile_dir:
+        run_pipeline(args, parser)
+        return
+    with ProfileSession(args.profile_dir, "cli", mode=args.profile_mode) as session:
+        run_pipeline(args, parser)
+    print(f"Profile written to {session.path}")
+
 
-    resume_config = ResumeConfig(path=args.resume, chunk_size=args.resume_chunk, chunk_overlap=args.resume_overlap)
+def run_pipeline(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """Fetch, match and apply as configured by the parsed command line."""
+
+    resume_config = ResumeConfig(
+        path=args.resume,
+        chunk_size=args.resume_chunk,
+        chunk_overlap=args.resume_overlap,
+        index_cache_dir=args.index_cache,
+    )
     job_search_config = JobSearchConfig(
         provider=args.provider,
         keywords=args.keywords,
         location=args.location,
         max_results=args.max_results,
+        cache_dir=args.provider_cache,
     )
-    llm_config = LLMConfig(model=args.llm_model, temperature=args.temperature)
+    llm_config = LLMConfig(model=args.llm_model, temperature=args.temperature, cache_path=args.llm_cache)
     config = AutomationConfig(resume=resume_config, job_search=job_search_config, llm=llm_config)
 
+    settings = MatchSettings(
+        max_concurrency=args.llm_concurrency,
+        llm_timeout=args.llm_timeout,
+        llm_cascade=args.llm_cascade,
+        llm_top_n=args.llm_top_n,
+        llm_batch_size=args.llm_batch_size,
+        workers=args.workers if args.workers and not args.batch else 1,
+        worker_batch_size=args.worker_batch_size,
+    )
+
+    metrics = Metrics() if args.metrics else NULL_METRICS
+    providers = [name.strip() for name in args.provider.split(",") if name.strip()]
+    fetchers = [build_job_fetcher(name, args, job_search_config, parser, metrics) for name in providers]
+    job_fetcher = fetchers[0] if len(fetchers) == 1 else CompositeJobFetcher(fetchers)
+
+    if args.batch:
+        run_batch(args, llm_config, settings, job_fetcher)
+        return
+
     resume_parser = ResumeParser()
     retriever = ResumeRetriever()
-    llm_client = LLMClient(llm_config)
-    matcher = JobMatcher(retriever, llm_client)
-    application_service = JobApplicationService(application_webhook=args.webhook)
-
-    if args.provider == "serpapi":
-        job_fetcher = SerpApiJobFetcher(job_search_config)
-    elif args.provider == "static":
-        if not args.static_jobs:
-            parser.error("--static-jobs must be provided when using the static provider")
-        job_fetcher = StaticJobFetcher(load_static_jobs(Path(args.static_jobs)))
-    else:
-        parser.error(f"Unsupported job provider '{args.provider}'")
+    llm_client = LLMClient(llm_config, metrics=metrics)
+    matcher = JobMatcher(
+        retriever,
+        llm_client,
+        settings,
+        catalogue=JobCatalogue(args.catalogue) if args.catalogue else None,
+        metrics=metrics,
+    )
+    application_service = JobApplicationService(
+        application_webhook=args.webhook,
+        outbox=ApplicationOutbox(args.outbox) if args.outbox else None,
+        metrics=metrics,
+    )
 
     automator = JobSearchAutomator(
         config=config,
@@ -86,10 +202,77 @@ def main(argv: list[str] | None = None) -> None:
         job_fetcher=job_fetcher,
         matcher=matcher,
         application_service=application_service,
+        metrics=metrics,
+    )
+    if args.stream:
+        stats = None
+        for update in automator.run_streaming(batch_size=args.stream_batch_size):
+            print_matches(update.matched_jobs)
+            print_applications(update.applications)
+            print(f"Processed {update.jobs_processed} jobs, {update.applications_submitted} applications submitted.")
+            stats = update.match_stats
+        print_match_stats(stats)
+    else:
+        report = automator.run()
+        print_matches(report.matched_jobs)
+        print_match_stats(report.match_stats)
+        print_applications(report.applications)
+    if args.metrics:
+        args.metrics.write_text(metrics.render(), encoding="utf-8")
+
+
+def run_batch(
+    args: argparse.Namespace, llm_config: LLMConfig, settings: MatchSettings, job_fetcher: JobFetcher
+) -> None:
+    """Match every resume under ``args.resume`` against one fetch of jobs."""
+
+    resumes = find_resumes(args.resume)
+    if not resumes:
+        raise SystemExit(f"No resumes ({', '.join(RESUME_SUFFIXES)}) found in {args.resume}")
+
+    batch = BatchMatcher(
+        llm_config,
+        settings,
+        chunk_size=args.resume_chunk,
+        overlap=args.resume_overlap,
+        index_cache_dir=args.index_cache,
+        top_n=args.top_n,
+        workers=args.workers,
     )
-    report = automator.run()
+    for report in batch.run(resumes, job_fetcher.search()):
+        print(f"== {report.resume} ==")
+        if report.error:
+            print(f"  Skipped: {report.error}")
+            continue
+        print_matches(report.matched_jobs)
+        print_match_stats(report.match_stats)
+
+
+def build_job_fetcher(
+    name: str,
+    args: argparse.Namespace,
+    job_search_config: JobSearchConfig,
+    parser: argparse.ArgumentParser,
+    metrics: Metrics = NULL_METRICS,
+) -> JobFetcher:
+    if name == "serpapi":
+        return SerpApiJobFetcher(job_search_config, metrics=metrics)
+    if name == "static":
+        if not args.static_jobs:
+            parser.error("--static-jobs must be provided when using the static provider")
+        static_path = Path(args.static_jobs)
+        if args.stream_jobs:
+            return StreamingJobFetcher(lambda: load_static_jobs(static_path, streaming=True))
+        return StaticJobFetcher(load_static_jobs(static_path))
+    if name == "store":
+        if not args.job_store:
+            parser.error("--job-store must be provided when using the store provider")
+        return JobStoreFetcher(job_search_config, args.job_store)
+    parser.error(f"Unsupported job provider '{name}'")
 
-    for match in report.matched_jobs:
+
+def print_matches(matches: Iterable[MatchingResult]) -> None:
+    for match in matches:
         print(f"Job: {match.job.title} at {match.job.company}")
         print(f"Similarity: {match.similarity:.2f}")
         print(f"Recommended: {'Yes' if match.is_recommended else 'No'}")
@@ -97,7 +280,19 @@ def main(argv: list[str] | None = None) -> None:
             print("Reasoning:\n" + match.llm_reasoning)
         print("-" * 60)
 
-    for application in report.applications:
+
+def print_match_stats(stats: MatchStats | None) -> None:
+    if stats and stats.jobs_reused:
+        print(f"Reused catalogued results for {stats.jobs_reused} unchanged jobs.")
+    if stats and stats.llm_calls_skipped:
+        print(
+            f"LLM review skipped for {stats.llm_calls_skipped} of "
+            f"{stats.jobs_scored} jobs by the similarity cascade."
+        )
+
+
+def print_applications(applications: Iterable[ApplicationResult]) -> None:
+    for application in applications:
         status = "Submitted" if application.applied else "Skipped"
         print(f"Application {status} for {application.job.title} at {application.job.company}: {application.message}")
 
@@ -13,6 +13,7 @@ class ResumeConfig:
     path: Path
     chunk_size: int = 400
     chunk_overlap: int = 50
+    index_cache_dir: Optional[Path] = None
 
 
 @dataclass(slots=True)
@@ -24,6 +25,9 @@ class JobSearchConfig:
     location: Optional[str] = None
     max_results: int = 20
     filters: dict[str, str] = field(default_factory=dict)
+    # Directory for cached provider responses; None disables caching.
+    cache_dir: Optional[Path] = None
+    cache_ttl: float = 3600
 
 
 @dataclass(slots=True)
@@ -35,6 +39,11 @@ class LLMConfig:
     temperature: float = 0.1
     max_tokens: int = 512
     api_key_env: str = "OPENAI_API_KEY"
+    cache_path: Optional[Path] = None
+    cache_ttl: Optional[float] = 7 * 24 * 3600
+    cache_max_entries: int = 10_000
+    # Approximate prompt tokens (4 characters each) packed into one batch request.
+    batch_token_budget: int = 3000
 
 
 @dataclass(slots=True)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Callable, Iterable
 
 from ..models import JobPosting
 
@@ -23,3 +23,13 @@ class StaticJobFetcher(JobFetcher):
 
     def search(self) -> Iterable[JobPosting]:
         yield from self._jobs
+
+
+class StreamingJobFetcher(JobFetcher):
+    """Yields postings lazily from a source callable invoked on every search."""
+
+    def __init__(self, source: Callable[[], Iterable[JobPosting]]) -> None:
+        self._source = source
+
+    def search(self) -> Iterable[JobPosting]:
+        yield from self._source()
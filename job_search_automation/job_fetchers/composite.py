@@ -0,0 +1,95 @@
+"""Fetcher that fans a search out to several providers concurrently."""
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Iterable, Sequence
+
+from ..models import JobPosting
+from .base import JobFetcher
+from .dedupe import DuplicateFilter
+
+_PROVIDER_DONE = object()
+
+
+class CompositeJobFetcher(JobFetcher):
+    """Query several :class:`JobFetcher` instances in parallel and merge results.
+
+    Each provider is iterated on its own thread and postings are yielded as
+    soon as any provider produces them, so total latency approaches that of
+    the slowest provider instead of the sum. Repeated postings are dropped
+    using :class:`DuplicateFilter`. A provider that raises is skipped and its
+    exception kept in ``errors``; the search only fails if every provider
+    fails.
+    """
+
+    def __init__(
+        self,
+        fetchers: Sequence[JobFetcher],
+        deduplicate: bool = True,
+        max_distance: int = 3,
+        buffer_size: int = 256,
+    ) -> None:
+        if not fetchers:
+            raise ValueError("CompositeJobFetcher requires at least one fetcher")
+        self.fetchers = list(fetchers)
+        self.deduplicate = deduplicate
+        self.max_distance = max_distance
+        self.buffer_size = buffer_size
+        self.errors: list[BaseException] = []
+        self.duplicates_dropped = 0
+
+    def search(self) -> Iterable[JobPosting]:
+        results: queue.Queue = queue.Queue(maxsize=self.buffer_size)
+        stop = threading.Event()
+        duplicates = DuplicateFilter(self.max_distance) if self.deduplicate else None
+        self.errors = []
+        self.duplicates_dropped = 0
+
+        threads = [
+            threading.Thread(
+                target=self._drain,
+                args=(fetcher, results, stop),
+                name=f"job-fetch-{type(fetcher).__name__}",
+                daemon=True,
+            )
+            for fetcher in self.fetchers
+        ]
+        for thread in threads:
+            thread.start()
+
+        remaining = len(threads)
+        try:
+            while remaining:
+                item = results.get()
+                if item is _PROVIDER_DONE:
+                    remaining -= 1
+                elif isinstance(item, BaseException):
+                    self.errors.append(item)
+                elif duplicates is not None and duplicates.is_duplicate(item):
+                    self.duplicates_dropped += 1
+                else:
+                    yield item
+        finally:
+            stop.set()
+
+        if len(self.errors) == len(self.fetchers):
+            raise self.errors[0]
+
+    def _drain(self, fetcher: JobFetcher, results: queue.Queue, stop: threading.Event) -> None:
+        def put(item: object) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            for job in fetcher.search():
+                if not put(job):
+                    return
+        except Exception as exc:  # reported by the consuming thread
+            put(exc)
+        put(_PROVIDER_DONE)
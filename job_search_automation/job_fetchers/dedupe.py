@@ -0,0 +1,101 @@
+"""Duplicate detection for job postings gathered from several providers."""
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ..models import JobPosting
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_TRACKING_PARAMS = frozenset({"gclid", "fbclid", "msclkid", "ref", "referrer", "trk", "src", "source"})
+
+SIMHASH_BITS = 64
+_BANDS = 4
+_BAND_BITS = SIMHASH_BITS // _BANDS
+
+
+def normalize_url(url: str) -> str:
+    """Canonicalize a posting URL so trivially different links compare equal.
+
+    Lowercases the scheme and host, drops ``www.``, fragments, tracking query
+    parameters and trailing slashes, and sorts the remaining parameters.
+    """
+
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(("", host, path, urlencode(query), ""))
+
+
+def simhash(text: str) -> int:
+    """Return a 64-bit SimHash of the words in ``text``.
+
+    Single words rather than shingles keep the hash stable for short
+    postings, where one added phrase would otherwise shift many features.
+    """
+
+    weights = [0] * SIMHASH_BITS
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        value = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+class DuplicateFilter:
+    """Remembers postings and flags exact or near-duplicate repeats.
+
+    Two postings are duplicates when their normalized URLs match or when the
+    SimHashes of their title, company, location and description differ in
+    at most ``max_distance`` bits. Near matches only count across providers
+    or when either posting lacks a URL: one provider listing two different
+    URLs is taken to mean two openings, such as the same role in two cities.
+    Fingerprints are bucketed by four 16-bit bands, so by the pigeonhole
+    principle any near duplicate shares at least one band and only those
+    buckets need to be compared.
+    """
+
+    def __init__(self, max_distance: int = 3) -> None:
+        if not 0 <= max_distance < _BANDS:
+            raise ValueError(f"max_distance must be between 0 and {_BANDS - 1}")
+        self.max_distance = max_distance
+        self._urls: set[str] = set()
+        # Each bucket holds (fingerprint, source, normalized URL) entries.
+        self._bands: list[dict[int, list[tuple[int, str | None, str]]]] = [{} for _ in range(_BANDS)]
+        self._lock = threading.Lock()
+
+    def is_duplicate(self, job: JobPosting) -> bool:
+        """Return ``True`` if ``job`` repeats a posting seen before, else record it."""
+
+        url = normalize_url(job.url)
+        fingerprint = simhash(f"{job.title}\n{job.company}\n{job.location or ''}\n{job.description}")
+        keys = [(fingerprint >> (band * _BAND_BITS)) & ((1 << _BAND_BITS) - 1) for band in range(_BANDS)]
+        with self._lock:
+            if url and url in self._urls:
+                return True
+            for band, key in enumerate(keys):
+                for seen, source, seen_url in self._bands[band].get(key, ()):
+                    if url and seen_url and source == job.source:
+                        continue
+                    if (seen ^ fingerprint).bit_count() <= self.max_distance:
+                        return True
+            if url:
+                self._urls.add(url)
+            for band, key in enumerate(keys):
+                self._bands[band].setdefault(key, []).append((fingerprint, job.source, url))
+            return False
@@ -0,0 +1,124 @@
+"""Inverted index over job postings for keyword and location filtering."""
+from __future__ import annotations
+
+import bisect
+import re
+from array import array
+from typing import Iterable, Iterator, Sequence
+
+from ..models import JobPosting
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class JobIndex:
+    """Posting lists over an immutable collection of job postings.
+
+    Keywords keep the substring semantics of the streaming scan and
+    :class:`JobStoreFetcher` (``"ops"`` matches "DevOps"): each keyword token
+    is resolved to the union of posting lists for every indexed term
+    containing it, found by scanning the indexed terms rather than any
+    posting text, the lists are intersected, and keywords that are not a
+    single token are verified against the candidate text only. Location
+    filters are answered from a facet index over the distinct location
+    strings.
+    """
+
+    def __init__(self, jobs: Iterable[JobPosting]) -> None:
+        self.jobs: tuple[JobPosting, ...] = tuple(jobs)
+        postings: dict[str, array] = {}
+        locations: dict[str, array] = {}
+        for job_id, job in enumerate(self.jobs):
+            for token in set(_TOKEN_PATTERN.findall(f"{job.title}\n{job.description}".lower())):
+                postings.setdefault(token, array("i")).append(job_id)
+            locations.setdefault((job.location or "").lower(), array("i")).append(job_id)
+        self._postings = postings
+        self._terms = sorted(postings)
+        self._locations = locations
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def search(
+        self,
+        keywords: Iterable[str] = (),
+        location: str | None = None,
+        max_results: int | None = None,
+    ) -> Iterator[JobPosting]:
+        """Yield jobs matching any keyword and the location, in dataset order."""
+
+        for job_id in self.match_ids(keywords, location)[:max_results]:
+            yield self.jobs[job_id]
+
+    def match_ids(self, keywords: Iterable[str] = (), location: str | None = None) -> Sequence[int]:
+        """Return the sorted IDs of jobs matching any keyword and the location."""
+
+        keywords = {keyword.lower() for keyword in keywords}
+        location = (location or "").lower()
+
+        matches: Sequence[int] | None = None
+        if keywords:
+            matches = self._keyword_ids(keywords)
+        if location:
+            location_ids = self._location_ids(location)
+            matches = location_ids if matches is None else _intersect(matches, location_ids)
+        return range(len(self.jobs)) if matches is None else matches
+
+    def _keyword_ids(self, keywords: set[str]) -> list[int]:
+        matched: set[int] = set()
+        for keyword in keywords:
+            tokens = _TOKEN_PATTERN.findall(keyword)
+            if not tokens:
+                candidates: Iterable[int] = range(len(self.jobs))
+            else:
+                candidates = self._term_ids(tokens[0])
+                for token in tokens[1:]:
+                    if not candidates:
+                        break
+                    candidates = _intersect(candidates, self._term_ids(token))
+            if tokens == [keyword]:
+                matched.update(candidates)
+                continue
+            for job_id in candidates:
+                if job_id not in matched and keyword in self._haystack(job_id):
+                    matched.add(job_id)
+        return sorted(matched)
+
+    def _term_ids(self, token: str) -> list[int]:
+        """Return the IDs of jobs with an indexed term containing ``token``."""
+
+        terms = [term for term in self._terms if token in term]
+        if len(terms) == 1:
+            return list(self._postings[terms[0]])
+        ids: set[int] = set()
+        for term in terms:
+            ids.update(self._postings[term])
+        return sorted(ids)
+
+    def _location_ids(self, location: str) -> list[int]:
+        ids: list[int] = []
+        for value, job_ids in self._locations.items():
+            if location in value:
+                ids.extend(job_ids)
+        ids.sort()
+        return ids
+
+    def _haystack(self, job_id: int) -> str:
+        job = self.jobs[job_id]
+        return f"{job.title}\n{job.description}".lower()
+
+
+def _intersect(left: Sequence[int], right: Sequence[int]) -> list[int]:
+    """Intersect two sorted posting lists."""
+
+    if len(left) > len(right):
+        left, right = right, left
+    result: list[int] = []
+    position = 0
+    for value in left:
+        position = bisect.bisect_left(right, value, lo=position)
+        if position == len(right):
+            break
+        if right[position] == value:
+            result.append(value)
+    return result
@@ -1,43 +1,94 @@
 """Local job fetcher backed by a bundled JSON dataset."""
 from __future__ import annotations
 
-import json
+import threading
 from pathlib import Path
 from typing import Iterable
 
 from ..config import JobSearchConfig
 from ..models import JobPosting
 from .base import JobFetcher
+from .index import JobIndex
+from .streaming import iter_json_records
+
+DEFAULT_DATASET_PATH = Path(__file__).resolve().parent.parent / "sample_data" / "jobs.json"
+
+_index_cache: dict[Path, tuple[tuple[int, int], JobIndex]] = {}
+_index_lock = threading.Lock()
+
+
+def load_job_index(dataset_path: Path) -> JobIndex:
+    """Return the shared :class:`JobIndex` for ``dataset_path``.
+
+    Indexes are built once per process and reused by every fetcher pointing
+    at the same file until its modification time or size changes.
+    """
+
+    path = dataset_path.resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"Local job dataset not found at {dataset_path}.")
+
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _index_lock:
+        cached = _index_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        index = JobIndex(_to_job_posting(payload) for payload in iter_json_records(path))
+        _index_cache[path] = (signature, index)
+        return index
+
+
+def _to_job_posting(payload: dict) -> JobPosting:
+    return JobPosting(
+        title=payload.get("title", ""),
+        company=payload.get("company", ""),
+        description=payload.get("description", ""),
+        url=payload.get("url", ""),
+        location=payload.get("location"),
+        salary=payload.get("salary"),
+        source="local",
+    )
 
 
 class LocalJobFetcher(JobFetcher):
-    """Load job postings from a JSON file for offline demos."""
+    """Load job postings from a JSON or JSON Lines file for offline demos.
+
+    By default the dataset is loaded into a shared :class:`JobIndex`. With
+    ``streaming=True`` the file is instead scanned record by record and
+    reading stops as soon as ``max_results`` matches have been yielded, which
+    suits one-off passes over dumps too large to hold in memory.
+    """
 
-    def __init__(self, config: JobSearchConfig, dataset_path: Path | None = None) -> None:
+    def __init__(self, config: JobSearchConfig, dataset_path: Path | None = None, streaming: bool = False) -> None:
         self.config = config
-        self.dataset_path = dataset_path or Path(__file__).resolve().parent.parent / "sample_data" / "jobs.json"
+        self.dataset_path = dataset_path or DEFAULT_DATASET_PATH
+        self.streaming = streaming
 
     def search(self) -> Iterable[JobPosting]:
+        if self.streaming:
+            yield from self._stream()
+            return
+
+        index = load_job_index(self.dataset_path)
+        yield from index.search(
+            keywords=self.config.keywords,
+            location=self.config.location,
+            max_results=self.config.max_results,
+        )
+
+    def _stream(self) -> Iterable[JobPosting]:
         if not self.dataset_path.exists():
             raise FileNotFoundError(
                 f"Local job dataset not found at {self.dataset_path}."
             )
 
-        data = json.loads(self.dataset_path.read_text(encoding="utf-8"))
         keywords = {keyword.lower() for keyword in self.config.keywords}
         location_filter = (self.config.location or "").lower()
 
         count = 0
-        for payload in data:
-            job = JobPosting(
-                title=payload.get("title", ""),
-                company=payload.get("company", ""),
-                description=payload.get("description", ""),
-                url=payload.get("url", ""),
-                location=payload.get("location"),
-                salary=payload.get("salary"),
-                source="local",
-            )
+        for payload in iter_json_records(self.dataset_path):
+            job = _to_job_posting(payload)
 
             if keywords and not self._matches_keywords(job, keywords):
                 continue
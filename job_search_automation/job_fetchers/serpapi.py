@@ -1,28 +1,57 @@
 """Implementation of a job fetcher using SerpAPI's Google Jobs engine."""
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Iterable
+from pathlib import Path
+from typing import Any, Iterable
 
 from ..config import JobSearchConfig
+from ..metrics import NULL_METRICS, Metrics
 from ..models import JobPosting
 from .base import JobFetcher
 
 try:  # pragma: no cover - optional dependency
     import requests
+    from requests.adapters import HTTPAdapter
 except Exception:  # pragma: no cover - library optional
     requests = None  # type: ignore
+    HTTPAdapter = None  # type: ignore
 
 SERPAPI_URL = "https://serpapi.com/search.json"
 
 
 class SerpApiJobFetcher(JobFetcher):
-    """Fetch job listings from SerpAPI's Google Jobs integration."""
+    """Fetch job listings from SerpAPI's Google Jobs integration.
 
-    def __init__(self, config: JobSearchConfig, api_key_env: str = "SERPAPI_API_KEY") -> None:
+    Result pages are followed through ``next_page_token`` until
+    ``max_results`` postings have been yielded, and the next page is
+    requested in the background while the current one is consumed. When
+    ``config.cache_dir`` is set, raw responses are cached on disk for
+    ``config.cache_ttl`` seconds, keyed by the query parameters without the
+    API key.
+    """
+
+    def __init__(
+        self,
+        config: JobSearchConfig,
+        api_key_env: str = "SERPAPI_API_KEY",
+        base_url: str = SERPAPI_URL,
+        timeout: float = 20,
+        metrics: Metrics | None = None,
+    ) -> None:
         self.config = config
         self.api_key_env = api_key_env
+        self.base_url = base_url
+        self.timeout = timeout
+        self.metrics = metrics or NULL_METRICS
+        self._session: Any = None
+        self._lock = threading.Lock()
 
     def search(self) -> Iterable[JobPosting]:
         api_key = os.getenv(self.api_key_env)
@@ -47,11 +76,75 @@ class SerpApiJobFetcher(JobFetcher):
                 "The 'requests' package is required to use the SerpAPI job fetcher. Install it with 'pip install requests'."
             )
 
-        response = requests.get(SERPAPI_URL, params=params, timeout=20)
+        remaining = self.config.max_results
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="serpapi-prefetch")
+        try:
+            page: Future = executor.submit(self._fetch_page, params)
+            while page is not None and remaining > 0:
+                data = page.result()
+                results = data.get("jobs_results", [])[:remaining]
+                token = data.get("serpapi_pagination", {}).get("next_page_token")
+                page = None
+                if token and results and len(results) < remaining:
+                    page = executor.submit(self._fetch_page, {**params, "next_page_token": token})
+                for result in results:
+                    remaining -= 1
+                    yield self._to_job_posting(result)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _fetch_page(self, params: dict) -> dict:
+        cache_path = self._cache_path(params)
+        if cache_path is not None:
+            try:
+                if time.time() - cache_path.stat().st_mtime < self.config.cache_ttl:
+                    data = json.loads(cache_path.read_text(encoding="utf-8"))
+                    self.metrics.increment("fetch_cache_hits_total", provider="serpapi")
+                    return data
+            except (OSError, ValueError):
+                pass
+
+        with self.metrics.timer("http_request_seconds", target="serpapi"):
+            response = self._get_session().get(self.base_url, params=params, timeout=self.timeout)
         response.raise_for_status()
         data = response.json()
-        for result in data.get("jobs_results", []):
-            yield self._to_job_posting(result)
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                temporary = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                temporary.write_text(json.dumps(data), encoding="utf-8")
+                os.replace(temporary, cache_path)
+            except OSError:
+                pass
+        return data
+
+    def _cache_path(self, params: dict) -> Path | None:
+        if self.config.cache_dir is None or self.config.cache_ttl <= 0:
+            return None
+        key = json.dumps(
+            sorted((name, str(value)) for name, value in params.items() if name != "api_key")
+        )
+        digest = hashlib.sha256(f"{self.base_url}\0{key}".encode("utf-8")).hexdigest()
+        return Path(self.config.cache_dir) / f"serpapi-{digest}.json"
+
+    def _get_session(self) -> Any:
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()  # type: ignore[union-attr]
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
 
     def _to_job_posting(self, payload: dict) -> JobPosting:
         posted_at = None
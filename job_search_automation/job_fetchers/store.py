@@ -0,0 +1,47 @@
+"""Job fetcher backed by a columnar :class:`~job_search_automation.job_store.JobStore`."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+from ..config import JobSearchConfig
+from ..job_store import JobStore, JobView
+from .base import JobFetcher
+
+
+class JobStoreFetcher(JobFetcher):
+    """Yield lightweight views over a memory-mapped job store.
+
+    Location filters are resolved against the store's location table once
+    per search, so only postings in a matching location have their text
+    decoded for keyword checks.
+    """
+
+    def __init__(self, config: JobSearchConfig, store: JobStore | Path) -> None:
+        self.config = config
+        self.store = store if isinstance(store, JobStore) else JobStore.open(store)
+
+    def search(self) -> Iterable[JobView]:
+        keywords = {keyword.lower() for keyword in self.config.keywords}
+        location_filter = (self.config.location or "").lower()
+        location_codes = None
+        if location_filter:
+            location_codes = self.store.category_codes(
+                "location", lambda value: location_filter in value.lower()
+            )
+
+        count = 0
+        for row in range(len(self.store)):
+            if location_codes is not None and self.store.code("location", row) not in location_codes:
+                continue
+
+            job = self.store[row]
+            if keywords:
+                haystack = f"{job.title}\n{job.description}".lower()
+                if not any(keyword in haystack for keyword in keywords):
+                    continue
+
+            yield job
+            count += 1
+            if count >= self.config.max_results:
+                break
@@ -0,0 +1,128 @@
+"""Incremental readers for large JSON and JSON Lines job datasets."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterator, TextIO
+
+DEFAULT_READ_SIZE = 1 << 16
+# Largest single record, in characters, buffered while looking for its end.
+DEFAULT_MAX_RECORD_SIZE = 64 << 20
+# Errors this close to the end of the buffer may come from a record cut off
+# mid-token (a partial literal, number or escape) rather than bad data.
+_TRUNCATION_WINDOW = 10
+
+_WHITESPACE = " \t\r\n"
+
+
+def iter_json_records(
+    path: Path, read_size: int = DEFAULT_READ_SIZE, max_record_size: int = DEFAULT_MAX_RECORD_SIZE
+) -> Iterator[Any]:
+    """Yield the records of a JSON array or JSON Lines file one at a time.
+
+    The format is detected from the first non-whitespace character: ``[``
+    starts a JSON array, which is decoded element by element; anything else
+    is read as JSON Lines. Only the record being decoded is buffered, up to
+    ``max_record_size`` characters, and closing the generator early stops
+    reading the file.
+    """
+
+    with Path(path).open("r", encoding="utf-8-sig") as handle:
+        first = _peek_non_whitespace(handle, read_size)
+        if first == "[":
+            yield from _iter_array(handle, read_size, max_record_size)
+        elif first:
+            yield from _iter_lines(handle)
+
+
+def _peek_non_whitespace(handle: TextIO, read_size: int) -> str:
+    while True:
+        position = handle.tell()
+        block = handle.read(read_size)
+        if not block:
+            return ""
+        stripped = block.lstrip(_WHITESPACE)
+        if stripped:
+            handle.seek(position)
+            # Skip exactly the leading whitespace so the next read starts at
+            # the first significant character.
+            handle.read(len(block) - len(stripped))
+            return stripped[0]
+
+
+def _iter_lines(handle: TextIO) -> Iterator[Any]:
+    for line_number, line in enumerate(handle, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid JSON on line {line_number} of {handle.name}: {exc.msg}") from exc
+
+
+def _iter_array(handle: TextIO, read_size: int, max_record_size: int) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    buffer = handle.read(read_size)[1:]  # drop the opening bracket
+    position = 0
+    eof = False
+    expect_value = True
+    seen_value = False
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        if position == len(buffer):
+            if eof:
+                raise ValueError(f"Unexpected end of JSON array in {handle.name}")
+            buffer, position, eof = _refill(handle, buffer, position, read_size)
+            continue
+
+        char = buffer[position]
+        if char == "]" and (not expect_value or not seen_value):
+            return
+        if char == "," and not expect_value:
+            position += 1
+            expect_value = True
+            continue
+        if not expect_value:
+            raise ValueError(f"Expected ',' or ']' in JSON array in {handle.name}")
+
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as exc:
+            # The scanner only reports an unterminated string once it reaches
+            # the end of the buffer; any other error away from the end is
+            # malformed input, and reading further would not fix it.
+            truncated = exc.msg.startswith("Unterminated string") or len(buffer) - exc.pos <= _TRUNCATION_WINDOW
+            if eof or not truncated:
+                raise ValueError(f"Invalid JSON array in {handle.name}: {exc.msg}") from exc
+            if len(buffer) - position > max_record_size:
+                raise ValueError(
+                    f"JSON record in {handle.name} exceeds {max_record_size} characters"
+                ) from exc
+            buffer, position, eof = _refill(handle, buffer, position, read_size)
+            continue
+        following = end
+        while following < len(buffer) and buffer[following] in _WHITESPACE:
+            following += 1
+        if not eof and (
+            following == len(buffer)
+            or (buffer[following] not in ",]" and len(buffer) - end <= _TRUNCATION_WINDOW)
+        ):
+            # A scalar cut off at the buffer boundary may decode as a prefix of
+            # itself ("-0" of "-0.5"), so only accept a value once a delimiter
+            # has been seen.
+            buffer, position, eof = _refill(handle, buffer, position, read_size)
+            continue
+
+        yield record
+        position = end
+        expect_value = False
+        seen_value = True
+
+
+def _refill(handle: TextIO, buffer: str, position: int, read_size: int) -> tuple[str, int, bool]:
+    # Grow at least geometrically so a record spanning many reads is only
+    # re-decoded a logarithmic number of times.
+    block = handle.read(max(read_size, len(buffer) - position))
+    return buffer[position:] + block, 0, not block
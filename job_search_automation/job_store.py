@@ -0,0 +1,306 @@
+"""Columnar, memory-mapped storage for large job corpora."""
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+import shutil
+import struct
+import sys
+import threading
+import weakref
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from .models import JobPosting
+
+STORE_FORMAT_VERSION = 2
+_STORE_MAGIC = b"JSAJOB"
+_STORE_PREAMBLE = struct.Struct("<6sHI")
+
+# Free-text fields live in one UTF-8 blob; row ``i`` field ``f`` spans
+# ``text_offsets[i * len(TEXT_FIELDS) + f]`` up to the following offset.
+TEXT_FIELDS = ("title", "company", "description", "url")
+# Low-cardinality fields are dictionary encoded, with -1 standing for None.
+CATEGORY_FIELDS = ("location", "salary", "source")
+# Posting dates are stored as UTC timestamps alongside the original UTC offset
+# in seconds; naive datetimes are stored as if in UTC and flagged with this.
+_NAIVE_OFFSET = -(2**31)
+
+# Stores reopened after unpickling, keyed by path and file identity, so every
+# view sent to a process shares one mapping there.
+_shared_stores: "weakref.WeakValueDictionary[tuple[str, tuple[int, int, int]], JobStore]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+class JobView:
+    """Read-only view of one posting in a :class:`JobStore`.
+
+    Exposes the same attributes as :class:`JobPosting` but decodes each field
+    from the store's mapping only when it is accessed.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "JobStore", row: int) -> None:
+        self._store = store
+        self._row = row
+
+    @property
+    def title(self) -> str:
+        return self._store._text(self._row, 0)
+
+    @property
+    def company(self) -> str:
+        return self._store._text(self._row, 1)
+
+    @property
+    def description(self) -> str:
+        return self._store._text(self._row, 2)
+
+    @property
+    def url(self) -> str:
+        return self._store._text(self._row, 3)
+
+    @property
+    def location(self) -> Optional[str]:
+        return self._store._category("location", self._row)
+
+    @property
+    def salary(self) -> Optional[str]:
+        return self._store._category("salary", self._row)
+
+    @property
+    def source(self) -> Optional[str]:
+        return self._store._category("source", self._row)
+
+    @property
+    def posted_at(self) -> Optional[datetime]:
+        return self._store._datetime(self._row)
+
+    def to_posting(self) -> JobPosting:
+        """Materialize the view into a standalone :class:`JobPosting`."""
+
+        return JobPosting(
+            title=self.title,
+            company=self.company,
+            description=self.description,
+            url=self.url,
+            location=self.location,
+            salary=self.salary,
+            source=self.source,
+            posted_at=self.posted_at,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, JobView):
+            return self._store is other._store and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._row))
+
+    def __repr__(self) -> str:
+        return f"JobView(row={self._row}, title={self.title!r}, company={self.company!r})"
+
+
+class JobStore:
+    """Columnar job corpus backed by a single read-only memory-mapped file.
+
+    Text fields are stored in one UTF-8 blob addressed through an offsets
+    array, categorical fields as integer codes into small string tables and
+    posting dates as UTC timestamps with their original offsets. Opening a
+    store maps the file instead of reading it, so every process serving the
+    same corpus shares one copy through the page cache.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            self._identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            self._mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, header_length = _STORE_PREAMBLE.unpack_from(self._mapping, 0)
+            if magic != _STORE_MAGIC or version != STORE_FORMAT_VERSION:
+                raise ValueError(f"{path} is not a version {STORE_FORMAT_VERSION} job store")
+            header = json.loads(self._mapping[_STORE_PREAMBLE.size : _STORE_PREAMBLE.size + header_length])
+            if header["byteorder"] != sys.byteorder:
+                raise ValueError(f"{path} was written on a machine with a different byte order")
+        except (KeyError, struct.error, json.JSONDecodeError) as exc:
+            self._mapping.close()
+            raise ValueError(f"{path} is not a valid job store") from exc
+        except ValueError:
+            self._mapping.close()
+            raise
+
+        base = _STORE_PREAMBLE.size + header_length
+        view = memoryview(self._mapping)
+
+        def column(name: str) -> memoryview:
+            offset, nbytes, typecode = header["arrays"][name]
+            return view[base + offset : base + offset + nbytes].cast(typecode)
+
+        self._count: int = header["count"]
+        self._text_offsets = column("text_offsets")
+        self._codes = {name: column(name) for name in CATEGORY_FIELDS}
+        self._posted_at = column("posted_at")
+        self._posted_offsets = column("posted_offsets")
+        self._categories: dict[str, list[str]] = header["categories"]
+        self._blob_start = base + header["blob_offset"]
+
+    @classmethod
+    def open(cls, path: Path) -> "JobStore":
+        return cls(path)
+
+    @staticmethod
+    def write(path: Path, jobs: Iterable[JobPosting]) -> int:
+        """Write ``jobs`` to a new store at ``path`` and return the row count.
+
+        Postings are consumed as a stream: text is spooled to a side file and
+        only the fixed-width columns are held in memory while writing.
+        """
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f"{os.getpid()}.{threading.get_ident()}"
+        blob_path = path.with_name(f"{path.name}.{suffix}.blob")
+        temp_path = path.with_name(f"{path.name}.{suffix}.tmp")
+
+        text_offsets = array("q", [0])
+        codes = {name: array("i") for name in CATEGORY_FIELDS}
+        tables: dict[str, dict[str, int]] = {name: {} for name in CATEGORY_FIELDS}
+        posted_at = array("d")
+        posted_offsets = array("i")
+        count = 0
+        try:
+            with blob_path.open("wb") as blob:
+                position = 0
+                for job in jobs:
+                    for name in TEXT_FIELDS:
+                        encoded = (getattr(job, name) or "").encode("utf-8")
+                        blob.write(encoded)
+                        position += len(encoded)
+                        text_offsets.append(position)
+                    for name in CATEGORY_FIELDS:
+                        value = getattr(job, name)
+                        if value is None:
+                            codes[name].append(-1)
+                        else:
+                            codes[name].append(tables[name].setdefault(value, len(tables[name])))
+                    timestamp, offset = _encode_datetime(job.posted_at)
+                    posted_at.append(timestamp)
+                    posted_offsets.append(offset)
+                    count += 1
+
+            columns = {"text_offsets": text_offsets, **codes, "posted_at": posted_at, "posted_offsets": posted_offsets}
+            layout: dict[str, list] = {}
+            offset = 0
+            for name, values in columns.items():
+                buffer = memoryview(values)
+                layout[name] = [offset, buffer.nbytes, buffer.format]
+                offset += _align(buffer.nbytes)
+            header = json.dumps(
+                {
+                    "count": count,
+                    "byteorder": sys.byteorder,
+                    "categories": {name: list(table) for name, table in tables.items()},
+                    "arrays": layout,
+                    "blob_offset": offset,
+                }
+            ).encode("utf-8")
+            header += b" " * (_align(_STORE_PREAMBLE.size + len(header)) - _STORE_PREAMBLE.size - len(header))
+
+            with temp_path.open("wb") as handle:
+                handle.write(_STORE_PREAMBLE.pack(_STORE_MAGIC, STORE_FORMAT_VERSION, len(header)))
+                handle.write(header)
+                for values in columns.values():
+                    raw = memoryview(values).cast("B")
+                    handle.write(raw)
+                    handle.write(b"\0" * (_align(raw.nbytes) - raw.nbytes))
+                with blob_path.open("rb") as blob:
+                    shutil.copyfileobj(blob, handle)
+            os.replace(temp_path, path)
+        finally:
+            blob_path.unlink(missing_ok=True)
+            temp_path.unlink(missing_ok=True)
+        return count
+
+    def __reduce__(self) -> tuple:
+        # The mapping cannot be pickled; send the path instead and let the
+        # receiving process map the same file, which shares its pages.
+        key = (str(self.path.resolve()), self._identity)
+        _shared_stores.setdefault(key, self)
+        return _reopen_store, key
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, row: int) -> JobView:
+        if row < 0:
+            row += self._count
+        if not 0 <= row < self._count:
+            raise IndexError("job store row out of range")
+        return JobView(self, row)
+
+    def __iter__(self) -> Iterator[JobView]:
+        for row in range(self._count):
+            yield JobView(self, row)
+
+    def category_codes(self, name: str, predicate: Callable[[str], bool]) -> set[int]:
+        """Return the codes of ``name`` values accepted by ``predicate``."""
+
+        return {code for code, value in enumerate(self._categories[name]) if predicate(value)}
+
+    def code(self, name: str, row: int) -> int:
+        return self._codes[name][row]
+
+    def _text(self, row: int, field: int) -> str:
+        slot = row * len(TEXT_FIELDS) + field
+        start = self._blob_start + self._text_offsets[slot]
+        end = self._blob_start + self._text_offsets[slot + 1]
+        return self._mapping[start:end].decode("utf-8")
+
+    def _datetime(self, row: int) -> Optional[datetime]:
+        timestamp = self._posted_at[row]
+        if math.isnan(timestamp):
+            return None
+        value = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        offset = self._posted_offsets[row]
+        if offset == _NAIVE_OFFSET:
+            return value.replace(tzinfo=None)
+        return value.astimezone(timezone(timedelta(seconds=offset)))
+
+    def _category(self, name: str, row: int) -> Optional[str]:
+        code = self._codes[name][row]
+        return None if code < 0 else self._categories[name][code]
+
+
+def _reopen_store(path: str, identity: tuple[int, int, int]) -> JobStore:
+    key = (path, tuple(identity))
+    store = _shared_stores.get(key)
+    if store is None:
+        store = JobStore(Path(path))
+        if store._identity != key[1]:
+            raise ValueError(f"{path} changed after the job store was shared")
+        _shared_stores[key] = store
+    return store
+
+
+def _encode_datetime(value: Optional[datetime]) -> tuple[float, int]:
+    # Naive values keep their wall-clock time rather than being read as local
+    # time, so a store means the same thing on every machine.
+    if value is None:
+        return math.nan, _NAIVE_OFFSET
+    offset = value.utcoffset()
+    if offset is None:
+        return value.replace(tzinfo=timezone.utc).timestamp(), _NAIVE_OFFSET
+    return value.timestamp(), int(offset.total_seconds())
+
+
+def _align(size: int, alignment: int = 8) -> int:
+    return (size + alignment - 1) // alignment * alignment
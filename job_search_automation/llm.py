@@ -2,21 +2,46 @@
 from __future__ import annotations
 
 import os
-from typing import Iterable
+import re
+from dataclasses import dataclass
+from typing import Iterable, Sequence
 
 from .config import LLMConfig
+from .llm_cache import LLMResponseCache
+from .metrics import NULL_METRICS, Metrics
 
 try:  # pragma: no cover - optional dependency
     import openai
 except Exception:  # pragma: no cover - library optional
     openai = None  # type: ignore
 
+_BATCH_SECTION = re.compile(r"^#+\s*Job\s+(\d+)\s*$", re.IGNORECASE | re.MULTILINE)
+_BATCH_VERDICT = re.compile(r"Recommendation:\s*(YES|NO)\b", re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class MatchRequest:
+    """Inputs for analysing a single job, as accepted by the batch API."""
+
+    job_title: str
+    job_description: str
+    resume_snippets: Sequence[str]
+    similarity_score: float
+
 
 class LLMClient:
     """Minimal client for calling an LLM provider."""
 
-    def __init__(self, config: LLMConfig) -> None:
+    def __init__(
+        self, config: LLMConfig, cache: LLMResponseCache | None = None, metrics: Metrics | None = None
+    ) -> None:
         self.config = config
+        self.metrics = metrics or NULL_METRICS
+        if cache is None and config.cache_path is not None:
+            cache = LLMResponseCache(
+                config.cache_path, ttl=config.cache_ttl, max_entries=config.cache_max_entries
+            )
+        self.cache = cache
 
     def _ensure_openai(self) -> None:
         if openai is None:
@@ -41,6 +66,7 @@ class LLMClient:
         """Use the LLM to produce a reasoning summary for the match."""
 
         if self.config.provider != "openai":
+            self.metrics.increment("llm_fallback_total")
             return self._fallback_analysis(
                 job_title=job_title,
                 job_description=job_description,
@@ -54,6 +80,7 @@ class LLMClient:
             # The OpenAI dependency is optional for local demos. Falling back to
             # a deterministic heuristic keeps the rest of the pipeline working
             # without network access or extra packages installed.
+            self.metrics.increment("llm_fallback_total")
             return self._fallback_analysis(
                 job_title=job_title,
                 job_description=job_description,
@@ -62,16 +89,148 @@ class LLMClient:
             )
 
         prompt = self._build_prompt(job_title, job_description, resume_snippets, similarity_score)
+        return self._cached_complete(prompt)
 
-        completion = openai.ChatCompletion.create(  # type: ignore[attr-defined]
-            model=self.config.model,
-            messages=[
-                {"role": "system", "content": "You are an assistant that evaluates job fit."},
-                {"role": "user", "content": prompt},
-            ],
-            max_tokens=self.config.max_tokens,
-            temperature=self.config.temperature,
+    def generate_batch_analysis(self, requests: Sequence[MatchRequest]) -> list[str]:
+        """Analyse several jobs with as few completion requests as possible.
+
+        Jobs are packed into structured multi-job prompts up to
+        ``LLMConfig.batch_token_budget``. Each response is split back into one
+        summary per job; if a response cannot be parsed, the jobs in that
+        batch are analysed with individual calls instead. Results are returned
+        in input order and cached under the same keys as single-job calls.
+        """
+
+        if self.config.provider != "openai":
+            return self._fallback_batch(requests)
+        try:
+            self._ensure_openai()
+        except RuntimeError:
+            return self._fallback_batch(requests)
+
+        prompts = [self._build_prompt(**_request_kwargs(request)) for request in requests]
+        results: list[str | None] = [None] * len(requests)
+        pending: list[int] = []
+        for index, prompt in enumerate(prompts):
+            cached = self.cache.get(self._cache_key(prompt)) if self.cache is not None else None
+            if cached is None:
+                pending.append(index)
+            else:
+                results[index] = cached
+        if self.cache is not None:
+            self.metrics.increment("llm_cache_hits_total", len(requests) - len(pending))
+            self.metrics.increment("llm_cache_misses_total", len(pending))
+
+        for batch in self._pack_batches(requests, pending):
+            analyses = None
+            if len(batch) > 1:
+                response = self._complete(
+                    self._build_batch_prompt([requests[index] for index in batch]),
+                    max_tokens=self.config.max_tokens * len(batch),
+                )
+                analyses = self._parse_batch_response(response, len(batch))
+            if analyses is None:
+                # These prompts were already looked up (and counted) above.
+                analyses = [self._complete(prompts[index]) for index in batch]
+            if self.cache is not None:
+                for index, analysis in zip(batch, analyses):
+                    self.cache.put(self._cache_key(prompts[index]), analysis)
+            for index, analysis in zip(batch, analyses):
+                results[index] = analysis
+        return results  # type: ignore[return-value]
+
+    def _fallback_batch(self, requests: Sequence[MatchRequest]) -> list[str]:
+        self.metrics.increment("llm_fallback_total", len(requests))
+        return [self._fallback_analysis(**_request_kwargs(request)) for request in requests]
+
+    def _pack_batches(self, requests: Sequence[MatchRequest], indices: Sequence[int]) -> list[list[int]]:
+        budget = self.config.batch_token_budget
+        batches: list[list[int]] = []
+        current: list[int] = []
+        used = 0
+        for index in indices:
+            cost = _estimate_tokens(self._format_batch_item(1, requests[index]))
+            if current and used + cost > budget:
+                batches.append(current)
+                current, used = [], 0
+            current.append(index)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    def _build_batch_prompt(self, requests: Sequence[MatchRequest]) -> str:
+        jobs = "\n\n".join(
+            self._format_batch_item(number, request) for number, request in enumerate(requests, start=1)
         )
+        return (
+            f"Evaluate whether the candidate is a strong fit for each of the {len(requests)} jobs below.\n\n"
+            f"{jobs}\n\n"
+            "For every job, answer in exactly this format and in the same order:\n"
+            "### Job <number>\n"
+            "Summary: <concise strengths and gaps>\n"
+            "Recommendation: YES or NO"
+        )
+
+    def _format_batch_item(self, number: int, request: MatchRequest) -> str:
+        context = "\n---\n".join(request.resume_snippets)
+        return (
+            f"### Job {number}\n"
+            f"Job Title: {request.job_title}\n"
+            f"Job Description:\n{request.job_description}\n"
+            f"Similarity score from retrieval model: {request.similarity_score:.3f}.\n"
+            "Relevant resume snippets:\n"
+            f"{context}"
+        )
+
+    def _parse_batch_response(self, response: str, expected: int) -> list[str] | None:
+        """Split a multi-job response into per-job analyses, or ``None`` if malformed."""
+
+        headers = list(_BATCH_SECTION.finditer(response))
+        if [int(match.group(1)) for match in headers] != list(range(1, expected + 1)):
+            return None
+        analyses: list[str] = []
+        for position, match in enumerate(headers):
+            end = headers[position + 1].start() if position + 1 < len(headers) else len(response)
+            section = response[match.end() : end].strip()
+            if not _BATCH_VERDICT.search(section):
+                return None
+            analyses.append(section)
+        return analyses
+
+    def _cache_key(self, prompt: str) -> str:
+        return LLMResponseCache.fingerprint(self.config.model, self.config.temperature, prompt)
+
+    def _cached_complete(self, prompt: str) -> str:
+        if self.cache is None:
+            return self._complete(prompt)
+
+        key = self._cache_key(prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.metrics.increment("llm_cache_hits_total")
+            return cached
+        self.metrics.increment("llm_cache_misses_total")
+        response = self._complete(prompt)
+        self.cache.put(key, response)
+        return response
+
+    def _complete(self, prompt: str, max_tokens: int | None = None) -> str:
+        with self.metrics.timer("llm_request_seconds", model=self.config.model):
+            completion = openai.ChatCompletion.create(  # type: ignore[attr-defined]
+                model=self.config.model,
+                messages=[
+                    {"role": "system", "content": "You are an assistant that evaluates job fit."},
+                    {"role": "user", "content": prompt},
+                ],
+                max_tokens=max_tokens or self.config.max_tokens,
+                temperature=self.config.temperature,
+            )
+        usage = completion.get("usage") or {}
+        for kind in ("prompt", "completion"):
+            tokens = usage.get(f"{kind}_tokens")
+            if tokens:
+                self.metrics.increment("llm_tokens_total", tokens, model=self.config.model, kind=kind)
         return completion["choices"][0]["message"]["content"].strip()
 
     def _build_prompt(
@@ -118,3 +277,16 @@ class LLMClient:
             f"Role: {job_title}. First job detail: {description_focus}. "
             f"Resume highlight: {snippet_preview}. {takeaway} Recommendation: {verdict}."
         )
+
+
+def _request_kwargs(request: MatchRequest) -> dict:
+    return {
+        "job_title": request.job_title,
+        "job_description": request.job_description,
+        "resume_snippets": request.resume_snippets,
+        "similarity_score": request.similarity_score,
+    }
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
@@ -0,0 +1,109 @@
+"""Persistent cache for LLM responses keyed by prompt fingerprint."""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+
+class LLMResponseCache:
+    """SQLite-backed LRU cache of LLM completions with an optional TTL.
+
+    Entries older than ``ttl`` seconds are treated as misses and removed, and
+    once the cache grows past ``max_entries`` the least recently used entries
+    are evicted. The database runs in WAL mode so several worker processes
+    can share one cache file.
+    """
+
+    def __init__(self, path: Path, ttl: float | None = None, max_entries: int = 10_000) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._size = self._count()
+
+    @staticmethod
+    def fingerprint(model: str, temperature: float, prompt: str) -> str:
+        """Return the cache key for a completion request."""
+
+        digest = hashlib.sha256()
+        for part in (model, repr(float(temperature)), prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] >= self.ttl:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._size -= 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._connection.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO responses (key, response, created_at, last_used) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET response = excluded.response, "
+                "created_at = excluded.created_at, last_used = excluded.last_used",
+                (key, response, now, now),
+            )
+            self._size += 1
+            if self._size > self.max_entries:
+                self._evict(now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def _evict(self, now: float) -> None:
+        if self.ttl is not None:
+            self._connection.execute("DELETE FROM responses WHERE created_at <= ?", (now - self.ttl,))
+        self._connection.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        # The running size is an estimate (updates and other processes skew
+        # it), so resynchronise whenever eviction actually runs.
+        self._size = self._count()
+
+    def _count(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
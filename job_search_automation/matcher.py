@@ -1,51 +1,380 @@
 """Logic for matching job postings to the candidate's resume."""
 from __future__ import annotations
 
+import hashlib
+import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Sequence
 
-from .llm import LLMClient
+from .catalogue import JobCatalogue
+from .llm import LLMClient, MatchRequest
+from .metrics import NULL_METRICS, Metrics
 from .models import JobPosting, MatchingResult, Resume
-from .retriever import ResumeRetriever
+from .retriever import JobCorpus, ResumeRetriever, RetrievedContext
 
 
 @dataclass(slots=True)
 class MatchSettings:
     similarity_threshold: float = 0.25
     top_k_snippets: int = 3
+    # Number of LLM calls allowed in flight at once; 1 keeps calls sequential.
+    max_concurrency: int = 1
+    # Seconds to wait for a single LLM call before giving up on it.
+    llm_timeout: float | None = None
+    # Only send jobs that clear the similarity threshold to the LLM.
+    llm_cascade: bool = False
+    # With the cascade enabled, cap LLM review to the N most similar jobs.
+    llm_top_n: int | None = None
+    # Jobs analysed per LLM request; values above 1 use multi-job prompts.
+    llm_batch_size: int = 1
+    # Processes used for retrieval in score_jobs; 1 keeps it in-process.
+    workers: int = 1
+    # Jobs sent to a worker process per task when workers > 1.
+    worker_batch_size: int = 256
+
+
+@dataclass(slots=True)
+class MatchStats:
+    """Counters describing the most recent :meth:`JobMatcher.score_jobs` call."""
+
+    jobs_scored: int = 0
+    llm_calls: int = 0
+    llm_calls_skipped: int = 0
+    # Jobs whose stored result was reused from the catalogue without rescoring.
+    jobs_reused: int = 0
+
+
+@dataclass(slots=True)
+class _Candidate:
+    job: JobPosting
+    contexts: Sequence[RetrievedContext]
+    similarity: float
 
 
 class JobMatcher:
     """Coordinates the retrieval and LLM reasoning to score jobs."""
 
-    def __init__(self, retriever: ResumeRetriever, llm_client: LLMClient, settings: MatchSettings | None = None) -> None:
+    def __init__(
+        self,
+        retriever: ResumeRetriever,
+        llm_client: LLMClient,
+        settings: MatchSettings | None = None,
+        catalogue: JobCatalogue | None = None,
+        metrics: Metrics | None = None,
+    ) -> None:
         self.retriever = retriever
         self.llm_client = llm_client
         self.settings = settings or MatchSettings()
+        # When set, unchanged postings reuse their stored result instead of being rescored.
+        self.catalogue = catalogue
+        self.metrics = metrics or NULL_METRICS
+        self.last_stats = MatchStats()
 
-    def prepare(self, resume: Resume, chunk_size: int, overlap: int) -> None:
-        self.retriever.index(resume, chunk_size=chunk_size, overlap=overlap)
+    def prepare(self, resume: Resume, chunk_size: int, overlap: int, cache_dir: Path | None = None) -> None:
+        self.retriever.index(resume, chunk_size=chunk_size, overlap=overlap, cache_dir=cache_dir)
 
     def score_jobs(self, jobs: Iterable[JobPosting]) -> Sequence[MatchingResult]:
-        results: list[MatchingResult] = []
-        for job in jobs:
-            contexts = self.retriever.query(job, top_k=self.settings.top_k_snippets)
-            if not contexts:
-                continue
-            similarity = max(context.score for context in contexts)
-            reasoning = self.llm_client.generate_match_analysis(
-                job_title=job.title,
-                job_description=job.description,
-                resume_snippets=[context.snippet for context in contexts],
-                similarity_score=similarity,
+        jobs = list(jobs)
+        return self._score_all(jobs, lambda positions: self._retrieve([jobs[position] for position in positions]))
+
+    def score_corpus(self, corpus: JobCorpus, job_ids: Sequence[int] | None = None) -> Sequence[MatchingResult]:
+        """Score jobs from a pre-tokenized :class:`JobCorpus`.
+
+        Behaves like :meth:`score_jobs` on ``corpus.jobs`` (or the subset
+        ``job_ids``), but retrieval projects the resume onto the stored job
+        vectors instead of vectorizing every description again.
+        """
+
+        ids = list(range(len(corpus))) if job_ids is None else list(job_ids)
+        return self._score_all(
+            [corpus.jobs[job_id] for job_id in ids],
+            lambda positions: self.retriever.query_corpus(
+                corpus, [ids[position] for position in positions], top_k=self.settings.top_k_snippets
+            ),
+        )
+
+    def top_jobs(
+        self, jobs: JobCorpus | Iterable[JobPosting], n: int, job_ids: Sequence[int] | None = None
+    ) -> Sequence[MatchingResult]:
+        """Return results for the ``n`` jobs most similar to the resume, best first.
+
+        Jobs are ranked by retrieval similarity alone, and only the selected
+        ``n`` go through LLM review, so the cost of reasoning no longer grows
+        with the size of the corpus.
+        """
+
+        return [result for batch in self.iter_top_jobs(jobs, n, job_ids, batch_size=max(1, n)) for result in batch]
+
+    def iter_top_jobs(
+        self,
+        jobs: JobCorpus | Iterable[JobPosting],
+        n: int,
+        job_ids: Sequence[int] | None = None,
+        batch_size: int = 5,
+    ) -> Iterator[Sequence[MatchingResult]]:
+        """Like :meth:`top_jobs`, but yield results ``batch_size`` jobs at a time.
+
+        Ranking happens up front; LLM review then proceeds best first, so
+        callers can show the strongest matches while the rest are reviewed.
+        """
+
+        corpus = jobs if isinstance(jobs, JobCorpus) else JobCorpus(jobs)
+        ranked = self.retriever.rank_corpus(corpus, n, job_ids=job_ids, top_k=self.settings.top_k_snippets)
+        for start in range(0, len(ranked), max(1, batch_size)):
+            batch = ranked[start : start + max(1, batch_size)]
+            yield self._score_all(
+                [corpus.jobs[job_id] for job_id, _ in batch],
+                lambda positions, batch=batch: [batch[position][1] for position in positions],
             )
-            is_recommended = similarity >= self.settings.similarity_threshold and "yes" in reasoning.lower()
-            results.append(
-                MatchingResult(
-                    job=job,
-                    similarity=similarity,
-                    llm_reasoning=reasoning,
-                    is_recommended=is_recommended,
+
+    def _retrieve(self, jobs: Sequence[JobPosting]) -> list[Sequence[RetrievedContext]]:
+        """Retrieve contexts for ``jobs``, sharded across processes when configured.
+
+        Only worth it when there is more than one batch of jobs to spread;
+        smaller sets are cheaper to score than to ship to other processes.
+        """
+
+        top_k = self.settings.top_k_snippets
+        if self.settings.workers <= 1 or len(jobs) <= self.settings.worker_batch_size:
+            return self.retriever.query_many(jobs, top_k=top_k)
+
+        # Imported here because the parallel module builds on this one.
+        from .parallel import query_in_processes
+
+        return query_in_processes(
+            self.retriever, jobs, top_k, workers=self.settings.workers, batch_size=self.settings.worker_batch_size
+        )
+
+    def _score_all(
+        self,
+        jobs: Sequence[JobPosting],
+        retrieve: Callable[[Sequence[int]], Sequence[Sequence[RetrievedContext]]],
+    ) -> Sequence[MatchingResult]:
+        """Score ``jobs`` given ``retrieve``, which returns contexts for job positions."""
+
+        if self.catalogue is None:
+            results, _ = self._score(jobs, self._timed_retrieve(retrieve, range(len(jobs))))
+            return [result for result in results if result is not None]
+
+        scope = self._catalogue_scope()
+        known = self.catalogue.lookup(scope, jobs)
+        fresh = [position for position, result in enumerate(known) if result is None]
+        scored, volatile = self._score(
+            [jobs[position] for position in fresh], self._timed_retrieve(retrieve, fresh)
+        )
+        self.catalogue.store(
+            scope,
+            [result for index, result in enumerate(scored) if result is not None and index not in volatile],
+        )
+
+        merged: list[MatchingResult] = []
+        pending = iter(scored)
+        for result in known:
+            if result is None:
+                result = next(pending)
+            if result is not None:
+                merged.append(result)
+        reused = len(jobs) - len(fresh)
+        self.last_stats.jobs_scored += reused
+        self.last_stats.jobs_reused = reused
+        self.metrics.increment("catalogue_hits_total", reused)
+        return merged
+
+    def _timed_retrieve(
+        self, retrieve: Callable[[Sequence[int]], Sequence[Sequence[RetrievedContext]]], positions: Sequence[int]
+    ) -> Sequence[Sequence[RetrievedContext]]:
+        with self.metrics.timer("stage_seconds", stage="retrieve"):
+            return retrieve(positions)
+
+    def _score(
+        self, jobs: Sequence[JobPosting], retrieved: Sequence[Sequence[RetrievedContext]]
+    ) -> tuple[list[MatchingResult | None], set[int]]:
+        """Score ``jobs`` from their retrieved contexts, aligned with the input.
+
+        Jobs without any retrieved context get ``None``. The returned set
+        holds the indices of results that depend on the rest of the batch or
+        on a transient failure and so must not be stored in the catalogue.
+        """
+
+        positions = [index for index, contexts in enumerate(retrieved) if contexts]
+        candidates = [
+            _Candidate(
+                job=jobs[index],
+                contexts=retrieved[index],
+                similarity=max(context.score for context in retrieved[index]),
+            )
+            for index in positions
+        ]
+
+        reviewed = self._select_for_review(candidates)
+        with self.metrics.timer("stage_seconds", stage="analyse"):
+            analyses = self._analyse_all([candidates[index] for index in reviewed])
+        reasonings: dict[int, str | None] = dict(zip(reviewed, analyses))
+        volatile: set[int] = set()
+        for index, candidate in enumerate(candidates):
+            if index not in reasonings:
+                reasonings[index] = self._skipped_verdict(candidate)
+                if candidate.similarity >= self.settings.similarity_threshold:
+                    volatile.add(positions[index])
+            elif reasonings[index] is None:
+                reasonings[index] = (
+                    f"LLM analysis timed out after {self.settings.llm_timeout:.1f}s. Recommendation: NO."
                 )
+                volatile.add(positions[index])
+                self.metrics.increment("llm_timeouts_total")
+        self.last_stats = MatchStats(
+            jobs_scored=len(candidates),
+            llm_calls=len(reviewed),
+            llm_calls_skipped=len(candidates) - len(reviewed),
+        )
+        self.metrics.increment("jobs_scored_total", len(candidates))
+        self.metrics.increment("llm_reviews_total", len(reviewed))
+        self.metrics.increment("llm_reviews_skipped_total", len(candidates) - len(reviewed))
+
+        results: list[MatchingResult | None] = [None] * len(jobs)
+        for index, candidate in enumerate(candidates):
+            reasoning = reasonings[index]
+            is_recommended = (
+                candidate.similarity >= self.settings.similarity_threshold and "yes" in reasoning.lower()
+            )
+            results[positions[index]] = MatchingResult(
+                job=candidate.job,
+                similarity=candidate.similarity,
+                llm_reasoning=reasoning,
+                is_recommended=is_recommended,
             )
-        return results
+        return results, volatile
+
+    def _catalogue_scope(self) -> str:
+        """Identify the inputs a stored verdict depends on besides the posting."""
+
+        config = self.llm_client.config
+        parts = (
+            self.retriever.index_key,
+            config.provider,
+            config.model,
+            config.temperature,
+            self.settings.similarity_threshold,
+            self.settings.top_k_snippets,
+            self.settings.llm_cascade,
+        )
+        return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+    def _select_for_review(self, candidates: Sequence[_Candidate]) -> list[int]:
+        """Return the indices of candidates that should be sent to the LLM.
+
+        Without the cascade every candidate is reviewed. With it, jobs below
+        the similarity threshold can never be recommended and are skipped,
+        and the rest are optionally capped to the ``llm_top_n`` most similar.
+        """
+
+        if not self.settings.llm_cascade:
+            return list(range(len(candidates)))
+
+        eligible = [
+            index
+            for index, candidate in enumerate(candidates)
+            if candidate.similarity >= self.settings.similarity_threshold
+        ]
+        top_n = self.settings.llm_top_n
+        if top_n is not None and len(eligible) > top_n:
+            eligible = sorted(eligible, key=lambda index: candidates[index].similarity, reverse=True)[:top_n]
+            eligible.sort()
+        return eligible
+
+    def _skipped_verdict(self, candidate: _Candidate) -> str:
+        if candidate.similarity < self.settings.similarity_threshold:
+            reason = f"is below the {self.settings.similarity_threshold:.2f} threshold"
+        else:
+            reason = f"ranks outside the top {self.settings.llm_top_n} candidates"
+        return (
+            f"Skipped LLM review: retrieval similarity {candidate.similarity:.3f} {reason}. "
+            "Recommendation: NO."
+        )
+
+    def _analyse_all(self, candidates: Sequence[_Candidate]) -> list[str | None]:
+        batch_size = max(1, self.settings.llm_batch_size)
+        groups = [candidates[start : start + batch_size] for start in range(0, len(candidates), batch_size)]
+        if self.settings.max_concurrency > 1 or self.settings.llm_timeout is not None:
+            analysed = self._analyse_concurrently(groups)
+        else:
+            analysed = [self._analyse(group) for group in groups]
+        return [reasoning for group in analysed for reasoning in group]
+
+    def _analyse(self, group: Sequence[_Candidate]) -> list[str]:
+        if len(group) == 1:
+            candidate = group[0]
+            return [
+                self.llm_client.generate_match_analysis(
+                    job_title=candidate.job.title,
+                    job_description=candidate.job.description,
+                    resume_snippets=[context.snippet for context in candidate.contexts],
+                    similarity_score=candidate.similarity,
+                )
+            ]
+        return self.llm_client.generate_batch_analysis(
+            [
+                MatchRequest(
+                    job_title=candidate.job.title,
+                    job_description=candidate.job.description,
+                    resume_snippets=[context.snippet for context in candidate.contexts],
+                    similarity_score=candidate.similarity,
+                )
+                for candidate in group
+            ]
+        )
+
+    def _analyse_concurrently(self, groups: Sequence[Sequence[_Candidate]]) -> list[list[str | None]]:
+        """Run LLM requests on a bounded thread pool, preserving input order.
+
+        Each request gets ``llm_timeout`` seconds from the moment it starts;
+        requests that overrun are abandoned and every job in them gets
+        ``None``, which :meth:`_score` turns into a negative verdict.
+        """
+
+        timeout = self.settings.llm_timeout
+        started: list[float | None] = [None] * len(groups)
+
+        def run(index: int) -> list[str]:
+            started[index] = time.monotonic()
+            return self._analyse(groups[index])
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, self.settings.max_concurrency), thread_name_prefix="job-matcher-llm"
+        )
+        try:
+            futures = [executor.submit(run, index) for index in range(len(groups))]
+            analysed: list[list[str | None]] = []
+            for index, future in enumerate(futures):
+                try:
+                    analysed.append(self._await(future, started, index, timeout))
+                except FutureTimeoutError:
+                    future.cancel()
+                    analysed.append([None] * len(groups[index]))
+            return analysed
+        finally:
+            # Abandoned calls may still be running; do not block on them.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _await(
+        self, future: Future, started: list[float | None], index: int, timeout: float | None
+    ) -> list[str]:
+        if timeout is None:
+            return future.result()
+
+        start = started[index]
+        deadline = (time.monotonic() if start is None else start) + timeout
+        while True:
+            try:
+                return future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                # A call still queued behind busy workers when we started
+                # waiting gets its full budget measured from its own start.
+                start = started[index]
+                if start is None or start + timeout <= time.monotonic():
+                    raise
+                deadline = start + timeout
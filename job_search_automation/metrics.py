@@ -0,0 +1,193 @@
+"""Lightweight counters and latency histograms for the pipeline.
+
+Components take an optional :class:`Metrics` registry and default to
+:data:`NULL_METRICS`, whose methods do nothing, so instrumentation costs a
+method call per event when it is disabled.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_Key = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass(slots=True)
+class _Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        running = 0
+        rows = []
+        for bound, count in zip((*map(_format_value, self.buckets), "+Inf"), self.counts):
+            running += count
+            rows.append((bound, running))
+        return rows
+
+
+class _Timer:
+    __slots__ = ("_metrics", "_name", "_labels", "_started")
+
+    def __init__(self, metrics: Metrics, name: str, labels: dict[str, Any]) -> None:
+        self._metrics = metrics
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self) -> _Timer:
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._metrics.observe(self._name, time.perf_counter() - self._started, **self._labels)
+
+
+class Metrics:
+    """Thread-safe registry of labelled counters and latency histograms.
+
+    Names follow Prometheus conventions: counters end in ``_total`` and
+    latencies in ``_seconds``. :meth:`render` produces the Prometheus text
+    exposition format and :meth:`snapshot` a JSON-friendly dictionary.
+    """
+
+    enabled = True
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, namespace: str = "job_search") -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self._counters: dict[_Key, float] = {}
+        self._histograms: dict[_Key, _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    def timer(self, name: str, **labels: Any) -> Any:
+        """Context manager observing the elapsed seconds of its block."""
+
+        return _Timer(self, name, labels)
+
+    def counter_value(self, name: str, **labels: Any) -> float:
+        with self._lock:
+            return self._counters.get(_key(name, labels), 0)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return current values keyed by ``name{label="value"}``."""
+
+        with self._lock:
+            return {
+                "counters": {_series(*key): value for key, value in sorted(self._counters.items())},
+                "histograms": {
+                    _series(*key): {"count": histogram.count, "sum": histogram.total}
+                    for key, histogram in sorted(self._histograms.items())
+                },
+            }
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+
+        prefix = f"{self.namespace}_" if self.namespace else ""
+        lines: list[str] = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(
+                (key, histogram.cumulative(), histogram.count, histogram.total)
+                for key, histogram in self._histograms.items()
+            )
+
+        declared: set[str] = set()
+        for (name, labels), value in counters:
+            if name not in declared:
+                declared.add(name)
+                lines.append(f"# TYPE {prefix}{name} counter")
+            lines.append(f"{_series(prefix + name, labels)} {_format_value(value)}")
+        for (name, labels), cumulative, count, total in histograms:
+            if name not in declared:
+                declared.add(name)
+                lines.append(f"# TYPE {prefix}{name} histogram")
+            for bound, running in cumulative:
+                lines.append(f"{_series(prefix + name + '_bucket', (*labels, ('le', bound)))} {running}")
+            lines.append(f"{_series(prefix + name + '_sum', labels)} {_format_value(total)}")
+            lines.append(f"{_series(prefix + name + '_count', labels)} {count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullTimer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _NullMetrics(Metrics):
+    """Registry that records nothing; used when instrumentation is disabled."""
+
+    enabled = False
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        return None
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        return None
+
+    def timer(self, name: str, **labels: Any) -> Any:
+        return _NULL_TIMER
+
+
+NULL_METRICS: Metrics = _NullMetrics()
+
+
+def _key(name: str, labels: dict[str, Any]) -> _Key:
+    if not labels:
+        return name, ()
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def _series(name: str, labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f'{label}="{_escape(value)}"' for label, value in labels)
+    return f"{name}{{{rendered}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -0,0 +1,184 @@
+"""Durable record of application submissions for idempotent, resumable runs."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+PENDING = "pending"
+# Claimed by a sender that has not yet recorded the outcome.
+SENDING = "sending"
+SUBMITTED = "submitted"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    key TEXT PRIMARY KEY,
+    job_url TEXT NOT NULL,
+    candidate TEXT NOT NULL,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    message TEXT,
+    updated_at REAL NOT NULL,
+    owner TEXT
+);
+CREATE INDEX IF NOT EXISTS applications_status ON applications (status);
+"""
+
+
+@dataclass(slots=True)
+class OutboxEntry:
+    """A submission recorded in the outbox."""
+
+    key: str
+    job_url: str
+    candidate: str
+    status: str
+    payload: dict
+    attempts: int
+    message: str | None
+
+
+class ApplicationOutbox:
+    """SQLite-backed outbox keyed by job URL and candidate.
+
+    A sender first claims a key with :meth:`claim`, which atomically moves
+    it to ``sending`` unless it is already submitted or claimed, so one
+    application is never sent by two threads or processes at once. The
+    outcome is then recorded as ``submitted`` or ``failed``, and a run that
+    dies part way through leaves behind exactly the work that still needs
+    doing. Each claim records its ``owner`` (host and process ID), so a
+    later run on the same host takes over claims whose process has exited;
+    any claim older than ``claim_timeout`` seconds is treated as abandoned
+    too. The database uses WAL journaling so each state change is durable on
+    commit.
+    """
+
+    def __init__(self, path: Path, claim_timeout: float = 600) -> None:
+        self.path = Path(path)
+        self.claim_timeout = claim_timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(applications)")}
+        if "owner" not in columns:
+            self._connection.execute("ALTER TABLE applications ADD COLUMN owner TEXT")
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    @staticmethod
+    def make_key(job_url: str, candidate: str) -> str:
+        return hashlib.sha256(f"{job_url}\0{candidate}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> OutboxEntry | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT key, job_url, candidate, status, payload, attempts, message "
+                "FROM applications WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return _to_entry(row) if row else None
+
+    def claim(self, key: str, job_url: str, candidate: str, payload: dict) -> bool:
+        """Atomically claim ``key`` for sending; ``False`` if submitted or claimed elsewhere."""
+
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT owner FROM applications WHERE key = ? AND status = ?", (key, SENDING)
+            ).fetchone()
+            # Matching on the dead owner keeps the takeover atomic: if another
+            # run reclaims the row first, the owner no longer matches.
+            dead_owner = row[0] if row and row[0] and not _owner_alive(row[0]) else None
+            cursor = self._connection.execute(
+                "INSERT INTO applications (key, job_url, candidate, status, payload, attempts, updated_at, owner) "
+                "VALUES (?, ?, ?, ?, ?, 1, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET status = excluded.status, payload = excluded.payload, "
+                "attempts = applications.attempts + 1, message = NULL, updated_at = excluded.updated_at, "
+                "owner = excluded.owner "
+                "WHERE applications.status IN (?, ?) OR (applications.status = ? AND "
+                "(applications.updated_at < ? OR applications.owner = ?))",
+                (
+                    key,
+                    job_url,
+                    candidate,
+                    SENDING,
+                    json.dumps(payload),
+                    now,
+                    self.owner,
+                    PENDING,
+                    FAILED,
+                    SENDING,
+                    now - self.claim_timeout,
+                    dead_owner,
+                ),
+            )
+        return cursor.rowcount == 1
+
+
+    def mark(self, key: str, status: str, message: str | None = None) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE applications SET status = ?, message = ?, updated_at = ? WHERE key = ?",
+                (status, message, time.time(), key),
+            )
+
+    def pending(self, include_failed: bool = False) -> list[OutboxEntry]:
+        """Return entries that were never confirmed as submitted, including abandoned claims."""
+
+        statuses = (PENDING, FAILED) if include_failed else (PENDING,)
+        placeholders = ", ".join("?" for _ in statuses)
+        with self._lock:
+            owners = self._connection.execute(
+                "SELECT DISTINCT owner FROM applications WHERE status = ? AND owner IS NOT NULL", (SENDING,)
+            ).fetchall()
+            dead = [owner for (owner,) in owners if not _owner_alive(owner)]
+            dead_placeholders = ", ".join("?" for _ in dead) or "NULL"
+            rows = self._connection.execute(
+                "SELECT key, job_url, candidate, status, payload, attempts, message FROM applications "
+                f"WHERE status IN ({placeholders}) OR (status = ? AND (updated_at < ? "
+                f"OR owner IN ({dead_placeholders}))) ORDER BY updated_at",
+                (*statuses, SENDING, time.time() - self.claim_timeout, *dead),
+            ).fetchall()
+        return [_to_entry(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def _owner_alive(owner: str) -> bool:
+    """Return ``False`` only for an owner known to be a finished process on this host."""
+
+    host, _, pid = owner.rpartition(":")
+    # os.kill cannot probe a process on Windows without signalling it.
+    if host != socket.gethostname() or not pid.isdigit() or os.name == "nt":
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+def _to_entry(row: tuple) -> OutboxEntry:
+    key, job_url, candidate, status, payload, attempts, message = row
+    return OutboxEntry(
+        key=key,
+        job_url=job_url,
+        candidate=candidate,
+        status=status,
+        payload=json.loads(payload),
+        attempts=attempts,
+        message=message,
+    )
@@ -0,0 +1,167 @@
+"""Process-pool helpers for CPU-bound retrieval and multi-resume matching."""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from .config import LLMConfig
+from .llm import LLMClient
+from .matcher import JobMatcher, MatchSettings, MatchStats
+from .models import JobPosting, MatchingResult
+from .resume_parser import ResumeParser, ResumeParserError
+from .retriever import JobCorpus, ResumeRetriever, RetrievedContext
+
+RESUME_SUFFIXES = (".txt", ".md", ".pdf")
+
+
+@dataclass(slots=True)
+class ResumeReport:
+    """Matching outcome for one resume in a batch run."""
+
+    resume: Path
+    matched_jobs: Sequence[MatchingResult] = ()
+    match_stats: MatchStats = field(default_factory=MatchStats)
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class _BatchContext:
+    corpus: JobCorpus
+    llm_config: LLMConfig
+    settings: MatchSettings
+    chunk_size: int
+    overlap: int
+    index_cache_dir: Path | None
+    top_n: int | None
+
+
+# Set once per worker process by the pool initializers.
+_context: _BatchContext | None = None
+_llm_client: LLMClient | None = None
+_retriever: ResumeRetriever | None = None
+
+
+def find_resumes(path: Path) -> list[Path]:
+    """Return ``path`` itself, or the resume files directly inside a directory."""
+
+    path = Path(path)
+    if not path.is_dir():
+        return [path]
+    return sorted(child for child in path.iterdir() if child.suffix.lower() in RESUME_SUFFIXES)
+
+
+class BatchMatcher:
+    """Match many resumes against the same jobs, one resume per pool task.
+
+    Job descriptions are tokenized once into a :class:`JobCorpus` that each
+    worker process receives a single time when it starts. Tasks then carry
+    only a resume path: the worker parses the resume, indexes it and
+    projects it onto the corpus, so per-resume work is independent of how
+    long the job descriptions are. Each resume keeps its own IDF weights,
+    so scores are identical to matching it on its own.
+    """
+
+    def __init__(
+        self,
+        llm_config: LLMConfig,
+        settings: MatchSettings | None = None,
+        chunk_size: int = 400,
+        overlap: int = 50,
+        index_cache_dir: Path | None = None,
+        top_n: int | None = None,
+        workers: int | None = None,
+    ) -> None:
+        self.llm_config = llm_config
+        self.settings = settings or MatchSettings()
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.index_cache_dir = index_cache_dir
+        # Report only the N most similar jobs per resume; None scores every job.
+        self.top_n = top_n
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(self, resumes: Sequence[Path], jobs: JobCorpus | Iterable[JobPosting]) -> Iterator[ResumeReport]:
+        """Yield one report per resume, in input order."""
+
+        corpus = jobs if isinstance(jobs, JobCorpus) else JobCorpus(jobs)
+        context = _BatchContext(
+            corpus=corpus,
+            llm_config=self.llm_config,
+            settings=self.settings,
+            chunk_size=self.chunk_size,
+            overlap=self.overlap,
+            index_cache_dir=self.index_cache_dir,
+            top_n=self.top_n,
+        )
+        workers = min(self.workers, len(resumes))
+        if workers <= 1:
+            _init_batch_worker(context)
+            yield from map(_match_resume, resumes)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker, initargs=(context,)) as pool:
+            yield from pool.map(_match_resume, resumes)
+
+
+def query_in_processes(
+    retriever: ResumeRetriever,
+    jobs: Sequence[JobPosting],
+    top_k: int | None,
+    workers: int,
+    batch_size: int = 256,
+) -> list[Sequence[RetrievedContext]]:
+    """Run :meth:`ResumeRetriever.query_many` over ``jobs`` on a process pool.
+
+    The indexed retriever is sent to each worker once through the pool
+    initializer; tasks then carry only ``batch_size`` jobs at a time, which
+    keeps pickling overhead small next to the scoring work. Results are
+    returned in input order.
+    """
+
+    batch_size = max(1, batch_size)
+    batches = [jobs[start : start + batch_size] for start in range(0, len(jobs), batch_size)]
+    workers = max(1, min(workers, len(batches)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_query_worker, initargs=(retriever,)) as pool:
+        return [contexts for batch in pool.map(_query_batch, batches, [top_k] * len(batches)) for contexts in batch]
+
+
+def _init_query_worker(retriever: ResumeRetriever) -> None:
+    global _retriever
+    _retriever = retriever
+
+
+def _query_batch(jobs: Sequence[JobPosting], top_k: int | None) -> list[Sequence[RetrievedContext]]:
+    if _retriever is None:
+        raise RuntimeError("Query worker was not initialized")
+    return _retriever.query_many(jobs, top_k=top_k)
+
+
+def _init_batch_worker(context: _BatchContext) -> None:
+    global _context, _llm_client
+    _context = context
+    _llm_client = LLMClient(context.llm_config)
+
+
+def _match_resume(path: Path) -> ResumeReport:
+    context = _context
+    if context is None or _llm_client is None:
+        raise RuntimeError("Batch worker was not initialized")
+    parser = ResumeParser()
+    try:
+        resume = parser.load(Path(path))
+        retriever = ResumeRetriever()
+        retriever.index(
+            resume, chunk_size=context.chunk_size, overlap=context.overlap, cache_dir=context.index_cache_dir
+        )
+    except (ResumeParserError, ValueError, OSError) as exc:
+        return ResumeReport(resume=Path(path), error=str(exc))
+
+    matcher = JobMatcher(retriever, _llm_client, context.settings)
+    if context.top_n is None:
+        matches = matcher.score_corpus(context.corpus)
+    else:
+        matches = matcher.top_jobs(context.corpus, context.top_n)
+    return ResumeReport(resume=Path(path), matched_jobs=matches, match_stats=matcher.last_stats)
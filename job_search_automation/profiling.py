@@ -0,0 +1,126 @@
+"""Opt-in profiling of single requests and CLI runs."""
+from __future__ import annotations
+
+import cProfile
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+from types import CodeType
+
+PROFILE_MODES = ("sample", "cprofile")
+
+# From Python 3.12 cProfile hooks into the process-wide sys.monitoring, so
+# only one profiler can be enabled at a time; sessions take turns.
+_cprofile_lock = threading.Lock()
+
+
+class SamplingProfiler:
+    """Periodically record one thread's call stack from a background thread.
+
+    Sampling costs the profiled thread nothing beyond sharing the GIL with
+    the sampler, so it is cheap enough to leave on for a whole request.
+    Stacks are aggregated into the collapsed format read by flame graph
+    tools such as ``flamegraph.pl`` and speedscope.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: int | None = None) -> None:
+        self.interval = interval
+        self.thread_id = thread_id
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self._labels: dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def collapsed(self) -> str:
+        """Return one ``frame;frame;frame count`` line per distinct stack, root first."""
+
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in sorted(self.samples.items()))
+
+    def _sample(self) -> None:
+        current_frames = sys._current_frames
+        while not self._stop.wait(self.interval):
+            frame = current_frames().get(self.thread_id)  # type: ignore[arg-type]
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                stack.reverse()
+                self.samples[tuple(stack)] += 1
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            path = Path(code.co_filename)
+            name = getattr(code, "co_qualname", code.co_name)
+            label = f"{path.parent.name}/{path.name}:{name}".replace(";", ",")
+            self._labels[code] = label
+        return label
+
+
+class ProfileSession:
+    """Profile the thread that enters the block and write the result on exit.
+
+    ``mode`` is ``"sample"`` for collapsed stacks from :class:`SamplingProfiler`
+    or ``"cprofile"`` for deterministic :mod:`cProfile` statistics, saved in
+    the :mod:`pstats` format. The output path is chosen up front, so callers
+    can report it before the profiled work has finished.
+
+    Only one ``cprofile`` session runs at a time; others wait for it to end
+    before starting. On Python 3.12 and later its statistics also include
+    any other threads that run while it is enabled, so use ``sample`` to
+    profile one request among many concurrent ones.
+    """
+
+    def __init__(self, directory: Path, label: str, mode: str = "sample", interval: float = 0.005) -> None:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode '{mode}'; expected one of {', '.join(PROFILE_MODES)}")
+        self.mode = mode
+        self.interval = interval
+        suffix = "folded" if mode == "sample" else "pstats"
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.path = Path(directory) / f"{label}-{stamp}-{uuid.uuid4().hex[:8]}.{suffix}"
+        self._profiler: SamplingProfiler | cProfile.Profile | None = None
+
+    def __enter__(self) -> ProfileSession:
+        if self.mode == "sample":
+            self._profiler = SamplingProfiler(self.interval)
+            self._profiler.start()
+        else:
+            _cprofile_lock.acquire()
+            try:
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+            except BaseException:
+                _cprofile_lock.release()
+                raise
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        profiler, self._profiler = self._profiler, None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(profiler, SamplingProfiler):
+            profiler.stop()
+            self.path.write_text(profiler.collapsed(), encoding="utf-8")
+        elif profiler is not None:
+            try:
+                profiler.disable()
+                profiler.dump_stats(str(self.path))
+            finally:
+                _cprofile_lock.release()
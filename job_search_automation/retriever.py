@@ -1,13 +1,25 @@
 """Simple retrieval module that powers the RAG pipeline."""
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
 import math
+import mmap
+import os
 import re
+import struct
+import sys
+import threading
+from array import array
 from collections import Counter
 from dataclasses import dataclass
-from typing import Sequence
+from itertools import groupby
+from pathlib import Path
+from typing import Iterable, Sequence
 
 from .models import JobPosting, Resume
+from .sparse import CSRMatrix
 
 
 @dataclass(slots=True)
@@ -18,39 +30,358 @@ class RetrievedContext:
     score: float
 
 
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+INDEX_FORMAT_VERSION = 1
+_INDEX_MAGIC = b"JSAIDX"
+_INDEX_PREAMBLE = struct.Struct("<6sHI")
+_INDEX_ARRAYS = ("idf", "indptr", "indices", "data", "norms")
+
+
+class JobCorpus:
+    """Job descriptions tokenized once into term-major frequency postings.
+
+    ``postings`` maps each term to parallel arrays of job IDs and in-document
+    counts, and ``max_tf`` holds the count of each job's most frequent term.
+    A resume is then scored against the whole corpus by walking only the
+    postings of its own terms, without re-tokenizing any description.
+    """
+
+    def __init__(self, jobs: Iterable[JobPosting]) -> None:
+        self.jobs = list(jobs)
+        job_ids: dict[str, array] = {}
+        counts: dict[str, array] = {}
+        self.max_tf = array("i")
+        for job_id, job in enumerate(self.jobs):
+            terms = Counter(_TOKEN_PATTERN.findall(job.description.lower()))
+            self.max_tf.append(max(terms.values(), default=0))
+            for term, count in terms.items():
+                if term not in job_ids:
+                    job_ids[term] = array("i")
+                    counts[term] = array("i")
+                job_ids[term].append(job_id)
+                counts[term].append(count)
+        self.postings: dict[str, tuple[array, array]] = {term: (job_ids[term], counts[term]) for term in job_ids}
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+
 class ResumeRetriever:
     """Retrieves the most relevant resume snippets for a job description."""
 
     def __init__(self, max_snippets: int = 3) -> None:
         self.max_snippets = max_snippets
         self._resume_chunks: list[str] = []
-        self._resume_vectors: list[dict[str, float]] | None = None
-        self._idf: dict[str, float] = {}
+        self._chunk_postings: CSRMatrix | None = None
+        self._vocabulary: dict[str, int] = {}
+        self._idf = array("d")
+        self._index_key: str | None = None
+        self._mapping: mmap.mmap | None = None
+
+    def __getstate__(self) -> dict:
+        # Memory-mapped buffers cannot be pickled, so they are copied out.
+        postings = self._chunk_postings
+        return {
+            "max_snippets": self.max_snippets,
+            "chunks": self._resume_chunks,
+            "vocabulary": self._vocabulary,
+            "idf": _copy_array("d", self._idf),
+            "postings": None
+            if postings is None
+            else CSRMatrix(
+                indptr=_copy_array("q", postings.indptr),
+                indices=_copy_array("i", postings.indices),
+                data=_copy_array("d", postings.data),
+                n_cols=postings.n_cols,
+                norms=_copy_array("d", postings.norms),
+            ),
+            "index_key": self._index_key,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.max_snippets = state["max_snippets"]
+        self._resume_chunks = state["chunks"]
+        self._vocabulary = state["vocabulary"]
+        self._idf = state["idf"]
+        self._chunk_postings = state["postings"]
+        self._index_key = state["index_key"]
+        self._mapping = None
+
+    @property
+    def index_key(self) -> str | None:
+        """Content hash identifying the currently loaded index, if any."""
+
+        return self._index_key
+
+    @staticmethod
+    def compute_index_key(resume: Resume, chunk_size: int, overlap: int) -> str:
+        """Return the cache key for indexing ``resume`` with the given chunking."""
+
+        digest = hashlib.sha256(f"{INDEX_FORMAT_VERSION}:{chunk_size}:{overlap}:".encode("utf-8"))
+        digest.update(resume.raw_text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def index(
+        self,
+        resume: Resume,
+        chunk_size: int = 400,
+        overlap: int = 50,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """Chunk the resume and build an index.
 
-    def index(self, resume: Resume, chunk_size: int = 400, overlap: int = 50) -> None:
-        """Chunk the resume and build an index."""
+        When ``cache_dir`` is provided the index is looked up there by content
+        hash first and written back after a fresh build, so resubmitting the
+        same resume skips chunking and vectorization entirely.
+        """
 
+        key = self.compute_index_key(resume, chunk_size, overlap)
+        cache_path = Path(cache_dir) / f"{key}.idx" if cache_dir else None
+        if cache_path is not None and cache_path.exists():
+            try:
+                self.load(cache_path)
+            except (OSError, ValueError):
+                pass
+            else:
+                if self._index_key == key:
+                    return
+
+        self._build(resume, chunk_size, overlap)
+        self._index_key = key
+        if cache_path is not None:
+            try:
+                self.save(cache_path)
+            except OSError:
+                # The cache is an optimization; an unwritable directory must not
+                # prevent matching from proceeding with the in-memory index.
+                pass
+
+    def save(self, path: Path) -> None:
+        """Serialize the index to ``path`` in a memory-mappable binary format.
+
+        The file holds a JSON header (chunks, vocabulary and array layout)
+        followed by the raw IDF and chunk-matrix buffers, each 8-byte aligned.
+        """
+
+        if self._chunk_postings is None:
+            raise RuntimeError("Retriever has not been indexed. Call 'index' first.")
+
+        postings = self._chunk_postings
+        buffers = {
+            "idf": self._idf,
+            "indptr": postings.indptr,
+            "indices": postings.indices,
+            "data": postings.data,
+            "norms": postings.norms,
+        }
+        layout: dict[str, list] = {}
+        offset = 0
+        for name in _INDEX_ARRAYS:
+            buffer = memoryview(buffers[name])
+            layout[name] = [offset, buffer.nbytes, buffer.format]
+            offset += _align(buffer.nbytes)
+
+        header = json.dumps(
+            {
+                "key": self._index_key,
+                "byteorder": sys.byteorder,
+                "chunks": self._resume_chunks,
+                "vocabulary": list(self._vocabulary),
+                "n_chunks": postings.n_cols,
+                "arrays": layout,
+            }
+        ).encode("utf-8")
+        header += b" " * (_align(_INDEX_PREAMBLE.size + len(header)) - _INDEX_PREAMBLE.size - len(header))
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Threads of one process may save the same index at once, so the
+        # temporary name is unique per thread as well as per process.
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with temp_path.open("wb") as handle:
+                handle.write(_INDEX_PREAMBLE.pack(_INDEX_MAGIC, INDEX_FORMAT_VERSION, len(header)))
+                handle.write(header)
+                for name in _INDEX_ARRAYS:
+                    raw = memoryview(buffers[name]).cast("B")
+                    handle.write(raw)
+                    handle.write(b"\0" * (_align(raw.nbytes) - raw.nbytes))
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def load(self, path: Path) -> None:
+        """Load an index written by :meth:`save`.
+
+        The numeric buffers are memory-mapped read-only rather than copied, so
+        several processes loading the same file share its pages.
+        """
+
+        with Path(path).open("rb") as handle:
+            mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, header_length = _INDEX_PREAMBLE.unpack_from(mapping, 0)
+            if magic != _INDEX_MAGIC or version != INDEX_FORMAT_VERSION:
+                raise ValueError(f"{path} is not a version {INDEX_FORMAT_VERSION} resume index")
+            header = json.loads(mapping[_INDEX_PREAMBLE.size : _INDEX_PREAMBLE.size + header_length])
+            if header["byteorder"] != sys.byteorder:
+                raise ValueError(f"{path} was written on a machine with a different byte order")
+
+            base = _INDEX_PREAMBLE.size + header_length
+            view = memoryview(mapping)
+            buffers = {}
+            for name in _INDEX_ARRAYS:
+                offset, nbytes, typecode = header["arrays"][name]
+                buffers[name] = view[base + offset : base + offset + nbytes].cast(typecode)
+        except (KeyError, TypeError, struct.error, json.JSONDecodeError) as exc:
+            mapping.close()
+            raise ValueError(f"{path} is not a valid resume index") from exc
+        except ValueError:
+            mapping.close()
+            raise
+
+        previous_mapping, self._mapping = self._mapping, None
+        self._resume_chunks = header["chunks"]
+        self._vocabulary = {term: term_id for term_id, term in enumerate(header["vocabulary"])}
+        self._idf = buffers["idf"]
+        self._chunk_postings = CSRMatrix(
+            indptr=buffers["indptr"],
+            indices=buffers["indices"],
+            data=buffers["data"],
+            n_cols=header["n_chunks"],
+            norms=buffers["norms"],
+        )
+        self._index_key = header["key"]
+        _close_mapping(previous_mapping)
+        self._mapping = mapping
+
+    def _build(self, resume: Resume, chunk_size: int, overlap: int) -> None:
         self._resume_chunks = self._chunk_text(resume.raw_text, chunk_size, overlap)
         if not self._resume_chunks:
             raise ValueError("Resume did not produce any chunks for retrieval")
 
         tokenized_chunks = [self._tokenize(chunk) for chunk in self._resume_chunks]
-        self._idf = self._compute_idf(tokenized_chunks)
-        self._resume_vectors = [self._tfidf(tokens, self._idf) for tokens in tokenized_chunks]
+        self._vocabulary = self._build_vocabulary(tokenized_chunks)
+        encoded_chunks = [self._encode(chunk) for chunk in self._resume_chunks]
+        self._idf = self._compute_idf([term_ids for term_ids, _ in encoded_chunks], len(self._vocabulary))
+        # Rows are stored unit-normalized and term-major so a batch of jobs can
+        # be scored against every chunk with a single sparse multiply.
+        self._chunk_postings = self._vectorize(encoded_chunks).transpose()
+        _close_mapping(self._mapping)
+        self._mapping = None
 
     def query(self, job: JobPosting, top_k: int | None = None) -> Sequence[RetrievedContext]:
         """Return the top resume snippets relevant to the job description."""
 
-        if self._resume_vectors is None:
+        return self.query_many([job], top_k=top_k)[0]
+
+    def query_many(
+        self, jobs: Iterable[JobPosting], top_k: int | None = None
+    ) -> list[Sequence[RetrievedContext]]:
+        """Return the top resume snippets for every job in ``jobs``, in order.
+
+        The job descriptions are vectorized into one CSR matrix and multiplied
+        against the indexed chunk matrix, producing the full jobs x chunks
+        cosine similarity matrix in one pass.
+        """
+
+        if self._chunk_postings is None:
             raise RuntimeError("Retriever has not been indexed. Call 'index' first.")
 
-        query_tokens = self._tokenize(job.description)
-        query_vector = self._tfidf(query_tokens, self._idf)
-        similarities = [self._cosine_similarity(query_vector, vector) for vector in self._resume_vectors]
+        job_matrix = self._vectorize(self._encode(job.description) for job in jobs)
+        similarities = job_matrix.matmul(self._chunk_postings)
+        top_k = top_k or self.max_snippets
+        return [self._rank(row, top_k) for row in similarities]
+
+    def query_corpus(
+        self, corpus: JobCorpus, job_ids: Sequence[int] | None = None, top_k: int | None = None
+    ) -> list[Sequence[RetrievedContext]]:
+        """Return the top resume snippets for corpus jobs, in ``job_ids`` order.
+
+        Produces the same scores as :meth:`query_many` over those jobs, but
+        the work is proportional to the postings of the resume's terms rather
+        than to the length of every description.
+        """
+
+        similarities = self._project(corpus, job_ids)
+        top_k = top_k or self.max_snippets
+        empty = array("d", bytes(8 * len(self._resume_chunks)))
+        return [
+            self._rank(similarities.get(job_id, empty), top_k)
+            for job_id in (range(len(corpus)) if job_ids is None else job_ids)
+        ]
+
+    def rank_corpus(
+        self, corpus: JobCorpus, n: int, job_ids: Sequence[int] | None = None, top_k: int | None = None
+    ) -> list[tuple[int, Sequence[RetrievedContext]]]:
+        """Return the ``n`` corpus jobs most similar to the resume, best first.
+
+        Jobs are ordered by their best chunk similarity, ties broken by job
+        ID, and selected with a bounded heap rather than a full sort. Jobs
+        sharing no term with the resume only fill remaining places.
+        """
+
+        similarities = self._project(corpus, job_ids)
         top_k = top_k or self.max_snippets
-        ranked = sorted(
-            zip(self._resume_chunks, similarities), key=lambda item: item[1], reverse=True
-        )[:top_k]
+        best = heapq.nlargest(n, similarities.items(), key=lambda item: (max(item[1]), -item[0]))
+        ranked = [(job_id, self._rank(row, top_k)) for job_id, row in best]
+        if len(ranked) < n:
+            empty = array("d", bytes(8 * len(self._resume_chunks)))
+            for job_id in range(len(corpus)) if job_ids is None else job_ids:
+                if len(ranked) >= n:
+                    break
+                if job_id not in similarities:
+                    ranked.append((job_id, self._rank(empty, top_k)))
+        return ranked
+
+    def _project(self, corpus: JobCorpus, job_ids: Sequence[int] | None) -> dict[int, array]:
+        """Return cosine similarities against every chunk for jobs sharing a term.
+
+        Job vectors use the same augmented TF-IDF weighting as
+        :meth:`_vectorize`, normalized by the corpus' ``max_tf`` of each job.
+        """
+
+        if self._chunk_postings is None:
+            raise RuntimeError("Retriever has not been indexed. Call 'index' first.")
+
+        allowed = None
+        if job_ids is not None:
+            allowed = bytearray(len(corpus))
+            for job_id in job_ids:
+                allowed[job_id] = 1
+
+        terms = [
+            (term_id, corpus.postings[term]) for term, term_id in self._vocabulary.items() if term in corpus.postings
+        ]
+        max_tf = corpus.max_tf
+        empty = array("d", bytes(8 * len(self._resume_chunks)))
+        similarities: dict[int, array] = {}
+        squared: dict[int, float] = {}
+        for term_id, (ids, counts) in terms:
+            idf = self._idf[term_id]
+            chunks, values = self._chunk_postings.row(term_id)
+            for job_id, count in zip(ids, counts):
+                if allowed is not None and not allowed[job_id]:
+                    continue
+                if job_id not in similarities:
+                    similarities[job_id] = array("d", empty)
+                    squared[job_id] = 0.0
+                weight = (0.5 + 0.5 * (count / max_tf[job_id])) * idf
+                squared[job_id] += weight * weight
+                row = similarities[job_id]
+                for chunk, value in zip(chunks, values):
+                    row[chunk] += weight * value
+
+        for job_id, row in similarities.items():
+            norm = math.sqrt(squared[job_id])
+            for chunk in range(len(row)):
+                row[chunk] /= norm
+        return similarities
+
+    def _rank(self, similarities: Sequence[float], top_k: int) -> list[RetrievedContext]:
+        # nlargest keeps the first of tied chunks, exactly like a stable sort.
+        ranked = heapq.nlargest(top_k, zip(self._resume_chunks, similarities), key=lambda item: item[1])
         return [RetrievedContext(snippet=text, score=float(score)) for text, score in ranked]
 
     def _chunk_text(self, text: str, chunk_size: int, overlap: int) -> list[str]:
@@ -70,36 +401,90 @@ class ResumeRetriever:
         return chunks
 
     def _tokenize(self, text: str) -> list[str]:
-        return [token for token in re.findall(r"[a-zA-Z0-9]+", text.lower()) if token]
+        return _TOKEN_PATTERN.findall(text.lower())
 
-    def _compute_idf(self, documents: list[list[str]]) -> dict[str, float]:
-        doc_count = len(documents)
-        df: Counter[str] = Counter()
+    def _build_vocabulary(self, documents: list[list[str]]) -> dict[str, int]:
+        vocabulary: dict[str, int] = {}
         for tokens in documents:
-            df.update(set(tokens))
-        return {
-            term: math.log((1 + doc_count) / (1 + freq)) + 1.0 for term, freq in df.items()
-        }
+            for token in tokens:
+                if token not in vocabulary:
+                    vocabulary[token] = len(vocabulary)
+        return vocabulary
+
+    def _encode(self, text: str) -> tuple[array, int]:
+        """Map ``text`` to vocabulary term IDs and the count of its most frequent term.
+
+        Terms that never occur in the resume have no IDF weight and can never
+        contribute to a cosine score, so they are dropped from the IDs. They
+        still count towards the maximum term frequency that augmented TF
+        normalizes against, which is found by sorting them rather than
+        counting them in a dictionary.
+        """
+
+        vocabulary = self._vocabulary
+        term_ids = array("i")
+        unknown: list[str] = []
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            term_id = vocabulary.get(token)
+            if term_id is None:
+                unknown.append(token)
+            else:
+                term_ids.append(term_id)
+        unknown.sort()
+        return term_ids, max((sum(1 for _ in run) for _, run in groupby(unknown)), default=0)
+
+    def _compute_idf(self, documents: list[array], vocabulary_size: int) -> array:
+        doc_count = len(documents)
+        df = [0] * vocabulary_size
+        for term_ids in documents:
+            for term_id in set(term_ids):
+                df[term_id] += 1
+        return array("d", (math.log((1 + doc_count) / (1 + freq)) + 1.0 for freq in df))
+
+    def _vectorize(self, documents: Iterable[tuple[array, int]]) -> CSRMatrix:
+        """Build a unit-normalized TF-IDF CSR matrix from encoded documents.
+
+        Term frequencies use augmented normalization against the most frequent
+        term of each document, whether or not it is in the vocabulary.
+        """
+
+        idf = self._idf
+        indptr = array("q", [0])
+        indices = array("i")
+        data = array("d")
+        norms = array("d")
+        for term_ids, unknown_max_tf in documents:
+            counts = Counter(term_ids)
+            if not counts:
+                indptr.append(len(indices))
+                norms.append(0.0)
+                continue
+            max_tf = max(max(counts.values()), unknown_max_tf)
+            columns = sorted(counts)
+            weights = [(0.5 + 0.5 * (counts[term_id] / max_tf)) * idf[term_id] for term_id in columns]
+            norm = math.sqrt(sum(weight * weight for weight in weights))
+            indices.extend(columns)
+            data.extend(weight / norm for weight in weights)
+            indptr.append(len(indices))
+            norms.append(1.0)
+        return CSRMatrix(indptr=indptr, indices=indices, data=data, n_cols=len(idf), norms=norms)
+
+
+def _align(size: int, alignment: int = 8) -> int:
+    return (size + alignment - 1) // alignment * alignment
+
+
+def _copy_array(typecode: str, buffer: Sequence) -> array:
+    copied = array(typecode)
+    copied.frombytes(memoryview(buffer).cast("B"))
+    return copied
+
 
-    def _tfidf(self, tokens: list[str], idf: dict[str, float]) -> dict[str, float]:
-        counts = Counter(tokens)
-        if not counts:
-            return {}
-        max_tf = max(counts.values())
-        vector: dict[str, float] = {}
-        for term, freq in counts.items():
-            weight = (0.5 + 0.5 * (freq / max_tf)) * idf.get(term, 0.0)
-            if weight:
-                vector[term] = weight
-        return vector
-
-    def _cosine_similarity(self, vec_a: dict[str, float], vec_b: dict[str, float]) -> float:
-        if not vec_a or not vec_b:
-            return 0.0
-        intersection = set(vec_a.keys()) & set(vec_b.keys())
-        numerator = sum(vec_a[token] * vec_b[token] for token in intersection)
-        denom_a = math.sqrt(sum(weight * weight for weight in vec_a.values()))
-        denom_b = math.sqrt(sum(weight * weight for weight in vec_b.values()))
-        if denom_a == 0 or denom_b == 0:
-            return 0.0
-        return numerator / (denom_a * denom_b)
+def _close_mapping(mapping: mmap.mmap | None) -> None:
+    # Buffers sliced from the mapping may still be referenced by callers, in
+    # which case it is left open for the garbage collector to reclaim.
+    if mapping is not None:
+        try:
+            mapping.close()
+        except BufferError:
+            pass
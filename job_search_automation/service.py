@@ -0,0 +1,92 @@
+"""Long-lived matching state shared across web requests."""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from .config import LLMConfig
+from .job_fetchers.index import JobIndex
+from .job_fetchers.local import DEFAULT_DATASET_PATH, load_job_index
+from .llm import LLMClient
+from .matcher import JobMatcher, MatchSettings
+from .metrics import NULL_METRICS, Metrics
+from .models import MatchingResult, Resume
+from .retriever import JobCorpus, ResumeRetriever
+
+
+class MatchingService:
+    """Match pasted resumes against a local job dataset kept warm in memory.
+
+    The service is created once per process and shared by every request
+    thread. It holds the LLM client, the dataset's :class:`JobIndex` and a
+    :class:`JobCorpus` of the same jobs, all rebuilt only when the dataset
+    file changes on disk. Each call to :meth:`match` builds its own
+    retriever and matcher, so concurrent requests never share per-resume
+    state, and only the resume is vectorized per request. Results are the
+    ``max_results`` keyword matches most similar to the resume, best first.
+    """
+
+    def __init__(
+        self,
+        dataset_path: Path | None = None,
+        llm_config: LLMConfig | None = None,
+        settings: MatchSettings | None = None,
+        index_cache_dir: Path | None = None,
+        chunk_size: int = 200,
+        overlap: int = 40,
+        max_results: int = 25,
+        max_snippets: int = 3,
+        metrics: Metrics | None = None,
+    ) -> None:
+        self.dataset_path = Path(dataset_path) if dataset_path else DEFAULT_DATASET_PATH
+        self.metrics = metrics or NULL_METRICS
+        self.llm_client = LLMClient(llm_config or LLMConfig(provider="offline"), metrics=self.metrics)
+        self.settings = settings or MatchSettings(similarity_threshold=0.2)
+        self.index_cache_dir = index_cache_dir
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.max_results = max_results
+        self.max_snippets = max_snippets
+        self._corpus: tuple[JobIndex, JobCorpus] | None = None
+        self._lock = threading.Lock()
+        # Load eagerly so the first request does not pay for parsing the dataset.
+        self.job_corpus()
+
+    def job_index(self) -> JobIndex:
+        """Return the current index, rebuilding it if the dataset changed."""
+
+        return load_job_index(self.dataset_path)
+
+    def job_corpus(self) -> tuple[JobIndex, JobCorpus]:
+        """Return the current index with a corpus whose job IDs match it."""
+
+        index = self.job_index()
+        with self._lock:
+            if self._corpus is None or self._corpus[0] is not index:
+                self._corpus = (index, JobCorpus(index.jobs))
+            return self._corpus
+
+    def match(self, resume_text: str, keywords: Sequence[str], location: str | None) -> Sequence[MatchingResult]:
+        return [result for batch in self.match_iter(resume_text, keywords, location) for result in batch]
+
+    def match_iter(
+        self, resume_text: str, keywords: Sequence[str], location: str | None, batch_size: int | None = None
+    ) -> Iterator[Sequence[MatchingResult]]:
+        """Yield match results best first, ``batch_size`` jobs at a time."""
+
+        resume = Resume(raw_text=resume_text, sections={"summary": resume_text})
+        retriever = ResumeRetriever(max_snippets=self.max_snippets)
+        with self.metrics.timer("stage_seconds", stage="resume"):
+            retriever.index(resume, chunk_size=self.chunk_size, overlap=self.overlap, cache_dir=self.index_cache_dir)
+        matcher = JobMatcher(
+            retriever=retriever, llm_client=self.llm_client, settings=self.settings, metrics=self.metrics
+        )
+
+        with self.metrics.timer("stage_seconds", stage="fetch"):
+            index, corpus = self.job_corpus()
+            job_ids = index.match_ids(keywords=list(keywords) or resume_text.split()[:8], location=location)
+        self.metrics.increment("jobs_fetched_total", len(job_ids))
+        yield from matcher.iter_top_jobs(
+            corpus, self.max_results, job_ids=job_ids, batch_size=batch_size or self.max_results
+        )
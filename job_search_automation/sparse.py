@@ -0,0 +1,126 @@
+"""Minimal compressed sparse row matrices used by the retrieval layer."""
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Sequence
+
+
+@dataclass(slots=True)
+class CSRMatrix:
+    """Sparse matrix stored in compressed sparse row (CSR) layout.
+
+    The ``indptr``/``indices``/``data`` triplet follows the SciPy convention so
+    the buffers can be handed to NumPy based tooling, while the implementation
+    itself only relies on the standard library ``array`` module.
+    """
+
+    indptr: array
+    indices: array
+    data: array
+    n_cols: int
+    norms: array
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[int, float]], n_cols: int) -> "CSRMatrix":
+        """Build a matrix from ``{column: value}`` mappings, one per row."""
+
+        indptr = array("q", [0])
+        indices = array("i")
+        data = array("d")
+        norms = array("d")
+        for row in rows:
+            squared = 0.0
+            for column in sorted(row):
+                value = row[column]
+                indices.append(column)
+                data.append(value)
+                squared += value * value
+            indptr.append(len(indices))
+            norms.append(math.sqrt(squared))
+        return cls(indptr=indptr, indices=indices, data=data, n_cols=n_cols, norms=norms)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    def row(self, index: int) -> tuple[Sequence[int], Sequence[float]]:
+        """Return the column indices and values stored for ``index``."""
+
+        start, end = self.indptr[index], self.indptr[index + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def normalized(self) -> "CSRMatrix":
+        """Return a copy with every non-empty row scaled to unit L2 norm."""
+
+        data = array("d", self.data)
+        norms = array("d", bytes(8 * self.n_rows))
+        for row_index in range(self.n_rows):
+            norm = self.norms[row_index]
+            if norm == 0:
+                continue
+            for position in range(self.indptr[row_index], self.indptr[row_index + 1]):
+                data[position] /= norm
+            norms[row_index] = 1.0
+        return CSRMatrix(
+            indptr=array("q", self.indptr),
+            indices=array("i", self.indices),
+            data=data,
+            n_cols=self.n_cols,
+            norms=norms,
+        )
+
+    def transpose(self) -> "CSRMatrix":
+        """Return the transpose, i.e. the column-major view of this matrix."""
+
+        counts = [0] * (self.n_cols + 1)
+        for column in self.indices:
+            counts[column + 1] += 1
+        for column in range(self.n_cols):
+            counts[column + 1] += counts[column]
+
+        indptr = array("q", counts)
+        indices = array("i", bytes(4 * len(self.indices)))
+        data = array("d", bytes(8 * len(self.data)))
+        cursor = counts[:-1]
+        squared = [0.0] * self.n_cols
+        for row_index in range(self.n_rows):
+            for position in range(self.indptr[row_index], self.indptr[row_index + 1]):
+                column = self.indices[position]
+                value = self.data[position]
+                target = cursor[column]
+                indices[target] = row_index
+                data[target] = value
+                cursor[column] = target + 1
+                squared[column] += value * value
+        norms = array("d", (math.sqrt(value) for value in squared))
+        return CSRMatrix(indptr=indptr, indices=indices, data=data, n_cols=self.n_rows, norms=norms)
+
+    def matmul(self, other: "CSRMatrix") -> list[array]:
+        """Return the dense product ``self @ other`` as one ``array('d')`` per row.
+
+        ``other`` must have as many rows as ``self`` has columns. Passing the
+        transpose of a matrix yields pairwise row dot products, which is how
+        cosine similarities are computed for unit-normalized rows.
+        """
+
+        if other.n_rows != self.n_cols:
+            raise ValueError(
+                f"Cannot multiply a matrix with {self.n_cols} columns by one with {other.n_rows} rows"
+            )
+
+        other_indptr = other.indptr
+        other_indices = other.indices
+        other_data = other.data
+        empty = array("d", bytes(8 * other.n_cols))
+        result: list[array] = []
+        for row_index in range(self.n_rows):
+            accumulator = array("d", empty)
+            for position in range(self.indptr[row_index], self.indptr[row_index + 1]):
+                weight = self.data[position]
+                column = self.indices[position]
+                for inner in range(other_indptr[column], other_indptr[column + 1]):
+                    accumulator[other_indices[inner]] += weight * other_data[inner]
+            result.append(accumulator)
+        return result
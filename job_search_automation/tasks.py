@@ -0,0 +1,140 @@
+"""Background execution of long-running matching work for the web app."""
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Sequence
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_FINISHED = (DONE, FAILED)
+
+
+class TaskQueueFull(RuntimeError):
+    """Raised by :meth:`TaskManager.submit` when too many tasks are unfinished."""
+
+
+@dataclass(slots=True)
+class Task:
+    """A unit of background work and the partial results it has produced."""
+
+    id: str
+    status: str = PENDING
+    results: list[Any] = field(default_factory=list)
+    error: str | None = None
+    finished_at: float | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in _FINISHED
+
+
+class TaskManager:
+    """Run result-producing work on a bounded thread pool.
+
+    Work is a callable returning an iterable of result batches; each batch is
+    appended to the task as soon as it is produced, so clients can poll or
+    stream partial results. Finished tasks are kept for ``retention`` seconds
+    and at most ``max_tasks`` tasks are remembered at once. At most
+    ``max_pending`` tasks may be queued or running; further submissions are
+    rejected with :class:`TaskQueueFull` rather than queued without bound.
+
+    Tasks live in this process only, so the web app must run as a single
+    (threaded) server process for status and event requests to find them.
+    """
+
+    def __init__(
+        self, max_workers: int = 2, retention: float = 3600, max_tasks: int = 1000, max_pending: int = 32
+    ) -> None:
+        self.retention = retention
+        self.max_tasks = max_tasks
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="match-task")
+        self._tasks: dict[str, Task] = {}
+        self._condition = threading.Condition()
+
+    def submit(self, work: Callable[[], Iterable[Sequence[Any]]]) -> Task:
+        task = Task(id=uuid.uuid4().hex)
+        with self._condition:
+            self._prune()
+            if sum(1 for existing in self._tasks.values() if not existing.finished) >= self.max_pending:
+                raise TaskQueueFull(f"{self.max_pending} match tasks are already queued or running")
+            self._tasks[task.id] = task
+        self._executor.submit(self._run, task, work)
+        return self._copy(task)
+
+    def get(self, task_id: str) -> Task | None:
+        """Return a consistent snapshot of the task, or ``None`` if unknown."""
+
+        with self._condition:
+            task = self._tasks.get(task_id)
+            return self._copy(task) if task is not None else None
+
+    def wait(self, task_id: str, seen: int, timeout: float | None = None) -> Task | None:
+        """Block until the task has more than ``seen`` results or finishes.
+
+        Returns a snapshot whose ``results`` hold only the new results, or
+        ``None`` if the task is unknown. On timeout the snapshot may be empty.
+        """
+
+        with self._condition:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+            self._condition.wait_for(lambda: len(task.results) > seen or task.finished, timeout)
+            snapshot = self._copy(task)
+            snapshot.results = snapshot.results[seen:]
+            return snapshot
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, task: Task, work: Callable[[], Iterable[Sequence[Any]]]) -> None:
+        self._update(task, status=RUNNING)
+        try:
+            for batch in work():
+                with self._condition:
+                    task.results.extend(batch)
+                    self._condition.notify_all()
+        except Exception as exc:  # reported to clients through the task
+            self._update(task, status=FAILED, error=str(exc) or type(exc).__name__, finished_at=time.time())
+        else:
+            self._update(task, status=DONE, finished_at=time.time())
+
+    def _update(self, task: Task, **changes: Any) -> None:
+        with self._condition:
+            for name, value in changes.items():
+                setattr(task, name, value)
+            self._condition.notify_all()
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention
+        for task_id in [
+            task_id
+            for task_id, task in self._tasks.items()
+            if task.finished_at is not None and task.finished_at < cutoff
+        ]:
+            del self._tasks[task_id]
+        if len(self._tasks) >= self.max_tasks:
+            finished = sorted(
+                (task for task in self._tasks.values() if task.finished_at is not None),
+                key=lambda task: task.finished_at,  # type: ignore[arg-type, return-value]
+            )
+            for task in finished[: len(self._tasks) - self.max_tasks + 1]:
+                del self._tasks[task.id]
+
+    @staticmethod
+    def _copy(task: Task) -> Task:
+        return Task(
+            id=task.id,
+            status=task.status,
+            results=list(task.results),
+            error=task.error,
+            finished_at=task.finished_at,
+        )
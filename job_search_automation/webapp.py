@@ -1,20 +1,25 @@
 """Flask web application that wraps the job matching pipeline."""
 from __future__ import annotations
 
+import json
 import os
 import textwrap
+import time
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Sequence
 
-from flask import Flask, flash, render_template, request
+from flask import Flask, Response, flash, g, jsonify, render_template, request, url_for
 
-from .config import JobSearchConfig, LLMConfig
-from .job_fetchers.local import LocalJobFetcher
-from .llm import LLMClient
-from .matcher import JobMatcher, MatchSettings
-from .models import MatchingResult, Resume
-from .retriever import ResumeRetriever
+from .metrics import NULL_METRICS, Metrics
+from .models import MatchingResult
+from .profiling import PROFILE_MODES, ProfileSession
+from .service import MatchingService
+from .tasks import TaskManager, TaskQueueFull
+
+# Seconds between keep-alive comments on idle event streams.
+SSE_HEARTBEAT = 15.0
 
 
 @dataclass(slots=True)
@@ -24,12 +29,69 @@ class FormData:
     location: str | None
 
 
-def create_app(template_folder: str | None = None) -> Flask:
-    """Create and configure the Flask application."""
+def create_app(template_folder: str | None = None, service: MatchingService | None = None) -> Flask:
+    """Create and configure the Flask application.
+
+    One :class:`MatchingService` is created per app and shared by all request
+    threads; pass ``service`` to supply a preconfigured one. Its metrics
+    registry backs the ``/metrics`` endpoint, which is enabled unless the
+    ``METRICS_ENABLED`` setting is false. When ``PROFILE_DIR`` is set, a
+    match request sent with an ``X-Profile: 1`` header or ``?profile=1`` is
+    profiled and the output file is named in its ``X-Profile-Output`` header.
+    """
 
     template_dir = template_folder or str(Path(__file__).resolve().parent / "templates")
     app = Flask(__name__, template_folder=template_dir)
     app.config.setdefault("SECRET_KEY", "dev")
+    app.config.setdefault("RESUME_INDEX_CACHE_DIR", os.environ.get("RESUME_INDEX_CACHE_DIR"))
+    app.config.setdefault("JOB_DATASET_PATH", os.environ.get("JOB_DATASET_PATH"))
+    app.config.setdefault(
+        "METRICS_ENABLED", os.environ.get("METRICS_ENABLED", "1").lower() not in ("0", "false", "no")
+    )
+    if service is None:
+        service = MatchingService(
+            dataset_path=app.config["JOB_DATASET_PATH"],
+            index_cache_dir=app.config["RESUME_INDEX_CACHE_DIR"],
+            metrics=Metrics() if app.config["METRICS_ENABLED"] else NULL_METRICS,
+        )
+    app.extensions["matching_service"] = service
+    metrics = service.metrics
+    app.extensions["metrics"] = metrics
+    app.config.setdefault("PROFILE_DIR", os.environ.get("PROFILE_DIR"))
+    app.config.setdefault("PROFILE_MODE", os.environ.get("PROFILE_MODE", "sample"))
+    if app.config["PROFILE_MODE"] not in PROFILE_MODES:
+        raise ValueError(f"PROFILE_MODE must be one of {', '.join(PROFILE_MODES)}")
+    app.config.setdefault("MATCH_WORKERS", int(os.environ.get("MATCH_WORKERS", "2")))
+    app.config.setdefault("MATCH_MAX_PENDING", int(os.environ.get("MATCH_MAX_PENDING", "32")))
+    tasks = TaskManager(max_workers=app.config["MATCH_WORKERS"], max_pending=app.config["MATCH_MAX_PENDING"])
+    app.extensions["match_tasks"] = tasks
+
+    if metrics.enabled:
+
+        @app.before_request
+        def _start_timer() -> None:
+            g.request_started = time.perf_counter()
+
+        @app.after_request
+        def _record_request(response: Response) -> Response:
+            started = g.pop("request_started", None)
+            if started is not None:
+                metrics.observe(
+                    "http_server_request_seconds",
+                    time.perf_counter() - started,
+                    endpoint=request.endpoint or "unknown",
+                    status=response.status_code,
+                )
+            return response
+
+    if app.config["PROFILE_DIR"]:
+
+        @app.after_request
+        def _report_profile(response: Response) -> Response:
+            session = g.pop("profile", None)
+            if session is not None:
+                response.headers["X-Profile-Output"] = session.path.name
+            return response
 
     @app.route("/", methods=["GET", "POST"])
     def index() -> str:
@@ -55,24 +117,127 @@ def create_app(template_folder: str | None = None) -> Flask:
         return FormData(resume_text=resume_text, keywords=keywords, location=location)
 
     def _run_matching_pipeline(form: FormData) -> Sequence[MatchingResult]:
-        resume = Resume(raw_text=form.resume_text, sections={"summary": form.resume_text})
+        with _profile("match"):
+            return service.match(form.resume_text, form.keywords, form.location)
 
-        retriever = ResumeRetriever(max_snippets=3)
-        retriever.index(resume, chunk_size=200, overlap=40)
+    def _profile(label: str) -> Any:
+        """Return a profiling session if this request asked for one, else a no-op context."""
 
-        llm_client = LLMClient(LLMConfig(provider="offline"))
-        matcher = JobMatcher(retriever=retriever, llm_client=llm_client, settings=MatchSettings(similarity_threshold=0.2))
+        directory = app.config["PROFILE_DIR"]
+        if not directory:
+            return nullcontext()
+        flag = request.headers.get("X-Profile") or request.args.get("profile")
+        if not flag or flag.lower() in ("0", "false", "no"):
+            return nullcontext()
+        g.profile = ProfileSession(Path(directory), label, mode=app.config["PROFILE_MODE"])
+        return g.profile
 
-        job_config = JobSearchConfig(
-            provider="local",
-            keywords=form.keywords or form.resume_text.split()[:8],
-            location=form.location,
-            max_results=25,
+    @app.route("/api/match", methods=["POST"])
+    def api_match() -> tuple[Response, int] | Response:
+        """Match a resume and return ranked results, or start a background task.
+
+        Accepts JSON with ``resume_text``, ``keywords`` (a list or a comma
+        separated string), ``location`` and ``async``. Asynchronous requests
+        return ``202`` with URLs for polling and for Server-Sent Events;
+        fields of the wrong type are rejected with ``400``.
+        """
+
+        payload = request.get_json(silent=True) or {}
+        if not isinstance(payload, dict):
+            return jsonify({"error": "request body must be a JSON object"}), 400
+        resume_text = payload.get("resume_text") or ""
+        if not isinstance(resume_text, str) or not resume_text.strip():
+            return jsonify({"error": "resume_text is required"}), 400
+        keywords = payload.get("keywords") or []
+        if isinstance(keywords, str):
+            keywords = keywords.split(",")
+        if not isinstance(keywords, list) or not all(isinstance(word, str) for word in keywords):
+            return jsonify({"error": "keywords must be a string or a list of strings"}), 400
+        keywords = [word.strip() for word in keywords if word.strip()]
+        location = payload.get("location") or None
+        if location is not None and not isinstance(location, str):
+            return jsonify({"error": "location must be a string"}), 400
+        run_async = _parse_flag(payload.get("async"))
+        if run_async is None:
+            return jsonify({"error": "async must be a boolean"}), 400
+
+        profile = _profile("api-match")
+        if not run_async:
+            with profile:
+                matches = service.match(resume_text, keywords, location)
+            return jsonify({"status": "done", "results": [_result_to_dict(match) for match in matches]})
+
+        def work():
+            # Entered on the task thread, so that is the thread profiled.
+            with profile:
+                yield from service.match_iter(resume_text, keywords, location, batch_size=5)
+
+        try:
+            task = tasks.submit(work)
+        except TaskQueueFull as exc:
+            response = jsonify({"error": str(exc)})
+            response.headers["Retry-After"] = "5"
+            return response, 503
+        response = jsonify(
+            {
+                "id": task.id,
+                "status": task.status,
+                "status_url": url_for("api_match_status", task_id=task.id),
+                "events_url": url_for("api_match_events", task_id=task.id),
+            }
         )
-        fetcher = LocalJobFetcher(job_config)
-        jobs = list(fetcher.search())
+        response.headers["Location"] = url_for("api_match_status", task_id=task.id)
+        return response, 202
 
-        return matcher.score_jobs(jobs)
+    @app.route("/api/match/<task_id>", methods=["GET"])
+    def api_match_status(task_id: str) -> tuple[Response, int] | Response:
+        task = tasks.get(task_id)
+        if task is None:
+            return jsonify({"error": "unknown task"}), 404
+        return jsonify(
+            {
+                "id": task.id,
+                "status": task.status,
+                "error": task.error,
+                "results": [_result_to_dict(match) for match in task.results],
+            }
+        )
+
+    @app.route("/api/match/<task_id>/events", methods=["GET"])
+    def api_match_events(task_id: str) -> tuple[Response, int] | Response:
+        """Stream a task's results as Server-Sent Events as they are produced."""
+
+        if tasks.get(task_id) is None:
+            return jsonify({"error": "unknown task"}), 404
+
+        def stream():
+            seen = 0
+            while True:
+                update = tasks.wait(task_id, seen, timeout=SSE_HEARTBEAT)
+                if update is None:
+                    return
+                if update.results:
+                    seen += len(update.results)
+                    yield _sse("results", [_result_to_dict(match) for match in update.results])
+                elif not update.finished:
+                    yield ": keep-alive\n\n"
+                if update.finished:
+                    yield _sse(update.status, {"id": update.id, "error": update.error, "total": seen})
+                    return
+
+        return Response(
+            stream(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.route("/metrics", methods=["GET"])
+    def metrics_endpoint() -> tuple[Response, int] | Response:
+        """Expose the service's metrics in the Prometheus text format."""
+
+        if not metrics.enabled:
+            return jsonify({"error": "metrics are disabled"}), 404
+        return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
 
     @app.route("/health", methods=["GET"])
     def healthcheck() -> dict[str, str]:
@@ -81,6 +246,40 @@ def create_app(template_folder: str | None = None) -> Flask:
     return app
 
 
+def _result_to_dict(match: MatchingResult) -> dict:
+    job = match.job
+    return {
+        "title": job.title,
+        "company": job.company,
+        "url": job.url,
+        "location": job.location,
+        "salary": job.salary,
+        "source": job.source,
+        "posted_at": job.posted_at.isoformat() if job.posted_at else None,
+        "similarity": match.similarity,
+        "reasoning": match.llm_reasoning,
+        "recommended": match.is_recommended,
+    }
+
+
+def _parse_flag(value: object) -> bool | None:
+    """Interpret a JSON boolean flag, accepting common string forms; ``None`` if invalid."""
+
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.lower() in ("", "0", "false", "no"):
+        return False
+    if isinstance(value, str) and value.lower() in ("1", "true", "yes"):
+        return True
+    return None
+
+
+def _sse(event: str, data: object) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 def main() -> None:
     """Run the Flask development server for local exploration."""
 
@@ -0,0 +1,205 @@
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from job_search_automation.apply import JobApplicationService
+from job_search_automation.models import CandidateProfile, JobPosting
+from job_search_automation.outbox import ApplicationOutbox
+
+
+class StubWebhook:
+    """Local HTTP server that fails each job's first submission with a 503."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.requests: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub.lock:
+                    first_attempt = body["job_url"] not in stub.requests
+                    stub.requests.append(body["job_url"])
+                    stub.active += 1
+                    stub.peak = max(stub.peak, stub.active)
+                time.sleep(stub.delay)
+                with stub.lock:
+                    stub.active -= 1
+                status = 503 if first_attempt else (404 if "missing" in body["job_url"] else 200)
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/apply"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def webhook():
+    stub = StubWebhook(delay=0.05)
+    yield stub
+    stub.close()
+
+
+def _dead_owner() -> str:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return f"{socket.gethostname()}:{process.pid}"
+
+
+def _jobs(*slugs: str) -> list[JobPosting]:
+    return [JobPosting(title=slug, company="Acme", description="", url=f"https://jobs/{slug}") for slug in slugs]
+
+
+def test_apply_many_retries_and_preserves_order(webhook):
+    service = JobApplicationService(webhook.url, max_concurrency=3, backoff_factor=0.01)
+    jobs = _jobs("a", "b", "missing", "c", "d")
+
+    results = service.apply_many(jobs, CandidateProfile(name="Ada"))
+    service.close()
+
+    assert [result.job for result in results] == jobs
+    assert [result.applied for result in results] == [True, True, False, True, True]
+    assert "404" in results[2].message
+    assert len(webhook.requests) == 10
+    assert 1 < webhook.peak <= 3
+
+
+def test_apply_many_rate_limits_per_host(webhook):
+    service = JobApplicationService(
+        webhook.url, max_concurrency=4, max_retries=0, rate_limit=20.0, rate_burst=1
+    )
+
+    started = time.perf_counter()
+    results = service.apply_many(_jobs("a", "b", "c", "d", "e"), CandidateProfile())
+    elapsed = time.perf_counter() - started
+
+    assert not any(result.applied for result in results)
+    assert all("503" in result.message for result in results)
+    assert elapsed >= 4 / 20.0 * 0.9
+
+
+def test_outbox_skips_submitted_jobs_and_drains_pending(webhook, tmp_path):
+    outbox = ApplicationOutbox(tmp_path / "outbox.sqlite")
+    service = JobApplicationService(webhook.url, backoff_factor=0.01, outbox=outbox)
+    profile = CandidateProfile(email="ada@example.com")
+    jobs = _jobs("a", "b")
+
+    assert all(result.applied for result in service.apply_many(jobs, profile))
+    sent = len(webhook.requests)
+
+    # Simulate a run that claimed a submission but died before sending it.
+    pending_key = outbox.make_key("https://jobs/c", "ada@example.com")
+    crashed = ApplicationOutbox(outbox.path)
+    crashed.owner = _dead_owner()
+    assert crashed.claim(pending_key, "https://jobs/c", "ada@example.com", {"job_url": "https://jobs/c"})
+
+    rerun = JobApplicationService(webhook.url, backoff_factor=0.01, outbox=ApplicationOutbox(outbox.path))
+    results = rerun.apply_many(jobs, profile)
+    assert [result.message for result in results] == ["Application already submitted"] * 2
+    assert len(webhook.requests) == sent
+
+    drained = rerun.start_drain()
+    drained.join(timeout=5)
+    assert webhook.requests[sent:] == ["https://jobs/c", "https://jobs/c"]
+    assert outbox.pending() == []
+    assert outbox.get(pending_key).status == "submitted"
+
+
+def test_outbox_claims_are_exclusive(tmp_path):
+    outbox = ApplicationOutbox(tmp_path / "outbox.sqlite")
+    other = ApplicationOutbox(outbox.path)
+    key = outbox.make_key("https://jobs/a", "ada@example.com")
+
+    assert outbox.claim(key, "https://jobs/a", "ada@example.com", {})
+    assert not other.claim(key, "https://jobs/a", "ada@example.com", {})
+    assert other.pending() == []
+
+    outbox.mark(key, "submitted")
+    assert not other.claim(key, "https://jobs/a", "ada@example.com", {})
+    assert outbox.get(key).status == "submitted"
+
+
+def test_outbox_reclaims_sends_abandoned_by_an_exited_process(webhook, tmp_path):
+    outbox = ApplicationOutbox(tmp_path / "outbox.sqlite")
+    crashed = ApplicationOutbox(outbox.path)
+    crashed.owner = _dead_owner()
+    profile = CandidateProfile(email="ada@example.com")
+    job = _jobs("a")[0]
+    key = outbox.make_key(job.url, "ada@example.com")
+    assert crashed.claim(key, job.url, "ada@example.com", {"job_url": job.url})
+
+    assert [entry.key for entry in outbox.pending()] == [key]
+    rerun = JobApplicationService(webhook.url, backoff_factor=0.01, outbox=outbox)
+    assert rerun.apply_to_job(job, profile).applied
+    assert outbox.get(key).status == "submitted"
+
+    # A claim held by a live process is left alone until it times out.
+    live = ApplicationOutbox(outbox.path)
+    other_key = outbox.make_key("https://jobs/b", "ada@example.com")
+    assert live.claim(other_key, "https://jobs/b", "ada@example.com", {})
+    assert outbox.pending() == []
+    assert not outbox.claim(other_key, "https://jobs/b", "ada@example.com", {})
+
+
+def test_apply_many_sends_repeated_urls_once(webhook, tmp_path):
+    service = JobApplicationService(
+        webhook.url, backoff_factor=0.01, outbox=ApplicationOutbox(tmp_path / "outbox.sqlite")
+    )
+    jobs = _jobs("a", "b", "a")
+
+    results = service.apply_many(jobs, CandidateProfile(email="ada@example.com"))
+
+    assert [result.job for result in results] == jobs
+    assert all(result.applied for result in results)
+    assert sorted(webhook.requests) == ["https://jobs/a"] * 2 + ["https://jobs/b"] * 2
+
+
+def test_backoff_caps_and_parses_retry_after():
+    service = JobApplicationService(backoff_factor=0.5, max_backoff=30.0)
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+
+    assert service._backoff(2) == 2.0
+    assert service._backoff(10) == 30.0
+    assert service._backoff(0, "86400") == 30.0
+    assert 8 <= service._backoff(0, format_datetime(retry_at, usegmt=True)) <= 10
+    assert service._backoff(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert service._backoff(1, "soon") == 1.0
+
+
+def test_read_timeouts_are_only_retried_with_an_idempotency_key(tmp_path):
+    stub = StubWebhook(delay=0.5)
+    try:
+        plain = JobApplicationService(stub.url, timeout=0.1, max_retries=2, backoff_factor=0.0)
+        assert not plain.apply_to_job(_jobs("a")[0], CandidateProfile()).applied
+        assert len(stub.requests) == 1
+
+        keyed = JobApplicationService(
+            stub.url, timeout=0.1, max_retries=2, backoff_factor=0.0, outbox=ApplicationOutbox(tmp_path / "o.sqlite")
+        )
+        assert not keyed.apply_to_job(_jobs("b")[0], CandidateProfile()).applied
+        assert stub.requests.count("https://jobs/b") == 3
+    finally:
+        stub.close()
@@ -0,0 +1,104 @@
+import threading
+
+from job_search_automation.apply import JobApplicationService
+from job_search_automation.automation import JobSearchAutomator
+from job_search_automation.config import AutomationConfig, JobSearchConfig, LLMConfig, ResumeConfig
+from job_search_automation.job_fetchers.base import JobFetcher
+from job_search_automation.llm import LLMClient
+from job_search_automation.matcher import JobMatcher, MatchSettings
+from job_search_automation.metrics import Metrics
+from job_search_automation.models import ApplicationResult, JobPosting
+from job_search_automation.resume_parser import ResumeParser
+from job_search_automation.retriever import ResumeRetriever
+
+
+class GatedFetcher(JobFetcher):
+    """Yields one page of jobs, then waits until the test releases the next."""
+
+    def __init__(self, pages: int, page_size: int) -> None:
+        self.pages = pages
+        self.page_size = page_size
+        self.release = threading.Event()
+        self.fetched = 0
+
+    def search(self):
+        for page in range(self.pages):
+            if page:
+                assert self.release.wait(timeout=5)
+            for index in range(self.page_size):
+                self.fetched += 1
+                yield JobPosting(
+                    title=f"Python Job {page}-{index}",
+                    company="Acme",
+                    description="Python developer building Flask APIs",
+                    url=f"https://jobs/{page}/{index}",
+                )
+
+
+class RecordingApplications(JobApplicationService):
+    def __init__(self) -> None:
+        super().__init__()
+        self.applied: list[str] = []
+
+    def apply_many(self, jobs, profile):
+        self.applied.extend(job.url for job in jobs)
+        return [ApplicationResult(job=job, applied=True, message="ok") for job in jobs]
+
+
+def _automator(tmp_path, fetcher, applications) -> JobSearchAutomator:
+    resume_path = tmp_path / "resume.txt"
+    resume_path.write_text("Python developer building Flask APIs on AWS.", encoding="utf-8")
+    config = AutomationConfig(
+        resume=ResumeConfig(path=resume_path, chunk_size=20, chunk_overlap=2),
+        job_search=JobSearchConfig(provider="test", keywords=["python"]),
+        llm=LLMConfig(provider="offline"),
+    )
+    matcher = JobMatcher(ResumeRetriever(), LLMClient(config.llm), MatchSettings(similarity_threshold=0.1))
+    return JobSearchAutomator(config, ResumeParser(), fetcher, matcher, applications)
+
+
+def test_streaming_run_applies_before_fetching_finishes(tmp_path):
+    fetcher = GatedFetcher(pages=3, page_size=4)
+    applications = RecordingApplications()
+    stream = _automator(tmp_path, fetcher, applications).run_streaming(batch_size=4, buffer_size=1)
+
+    first = next(stream)
+    assert fetcher.fetched == 4
+    assert [application.job.url for application in first.applications] == [f"https://jobs/0/{i}" for i in range(4)]
+    assert first.jobs_processed == 4
+
+    fetcher.release.set()
+    updates = [first, *stream]
+
+    assert len(updates) == 3
+    assert updates[-1].jobs_processed == 12
+    assert updates[-1].applications_submitted == 12
+    assert applications.applied == [f"https://jobs/{page}/{index}" for page in range(3) for index in range(4)]
+
+
+def test_run_reports_stage_metrics(tmp_path):
+    fetcher = GatedFetcher(pages=1, page_size=3)
+    automator = _automator(tmp_path, fetcher, RecordingApplications())
+    automator.metrics = metrics = Metrics()
+    automator.matcher.metrics = metrics
+
+    report = automator.run()
+
+    histograms = report.metrics["histograms"]
+    for stage in ("resume", "fetch", "match", "retrieve", "analyse", "apply"):
+        assert histograms[f'stage_seconds{{stage="{stage}"}}']["count"] == 1
+    assert report.metrics["counters"]["jobs_fetched_total"] == 3
+    assert metrics.counter_value("jobs_scored_total") == 3
+
+
+def test_run_reports_resumed_submissions(tmp_path):
+    resumed = ApplicationResult(job=JobPosting(title="Old", company="Acme", description="", url="u"), applied=True)
+
+    class ResumingApplications(RecordingApplications):
+        def drain_outbox(self, include_failed=False):
+            return [resumed]
+
+    report = _automator(tmp_path, GatedFetcher(pages=1, page_size=2), ResumingApplications()).run()
+
+    assert report.applications[0] is resumed
+    assert len(report.applications) == 3
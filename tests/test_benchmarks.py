@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from job_search_automation.benchmarks import generate_jobs, run_suite
+from job_search_automation.benchmarks.__main__ import main
+
+
+def test_generate_jobs_is_deterministic():
+    first = [job.description for job in generate_jobs(20, seed=3)]
+    assert first == [job.description for job in generate_jobs(20, seed=3)]
+    assert first != [job.description for job in generate_jobs(20, seed=4)]
+
+
+def test_run_suite_reports_every_benchmark(tmp_path, capsys):
+    output = tmp_path / "report.json"
+    main(["--jobs", "50", "--repeat", "1", "--output", str(output)])
+
+    report = json.loads(output.read_text())
+    assert json.loads(capsys.readouterr().out) == report
+    assert [result["name"] for result in report["results"]] == ["index", "query", "fetch", "end_to_end"]
+    assert all(result["median"] >= 0 for result in report["results"])
+    end_to_end = report["results"][-1]
+    assert end_to_end["extra"]["applications"] > 0
+
+
+def test_run_suite_rejects_unknown_benchmarks():
+    with pytest.raises(ValueError, match="bogus"):
+        run_suite(jobs=10, repeat=1, benchmarks=["bogus"])
@@ -0,0 +1,54 @@
+from job_search_automation.catalogue import JobCatalogue
+from job_search_automation.config import LLMConfig
+from job_search_automation.llm import LLMClient
+from job_search_automation.matcher import JobMatcher, MatchSettings
+from job_search_automation.models import JobPosting, Resume
+from job_search_automation.retriever import ResumeRetriever
+
+
+class RecordingLLM(LLMClient):
+    def __init__(self) -> None:
+        super().__init__(LLMConfig(provider="fake"))
+        self.calls: list[str] = []
+
+    def generate_match_analysis(self, job_title, job_description, resume_snippets, similarity_score):
+        self.calls.append(job_title)
+        return f"{job_title}: Recommendation: YES"
+
+
+def _matcher(llm: LLMClient, catalogue: JobCatalogue, resume: str) -> JobMatcher:
+    matcher = JobMatcher(ResumeRetriever(), llm, MatchSettings(similarity_threshold=0.0), catalogue=catalogue)
+    matcher.prepare(Resume(raw_text=resume), chunk_size=20, overlap=2)
+    return matcher
+
+
+def test_refresh_only_rescores_new_or_changed_jobs(tmp_path):
+    resume = "Python developer building Flask APIs on AWS."
+    jobs = [
+        JobPosting(title=f"Job {index}", company="Acme", description="Python Flask APIs", url=f"https://acme.io/{index}")
+        for index in range(3)
+    ]
+    catalogue = JobCatalogue(tmp_path / "jobs.db")
+    llm = RecordingLLM()
+    first = _matcher(llm, catalogue, resume).score_jobs(jobs)
+
+    refreshed = [
+        jobs[0],
+        JobPosting(title="Job 1", company="Acme", description="Python Flask APIs on AWS", url="https://acme.io/1"),
+        jobs[2],
+        JobPosting(title="Job 3", company="Acme", description="Python", url="https://acme.io/3"),
+    ]
+    llm.calls.clear()
+    matcher = _matcher(llm, catalogue, resume)
+    second = matcher.score_jobs(refreshed)
+
+    assert llm.calls == ["Job 1", "Job 3"]
+    assert [result.job.title for result in second] == ["Job 0", "Job 1", "Job 2", "Job 3"]
+    assert second[0].llm_reasoning == first[0].llm_reasoning
+    assert second[0].similarity == first[0].similarity
+    assert matcher.last_stats.jobs_reused == 2
+    assert matcher.last_stats.jobs_scored == 4
+
+    llm.calls.clear()
+    _matcher(llm, catalogue, resume + " Also Kubernetes.").score_jobs(refreshed)
+    assert len(llm.calls) == 4
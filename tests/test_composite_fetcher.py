@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+from job_search_automation.job_fetchers.base import JobFetcher, StaticJobFetcher
+from job_search_automation.job_fetchers.composite import CompositeJobFetcher
+from job_search_automation.job_fetchers.dedupe import DuplicateFilter, normalize_url
+from job_search_automation.models import JobPosting
+
+DESCRIPTION = (
+    "Build and operate Python services on Flask and PostgreSQL, own the deployment pipeline, "
+    "review pull requests and mentor two junior engineers on testing practices."
+)
+
+
+class SlowFetcher(JobFetcher):
+    def __init__(self, jobs, delay):
+        self.jobs = jobs
+        self.delay = delay
+
+    def search(self):
+        time.sleep(self.delay)
+        yield from self.jobs
+
+
+class FailingFetcher(JobFetcher):
+    def search(self):
+        raise RuntimeError("provider down")
+
+
+def test_normalize_url_ignores_tracking_and_cosmetic_differences():
+    assert normalize_url("https://www.Example.com/jobs/1/?utm_source=x&b=2&a=1#apply") == normalize_url(
+        "http://example.com/jobs/1?a=1&b=2"
+    )
+    assert normalize_url("https://example.com/jobs/1") != normalize_url("https://example.com/jobs/2")
+
+
+def test_duplicate_filter_catches_near_duplicates():
+    duplicates = DuplicateFilter()
+    original = JobPosting(
+        title="Python Engineer", company="Acme", description=DESCRIPTION, url="https://a/1", source="serpapi"
+    )
+    reposted = JobPosting(
+        title="Python Engineer", company="Acme", description=DESCRIPTION + " Remote.", url="https://b/9", source="local"
+    )
+    other = JobPosting(title="Pastry Chef", company="Bistro", description="Bake bread daily.", url="https://c/3")
+
+    assert not duplicates.is_duplicate(original)
+    assert duplicates.is_duplicate(reposted)
+    assert not duplicates.is_duplicate(other)
+
+
+def test_duplicate_filter_keeps_distinct_openings_from_one_provider():
+    duplicates = DuplicateFilter()
+    base = dict(company="Acme", description=DESCRIPTION, source="serpapi")
+    new_york = JobPosting(title="Backend Engineer", url="https://acme.io/1", location="New York", **base)
+    london = JobPosting(title="Backend Engineer", url="https://acme.io/2", location="London", **base)
+    senior = JobPosting(title="Senior Backend Engineer", url="https://acme.io/3", location="New York", **base)
+    unlinked = JobPosting(title="Backend Engineer", url="", location="New York", **base)
+
+    assert not duplicates.is_duplicate(new_york)
+    assert not duplicates.is_duplicate(london)
+    assert not duplicates.is_duplicate(senior)
+    assert duplicates.is_duplicate(unlinked)
+
+
+def test_composite_fetcher_runs_providers_concurrently_and_deduplicates():
+    shared = JobPosting(title="Python Engineer", company="Acme", description=DESCRIPTION, url="https://acme.io/1")
+    first = SlowFetcher([shared], delay=0.3)
+    second = SlowFetcher(
+        [JobPosting(title=shared.title, company="Acme", description=DESCRIPTION, url="https://www.acme.io/1/?utm_medium=x")],
+        delay=0.3,
+    )
+    third = StaticJobFetcher([JobPosting(title="Chef", company="Bistro", description="Menus", url="https://b/2")])
+    fetcher = CompositeJobFetcher([first, second, third, FailingFetcher()])
+
+    started = time.perf_counter()
+    jobs = list(fetcher.search())
+    elapsed = time.perf_counter() - started
+
+    assert sorted(job.title for job in jobs) == ["Chef", "Python Engineer"]
+    assert fetcher.duplicates_dropped == 1
+    assert [str(error) for error in fetcher.errors] == ["provider down"]
+    assert elapsed < 0.55
+
+    with pytest.raises(RuntimeError):
+        list(CompositeJobFetcher([FailingFetcher()]).search())
@@ -0,0 +1,74 @@
+import json
+
+from job_search_automation.config import JobSearchConfig
+from job_search_automation.job_fetchers.index import JobIndex
+from job_search_automation.job_fetchers.local import LocalJobFetcher, load_job_index
+from job_search_automation.job_fetchers.store import JobStoreFetcher
+from job_search_automation.job_store import JobStore
+from job_search_automation.models import JobPosting
+
+
+def _job(title: str, description: str, location: str | None = None) -> JobPosting:
+    return JobPosting(title=title, company="Acme", description=description, url="", location=location)
+
+
+def test_job_index_matches_keyword_prefixes_phrases_and_locations():
+    jobs = [
+        _job("Data Engineer", "Build Spark pipelines.", "Remote - US"),
+        _job("Engineering Manager", "Lead machine learning teams.", "New York, NY"),
+        _job("Chef", "Cook with machine precision and learning mindset.", "Remote - EU"),
+        _job("Python Developer", "Flask and Django APIs.", None),
+    ]
+    index = JobIndex(jobs)
+
+    assert [job.title for job in index.search(["engineer"])] == ["Data Engineer", "Engineering Manager"]
+    assert [job.title for job in index.search(["ngineer"])] == ["Data Engineer", "Engineering Manager"]
+    assert [job.title for job in index.search(["Machine Learning"])] == ["Engineering Manager"]
+    assert [job.title for job in index.search(["engineer"], location="remote")] == ["Data Engineer"]
+    assert [job.title for job in index.search(location="remote")] == ["Data Engineer", "Chef"]
+    assert [job.title for job in index.search(["flask", "spark"], max_results=1)] == ["Data Engineer"]
+    assert list(index.search(["golang"])) == []
+
+
+def test_local_fetcher_shares_index_and_matches_linear_scan():
+    config = JobSearchConfig(provider="local", keywords=["python", "data"], location="remote", max_results=50)
+    fetcher = LocalJobFetcher(config)
+    results = list(fetcher.search())
+
+    index = load_job_index(fetcher.dataset_path)
+    assert load_job_index(fetcher.dataset_path) is index
+    expected = [
+        job
+        for job in index.jobs
+        if any(keyword in f"{job.title}\n{job.description}".lower() for keyword in config.keywords)
+        and "remote" in (job.location or "").lower()
+    ]
+    assert results == expected
+
+
+def test_index_streaming_and_store_fetchers_agree_on_keywords(tmp_path):
+    records = [
+        {"title": "DevOps Engineer", "company": "Acme", "description": "Terraform and CI.", "location": "Remote"},
+        {"title": "Frontend Developer", "company": "Acme", "description": "JavaScript and CSS.", "location": "Remote"},
+        {"title": "C++ Developer", "company": "Acme", "description": "Low latency trading.", "location": "London"},
+        {"title": "Chef", "company": "Bistro", "description": "Seasonal menus.", "location": "Remote"},
+    ]
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps(records), encoding="utf-8")
+    store_path = tmp_path / "jobs.store"
+    JobStore.write(store_path, load_job_index(path).jobs)
+
+    results = {}
+    for keywords in (["ops"], ["script"], ["c++"], ["ops", "seasonal men"], ["nothing"]):
+        config = JobSearchConfig(provider="local", keywords=keywords, max_results=10)
+        indexed = [job.title for job in LocalJobFetcher(config, path).search()]
+        streamed = [job.title for job in LocalJobFetcher(config, path, streaming=True).search()]
+        stored = [job.title for job in JobStoreFetcher(config, store_path).search()]
+        assert indexed == streamed == stored, keywords
+        results[keywords[-1]] = indexed
+
+    assert results["ops"] == ["DevOps Engineer"]
+    assert results["script"] == ["Frontend Developer"]
+    assert results["c++"] == ["C++ Developer"]
+    assert results["seasonal men"] == ["DevOps Engineer", "Chef"]
+    assert results["nothing"] == []
@@ -0,0 +1,67 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+from job_search_automation.config import JobSearchConfig
+from job_search_automation.job_fetchers.store import JobStoreFetcher
+from job_search_automation.job_store import JobStore
+from job_search_automation.models import JobPosting
+
+JOBS = [
+    JobPosting(
+        title="Python Engineer",
+        company="Acme",
+        description="Build Flask APIs — café-grade ☕ uptime.",
+        url="https://example.com/1",
+        location="Remote",
+        salary="$150k",
+        source="local",
+        posted_at=datetime(2024, 5, 1, 12, 30),
+    ),
+    JobPosting(title="Chef", company="Bistro", description="Seasonal menus.", url="", location="Paris"),
+    JobPosting(title="Data Engineer", company="Acme", description="Python and Spark.", url="", location="Remote"),
+]
+
+
+def test_job_store_round_trips_postings(tmp_path):
+    path = tmp_path / "jobs.store"
+    assert JobStore.write(path, iter(JOBS)) == len(JOBS)
+
+    store = JobStore.open(path)
+
+    assert len(store) == len(JOBS)
+    assert [view.to_posting() for view in store] == JOBS
+    assert store[-1].title == "Data Engineer"
+    assert store[1].salary is None and store[1].posted_at is None
+
+
+def test_job_store_fetcher_filters_views(tmp_path):
+    path = tmp_path / "jobs.store"
+    JobStore.write(path, JOBS)
+    config = JobSearchConfig(provider="store", keywords=["python"], location="remote", max_results=5)
+
+    jobs = list(JobStoreFetcher(config, path).search())
+
+    assert [job.title for job in jobs] == ["Python Engineer", "Data Engineer"]
+
+
+def test_job_store_preserves_posting_time_zones(tmp_path, monkeypatch):
+    posted = [
+        datetime(2024, 5, 1, 12, 30, tzinfo=timezone(timedelta(hours=-7))),
+        datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+        datetime(2024, 5, 1, 12, 30),
+    ]
+    path = tmp_path / "jobs.store"
+    JobStore.write(path, [JobPosting(title="", company="", description="", url="", posted_at=value) for value in posted])
+
+    # Naive dates must not be reinterpreted in whatever zone the reader runs in.
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    try:
+        restored = [view.posted_at for view in JobStore.open(path)]
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    assert restored == posted
+    assert [value.utcoffset() for value in restored] == [timedelta(hours=-7), timedelta(0), None]
+    assert restored[2].tzinfo is None
@@ -0,0 +1,95 @@
+import re
+
+from job_search_automation.config import LLMConfig
+from job_search_automation.llm import LLMClient, MatchRequest
+from job_search_automation.llm_cache import LLMResponseCache
+from job_search_automation.matcher import JobMatcher, MatchSettings
+from job_search_automation.metrics import Metrics
+from job_search_automation.models import JobPosting, Resume
+from job_search_automation.retriever import ResumeRetriever
+
+
+class FakeCompletionLLM(LLMClient):
+    """LLM client backed by a local fake completion endpoint."""
+
+    def __init__(self, config: LLMConfig | None = None, malformed: bool = False, **kwargs) -> None:
+        super().__init__(config or LLMConfig(), **kwargs)
+        self.malformed = malformed
+        self.prompts: list[str] = []
+
+    def _ensure_openai(self) -> None:
+        return None
+
+    def _complete(self, prompt: str, max_tokens: int | None = None) -> str:
+        self.prompts.append(prompt)
+        titles = re.findall(r"^Job Title: (.+)$", prompt, re.MULTILINE)
+        if len(titles) == 1:
+            return f"Single review of {titles[0]}. Recommendation: YES"
+        if self.malformed:
+            return "Both jobs look fine to me."
+        return "\n".join(
+            f"### Job {number}\nSummary: {title} fits.\nRecommendation: {'YES' if 'Python' in title else 'NO'}"
+            for number, title in enumerate(titles, start=1)
+        )
+
+
+def _requests(*titles: str) -> list[MatchRequest]:
+    return [
+        MatchRequest(job_title=title, job_description="Build APIs.", resume_snippets=["Python"], similarity_score=0.5)
+        for title in titles
+    ]
+
+
+def test_batch_analysis_packs_jobs_into_one_request():
+    client = FakeCompletionLLM()
+
+    analyses = client.generate_batch_analysis(_requests("Python Dev", "Chef", "Python Lead"))
+
+    assert len(client.prompts) == 1
+    assert analyses == [
+        "Summary: Python Dev fits.\nRecommendation: YES",
+        "Summary: Chef fits.\nRecommendation: NO",
+        "Summary: Python Lead fits.\nRecommendation: YES",
+    ]
+
+
+def test_batch_analysis_respects_token_budget_and_falls_back_on_parse_errors():
+    budgeted = FakeCompletionLLM(LLMConfig(batch_token_budget=60))
+    budgeted.generate_batch_analysis(_requests("Python Dev", "Chef", "Python Lead"))
+    assert len(budgeted.prompts) == 3
+
+    malformed = FakeCompletionLLM(malformed=True)
+    analyses = malformed.generate_batch_analysis(_requests("Python Dev", "Chef"))
+    assert len(malformed.prompts) == 3
+    assert analyses == ["Single review of Python Dev. Recommendation: YES", "Single review of Chef. Recommendation: YES"]
+
+
+def test_batch_analysis_counts_each_cache_miss_once(tmp_path):
+    metrics = Metrics()
+    cache = LLMResponseCache(tmp_path / "llm.sqlite")
+    client = FakeCompletionLLM(malformed=True, cache=cache, metrics=metrics)
+
+    client.generate_batch_analysis(_requests("Python Dev", "Chef"))
+    client.generate_batch_analysis(_requests("Python Dev", "Chef", "Python Lead"))
+
+    assert metrics.counter_value("llm_cache_misses_total") == 3
+    assert metrics.counter_value("llm_cache_hits_total") == 2
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert len(client.prompts) == 4
+
+
+def test_matcher_uses_batched_requests():
+    client = FakeCompletionLLM()
+    retriever = ResumeRetriever()
+    matcher = JobMatcher(retriever, client, MatchSettings(similarity_threshold=0.0, llm_batch_size=4))
+    matcher.prepare(Resume(raw_text="Python developer building Flask APIs."), chunk_size=20, overlap=2)
+    jobs = [
+        JobPosting(title=f"Python Dev {index}", company="Acme", description="Python Flask APIs", url="")
+        for index in range(6)
+    ]
+
+    results = matcher.score_jobs(jobs)
+
+    assert len(client.prompts) == 2
+    assert all(result.is_recommended for result in results)
+    assert [result.job.title for result in results] == [job.title for job in jobs]
@@ -0,0 +1,62 @@
+from job_search_automation.config import LLMConfig
+from job_search_automation.llm import LLMClient
+from job_search_automation.llm_cache import LLMResponseCache
+
+
+class CountingLLM(LLMClient):
+    """LLM client whose completion endpoint is a local counter."""
+
+    def __init__(self, config: LLMConfig) -> None:
+        super().__init__(config)
+        self.completions = 0
+
+    def _ensure_openai(self) -> None:
+        return None
+
+    def _complete(self, prompt: str) -> str:
+        self.completions += 1
+        return f"completion {self.completions}: Recommendation: YES"
+
+
+def _analyse(client: LLMClient, title: str) -> str:
+    return client.generate_match_analysis(
+        job_title=title,
+        job_description="Build Flask APIs.",
+        resume_snippets=["Python developer"],
+        similarity_score=0.5,
+    )
+
+
+def test_repeat_prompts_are_served_from_cache_across_clients(tmp_path):
+    config = LLMConfig(cache_path=tmp_path / "llm.sqlite")
+    first = CountingLLM(config)
+
+    assert _analyse(first, "Engineer") == "completion 1: Recommendation: YES"
+    assert _analyse(first, "Engineer") == "completion 1: Recommendation: YES"
+    assert first.completions == 1
+    assert (first.cache.hits, first.cache.misses) == (1, 1)
+
+    second = CountingLLM(config)
+    assert _analyse(second, "Engineer") == "completion 1: Recommendation: YES"
+    assert second.completions == 0
+
+    other_model = CountingLLM(LLMConfig(model="gpt-4o", cache_path=config.cache_path))
+    _analyse(other_model, "Engineer")
+    assert other_model.completions == 1
+
+
+def test_cache_expires_entries_and_evicts_least_recently_used(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite", ttl=None, max_entries=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"
+    cache.put("c", "C")
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ("A", "C")
+    assert len(cache) == 2
+
+    expiring = LLMResponseCache(tmp_path / "expiring.sqlite", ttl=0.0)
+    expiring.put("a", "A")
+    assert expiring.get("a") is None
+    assert expiring.misses == 1
@@ -0,0 +1,101 @@
+import time
+
+from job_search_automation.config import LLMConfig
+from job_search_automation.llm import LLMClient
+from job_search_automation.matcher import JobMatcher, MatchSettings
+from job_search_automation.models import JobPosting, Resume
+from job_search_automation.retriever import ResumeRetriever
+
+
+class SleepingLLM(LLMClient):
+    """Fake LLM that sleeps like a network call and echoes the job title."""
+
+    def __init__(self, delay: float, slow_titles: dict[str, float] | None = None) -> None:
+        super().__init__(LLMConfig(provider="fake"))
+        self.delay = delay
+        self.slow_titles = slow_titles or {}
+        self.calls: list[str] = []
+
+    def generate_match_analysis(self, job_title, job_description, resume_snippets, similarity_score):
+        self.calls.append(job_title)
+        time.sleep(self.slow_titles.get(job_title, self.delay))
+        return f"{job_title}: Recommendation: YES"
+
+
+def _matcher(llm: LLMClient, **settings) -> JobMatcher:
+    retriever = ResumeRetriever()
+    matcher = JobMatcher(retriever, llm, MatchSettings(similarity_threshold=0.0, **settings))
+    matcher.prepare(Resume(raw_text="Python developer building Flask APIs on AWS."), chunk_size=20, overlap=2)
+    return matcher
+
+
+def _jobs(count: int) -> list[JobPosting]:
+    return [
+        JobPosting(title=f"Job {index}", company="Acme", description="Python Flask APIs", url="")
+        for index in range(count)
+    ]
+
+
+def test_concurrent_analysis_is_bounded_by_slowest_batch_and_keeps_order():
+    llm = SleepingLLM(delay=0.2)
+    matcher = _matcher(llm, max_concurrency=4)
+
+    started = time.perf_counter()
+    results = matcher.score_jobs(_jobs(8))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0  # two rounds of 0.2s instead of 1.6s sequentially
+    assert [result.llm_reasoning for result in results] == [f"Job {i}: Recommendation: YES" for i in range(8)]
+    assert all(result.is_recommended for result in results)
+
+
+def test_llm_timeout_abandons_slow_calls():
+    llm = SleepingLLM(delay=0.01, slow_titles={"Job 1": 2.0})
+    matcher = _matcher(llm, max_concurrency=2, llm_timeout=0.3)
+
+    started = time.perf_counter()
+    results = matcher.score_jobs(_jobs(3))
+
+    assert time.perf_counter() - started < 1.0
+    assert "timed out" in results[1].llm_reasoning
+    assert not results[1].is_recommended
+    assert results[0].is_recommended and results[2].is_recommended
+
+
+def test_cascade_only_sends_top_candidates_to_llm():
+    llm = SleepingLLM(delay=0.0)
+    matcher = _matcher(llm, llm_cascade=True, llm_top_n=1)
+    matcher.settings.similarity_threshold = 0.1
+    jobs = [
+        JobPosting(title="Partial", company="A", description="Python scripting", url=""),
+        JobPosting(title="Strong", company="B", description="Python developer building Flask APIs", url=""),
+        JobPosting(title="Unrelated", company="C", description="Seasonal menus", url=""),
+    ]
+
+    results = matcher.score_jobs(jobs)
+
+    assert llm.calls == ["Strong"]
+    assert matcher.last_stats.llm_calls == 1
+    assert matcher.last_stats.llm_calls_skipped == 2
+    assert [result.job.title for result in results if result.is_recommended] == ["Strong"]
+    assert "top 1 candidates" in results[0].llm_reasoning
+    assert "below the 0.10 threshold" in results[2].llm_reasoning
+
+
+def test_top_jobs_reviews_only_the_best_n():
+    llm = SleepingLLM(delay=0.0)
+    matcher = _matcher(llm)
+    jobs = [
+        JobPosting(title="Chef", company="Bistro", description="Bake bread", url=""),
+        JobPosting(title="Backend", company="Acme", description="Python Flask APIs on AWS", url=""),
+        JobPosting(title="Analyst", company="Acme", description="Python dashboards", url=""),
+        JobPosting(title="Platform", company="Acme", description="Kubernetes operators", url=""),
+    ]
+
+    full = sorted(matcher.score_jobs(jobs), key=lambda result: -result.similarity)
+    llm.calls.clear()
+    top = matcher.top_jobs(jobs, 2)
+
+    assert [result.job.title for result in top] == [result.job.title for result in full[:2]]
+    assert sorted(llm.calls) == sorted(result.job.title for result in full[:2])
+    assert full[1].similarity > full[2].similarity
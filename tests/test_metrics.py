@@ -0,0 +1,29 @@
+from job_search_automation.metrics import NULL_METRICS, Metrics
+
+
+def test_render_uses_prometheus_text_format():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.increment("llm_cache_hits_total", 2)
+    metrics.increment("applications_total", outcome="submitted")
+    metrics.observe("stage_seconds", 0.05, stage="fetch")
+    metrics.observe("stage_seconds", 0.5, stage="fetch")
+
+    lines = metrics.render().splitlines()
+
+    assert "# TYPE job_search_llm_cache_hits_total counter" in lines
+    assert "job_search_llm_cache_hits_total 2" in lines
+    assert 'job_search_applications_total{outcome="submitted"} 1' in lines
+    assert "# TYPE job_search_stage_seconds histogram" in lines
+    assert 'job_search_stage_seconds_bucket{stage="fetch",le="0.1"} 1' in lines
+    assert 'job_search_stage_seconds_bucket{stage="fetch",le="1"} 2' in lines
+    assert 'job_search_stage_seconds_bucket{stage="fetch",le="+Inf"} 2' in lines
+    assert 'job_search_stage_seconds_count{stage="fetch"} 2' in lines
+    assert metrics.snapshot()["histograms"]['stage_seconds{stage="fetch"}']["count"] == 2
+
+
+def test_null_metrics_record_nothing():
+    with NULL_METRICS.timer("stage_seconds", stage="fetch"):
+        NULL_METRICS.increment("jobs_scored_total")
+
+    assert not NULL_METRICS.enabled
+    assert NULL_METRICS.render() == ""
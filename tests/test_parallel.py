@@ -0,0 +1,84 @@
+import pytest
+
+from job_search_automation.cli import main
+from job_search_automation.config import LLMConfig
+from job_search_automation.job_store import JobStore
+from job_search_automation.llm import LLMClient
+from job_search_automation.matcher import JobMatcher, MatchSettings
+from job_search_automation.models import JobPosting, Resume
+from job_search_automation.parallel import BatchMatcher, find_resumes
+from job_search_automation.resume_parser import ResumeParser
+from job_search_automation.retriever import ResumeRetriever
+
+JOBS = [
+    JobPosting(title="Backend", company="Acme", description="Python Flask APIs on AWS", url="a"),
+    JobPosting(title="Data", company="Acme", description="Spark pipelines and Python", url="b"),
+    JobPosting(title="Baker", company="Bistro", description="Bread and pastry", url="c"),
+]
+
+
+def test_batch_reports_match_single_resume_runs(tmp_path):
+    (tmp_path / "backend.txt").write_text("Python developer building Flask APIs on AWS.", encoding="utf-8")
+    (tmp_path / "baker.md").write_text("Pastry chef baking bread every morning.", encoding="utf-8")
+    (tmp_path / "empty.txt").write_text("", encoding="utf-8")
+    (tmp_path / "notes.doc").write_text("ignored", encoding="utf-8")
+    resumes = find_resumes(tmp_path)
+    assert [path.name for path in resumes] == ["backend.txt", "baker.md", "empty.txt"]
+
+    batch = BatchMatcher(LLMConfig(provider="offline"), chunk_size=20, overlap=2, workers=2)
+    reports = list(batch.run(resumes, JOBS))
+
+    assert [report.resume for report in reports] == resumes
+    assert reports[2].error and not reports[2].matched_jobs
+    for report in reports[:2]:
+        retriever = ResumeRetriever()
+        retriever.index(ResumeParser().load(report.resume), chunk_size=20, overlap=2)
+        expected = JobMatcher(retriever, LLMClient(LLMConfig(provider="offline"))).score_jobs(JOBS)
+        assert [match.job.url for match in report.matched_jobs] == [match.job.url for match in expected]
+        assert [match.similarity for match in report.matched_jobs] == pytest.approx(
+            [match.similarity for match in expected]
+        )
+        assert [match.llm_reasoning for match in report.matched_jobs] == [match.llm_reasoning for match in expected]
+
+
+@pytest.mark.parametrize("backend", ["postings", "store"])
+def test_process_pool_retrieval_matches_serial_scoring(tmp_path, backend):
+    jobs = [
+        JobPosting(title=f"Job {index}", company="Acme", description=description, url=str(index))
+        for index, description in enumerate(
+            ["Python Flask APIs", "AWS Docker", "Bread", "Spark and Python pipelines", "Flask on AWS"]
+        )
+    ]
+    if backend == "store":
+        JobStore.write(tmp_path / "jobs.store", jobs)
+        jobs = list(JobStore.open(tmp_path / "jobs.store"))
+    retriever = ResumeRetriever()
+    retriever.index(Resume(raw_text="Python developer building Flask APIs on AWS with Docker."), chunk_size=4, overlap=1)
+    llm = LLMClient(LLMConfig(provider="offline"))
+
+    serial = JobMatcher(retriever, llm).score_jobs(jobs)
+    pooled = JobMatcher(retriever, llm, MatchSettings(workers=2, worker_batch_size=2)).score_jobs(jobs)
+
+    assert [(match.job.url, match.similarity, match.llm_reasoning) for match in pooled] == [
+        (match.job.url, match.similarity, match.llm_reasoning) for match in serial
+    ]
+
+
+def test_batch_accepts_store_backed_jobs(tmp_path):
+    JobStore.write(tmp_path / "jobs.store", JOBS)
+    views = list(JobStore.open(tmp_path / "jobs.store"))
+    for name in ("backend.txt", "data.txt"):
+        (tmp_path / name).write_text("Python developer building Spark pipelines.", encoding="utf-8")
+
+    batch = BatchMatcher(LLMConfig(provider="offline"), chunk_size=20, overlap=2, workers=2)
+    reports = list(batch.run(find_resumes(tmp_path), views))
+
+    assert [report.error for report in reports] == [None, None]
+    assert [match.job.url for match in reports[0].matched_jobs] == [match.job.url for match in reports[1].matched_jobs]
+    assert max(reports[0].matched_jobs, key=lambda match: match.similarity).job.url == "b"
+
+
+def test_cli_rejects_options_batch_runs_ignore(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path), "python", "--batch", "--catalogue", str(tmp_path / "jobs.db")])
+    assert "--catalogue cannot be combined with --batch" in capsys.readouterr().err
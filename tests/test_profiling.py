@@ -0,0 +1,59 @@
+import pstats
+import threading
+import time
+
+import pytest
+
+from job_search_automation.profiling import ProfileSession
+
+
+def busy_loop(seconds: float) -> int:
+    total = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+def test_sampling_session_writes_collapsed_stacks(tmp_path):
+    with ProfileSession(tmp_path, "run", interval=0.001) as session:
+        busy_loop(0.2)
+
+    assert session.path.parent == tmp_path and session.path.suffix == ".folded"
+    lines = session.path.read_text().splitlines()
+    assert lines
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+    assert any("test_profiling.py:busy_loop" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[0].count(";") >= 1 for line in lines)
+
+
+def test_cprofile_session_writes_pstats(tmp_path):
+    with ProfileSession(tmp_path, "run", mode="cprofile") as session:
+        busy_loop(0.01)
+
+    stats = pstats.Stats(str(session.path))
+    assert any(name == "busy_loop" for _, _, name in stats.stats)
+
+    with pytest.raises(ValueError):
+        ProfileSession(tmp_path, "run", mode="perf")
+
+
+def test_cprofile_sessions_take_turns(tmp_path):
+    sessions = []
+
+    def profiled() -> None:
+        with ProfileSession(tmp_path, "request", mode="cprofile") as session:
+            time.sleep(0.1)
+        sessions.append(session)
+
+    threads = [threading.Thread(target=profiled) for _ in range(2)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.perf_counter() - started >= 0.2
+    assert len(sessions) == 2 and sessions[0].path != sessions[1].path
+    for session in sessions:
+        pstats.Stats(str(session.path))
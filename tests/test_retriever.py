@@ -1,5 +1,12 @@
+import math
+import re
+import threading
+from collections import Counter
+
+import pytest
+
 from job_search_automation.models import JobPosting, Resume
-from job_search_automation.retriever import ResumeRetriever
+from job_search_automation.retriever import JobCorpus, ResumeRetriever
 
 
 def test_resume_retriever_returns_ranked_snippets():
@@ -23,3 +30,145 @@ def test_resume_retriever_returns_ranked_snippets():
     assert len(contexts) == 2
     assert all(context.score >= 0 for context in contexts)
     assert any("Python" in context.snippet for context in contexts)
+
+
+def _reference_scores(chunks: list[str], description: str) -> dict[str, float]:
+    """Score chunks with plain dictionaries, as the retriever did before the sparse matrix."""
+
+    def tokenize(text):
+        return re.findall(r"[a-z0-9]+", text.lower())
+
+    def tfidf(tokens, idf):
+        counts = Counter(tokens)
+        if not counts:
+            return {}
+        max_tf = max(counts.values())
+        weights = {term: (0.5 + 0.5 * (freq / max_tf)) * idf.get(term, 0.0) for term, freq in counts.items()}
+        return {term: weight for term, weight in weights.items() if weight}
+
+    documents = [tokenize(chunk) for chunk in chunks]
+    df = Counter(term for tokens in documents for term in set(tokens))
+    idf = {term: math.log((1 + len(documents)) / (1 + freq)) + 1.0 for term, freq in df.items()}
+    query = tfidf(tokenize(description), idf)
+    scores = {}
+    for chunk, tokens in zip(chunks, documents):
+        vector = tfidf(tokens, idf)
+        numerator = sum(weight * vector.get(term, 0.0) for term, weight in query.items())
+        norms = math.sqrt(sum(w * w for w in query.values())) * math.sqrt(sum(w * w for w in vector.values()))
+        scores[chunk] = numerator / norms if norms else 0.0
+    return scores
+
+
+def test_query_many_matches_reference_cosine_scores():
+    resume = Resume(
+        raw_text=(
+            "Python developer with Flask and Django experience. "
+            "Deployed machine learning models on AWS with Docker and Kubernetes. "
+            "Led a team of data engineers building Spark pipelines."
+        )
+    )
+    retriever = ResumeRetriever(max_snippets=3)
+    retriever.index(resume, chunk_size=8, overlap=2)
+
+    jobs = [
+        JobPosting(title="Backend", company="A", description="Flask APIs in Python on AWS.", url=""),
+        JobPosting(title="Data", company="B", description="Spark pipelines for data engineers.", url=""),
+        JobPosting(title="Chef", company="C", description="Prepare seasonal menus.", url=""),
+        # Out-of-vocabulary terms still set the augmented TF denominator.
+        JobPosting(title="Mixed", company="D", description="the the the the python python flask aws spark", url=""),
+    ]
+    batched = retriever.query_many(jobs)
+    chunks = [context.snippet for context in retriever.query_many(jobs[:1], top_k=100)[0]]
+
+    assert len(batched) == len(jobs)
+    for job, contexts in zip(jobs, batched):
+        expected = _reference_scores(chunks, job.description)
+        assert [context.score for context in contexts] == pytest.approx(sorted(expected.values(), reverse=True)[:3])
+        for context in contexts:
+            assert context.score == pytest.approx(expected[context.snippet])
+    assert all(context.score == 0.0 for context in batched[2])
+    assert batched[1][0].snippet.endswith("Spark pipelines.")
+
+
+def test_index_cache_reuses_saved_index(tmp_path, monkeypatch):
+    resume = Resume(raw_text="Python developer building Flask APIs and Spark data pipelines on AWS.")
+    job = JobPosting(title="Backend", company="A", description="Python Flask APIs on AWS.", url="")
+
+    first = ResumeRetriever()
+    first.index(resume, chunk_size=5, overlap=1, cache_dir=tmp_path)
+    cached = list(tmp_path.glob("*.idx"))
+    assert [path.stem for path in cached] == [first.index_key]
+
+    second = ResumeRetriever()
+    monkeypatch.setattr(second, "_build", lambda *args: pytest.fail("index should be loaded from cache"))
+    second.index(resume, chunk_size=5, overlap=1, cache_dir=tmp_path)
+
+    assert second.index_key == first.index_key
+    assert [(c.snippet, c.score) for c in second.query(job)] == [(c.snippet, c.score) for c in first.query(job)]
+
+    third = ResumeRetriever()
+    third.index(resume, chunk_size=6, overlap=1, cache_dir=tmp_path)
+    assert third.index_key != first.index_key
+    assert len(list(tmp_path.glob("*.idx"))) == 2
+
+
+def test_concurrent_saves_of_one_index_do_not_collide(tmp_path):
+    retriever = ResumeRetriever()
+    retriever.index(Resume(raw_text="Python developer building Flask APIs on AWS. " * 50), chunk_size=20, overlap=4)
+    path = tmp_path / "resume.idx"
+    errors = []
+
+    def save() -> None:
+        try:
+            for _ in range(20):
+                retriever.save(path)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=save) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert [entry.name for entry in tmp_path.iterdir()] == ["resume.idx"]
+    loaded = ResumeRetriever()
+    loaded.load(path)
+    job = JobPosting(title="Backend", company="A", description="Flask APIs on AWS", url="")
+    assert [c.score for c in loaded.query(job)] == [c.score for c in retriever.query(job)]
+
+
+def test_corpus_scoring_matches_query_many():
+    resume = Resume(
+        raw_text=(
+            "Python developer with Flask and Django experience. "
+            "Deployed machine learning models on AWS with Docker and Kubernetes. "
+            "Led a team of data engineers building Spark pipelines."
+        )
+    )
+    retriever = ResumeRetriever(max_snippets=2)
+    retriever.index(resume, chunk_size=8, overlap=2)
+    descriptions = [
+        "Python Python Flask engineer for APIs, some AWS.",
+        "Spark and data pipelines; data engineers wanted.",
+        "Pastry chef, croissants and bread.",
+        "Kubernetes Docker Docker AWS platform role.",
+        "",
+        "the the the the python python flask aws spark",
+    ]
+    jobs = [JobPosting(title=f"Job {i}", company="C", description=text, url="") for i, text in enumerate(descriptions)]
+    corpus = JobCorpus(jobs)
+
+    expected = retriever.query_many(jobs)
+    actual = retriever.query_corpus(corpus)
+    for expected_contexts, contexts in zip(expected, actual):
+        assert [c.snippet for c in contexts] == [c.snippet for c in expected_contexts]
+        assert [c.score for c in contexts] == pytest.approx([c.score for c in expected_contexts])
+
+    subset = retriever.query_corpus(corpus, job_ids=[3, 1])
+    assert [c.score for c in subset[0]] == pytest.approx([c.score for c in expected[3]])
+
+    best = [max(c.score for c in contexts) for contexts in expected]
+    ranked = retriever.rank_corpus(corpus, n=4)
+    assert [job_id for job_id, _ in ranked] == sorted(range(len(jobs)), key=lambda i: (-best[i], i))[:4]
@@ -0,0 +1,82 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from job_search_automation.config import JobSearchConfig
+from job_search_automation.job_fetchers.serpapi import SerpApiJobFetcher
+
+PAGES = {
+    None: ([{"title": "Job 1"}, {"title": "Job 2"}], "page-2"),
+    "page-2": ([{"title": "Job 3"}, {"title": "Job 4"}], "page-3"),
+    "page-3": ([{"title": "Job 5"}], None),
+}
+
+
+class StubSerpApi:
+    """Local HTTP server serving three pages of Google Jobs results."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                query = {key: values[0] for key, values in parse_qs(urlsplit(self.path).query).items()}
+                stub.requests.append(query)
+                results, token = PAGES[query.get("next_page_token")]
+                payload = {"jobs_results": results}
+                if token:
+                    payload["serpapi_pagination"] = {"next_page_token": token}
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/search.json"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def serpapi(monkeypatch):
+    monkeypatch.setenv("SERPAPI_API_KEY", "secret")
+    stub = StubSerpApi()
+    yield stub
+    stub.close()
+
+
+def test_search_follows_pages_until_max_results(serpapi):
+    config = JobSearchConfig(provider="serpapi", keywords=["python"], max_results=3)
+    fetcher = SerpApiJobFetcher(config, base_url=serpapi.url)
+
+    titles = [job.title for job in fetcher.search()]
+    fetcher.close()
+
+    assert titles == ["Job 1", "Job 2", "Job 3"]
+    assert [request.get("next_page_token") for request in serpapi.requests] == [None, "page-2"]
+
+
+def test_responses_are_cached_without_the_api_key(serpapi, tmp_path, monkeypatch):
+    config = JobSearchConfig(provider="serpapi", keywords=["python"], max_results=10, cache_dir=tmp_path)
+
+    first = [job.title for job in SerpApiJobFetcher(config, base_url=serpapi.url).search()]
+    monkeypatch.setenv("SERPAPI_API_KEY", "rotated")
+    second = [job.title for job in SerpApiJobFetcher(config, base_url=serpapi.url).search()]
+
+    assert first == second == ["Job 1", "Job 2", "Job 3", "Job 4", "Job 5"]
+    assert len(serpapi.requests) == 3
+    assert all("secret" not in path.read_text() for path in tmp_path.iterdir())
@@ -0,0 +1,31 @@
+import json
+import os
+
+from job_search_automation.service import MatchingService
+
+RESUME = "Python developer building Flask APIs and data pipelines on AWS."
+
+
+def _write_dataset(path, titles):
+    records = [
+        {"title": title, "company": "Acme", "description": "Python Flask APIs", "url": f"https://acme.io/{index}"}
+        for index, title in enumerate(titles)
+    ]
+    path.write_text(json.dumps(records), encoding="utf-8")
+
+
+def test_service_reuses_index_until_dataset_changes(tmp_path):
+    dataset = tmp_path / "jobs.json"
+    _write_dataset(dataset, ["Python Engineer"])
+    service = MatchingService(dataset_path=dataset)
+
+    index = service.job_index()
+    assert [match.job.title for match in service.match(RESUME, ["python"], None)] == ["Python Engineer"]
+    assert service.job_index() is index
+
+    _write_dataset(dataset, ["Python Engineer", "Senior Python Engineer"])
+    stat = dataset.stat()
+    os.utime(dataset, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert service.job_index() is not index
+    assert len(service.match(RESUME, ["python"], None)) == 2
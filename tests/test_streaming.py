@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from job_search_automation.cli import load_static_jobs
+from job_search_automation.config import JobSearchConfig
+from job_search_automation.job_fetchers.local import LocalJobFetcher
+from job_search_automation.job_fetchers.streaming import iter_json_records
+
+RECORDS = [
+    {"title": "Python Engineer", "company": "A", "description": "Flask APIs", "location": "Remote"},
+    {"title": "Chef", "company": "B", "description": "Menus", "location": "Paris"},
+    {"title": "Data Engineer", "company": "C", "description": "Python and Spark", "location": "Remote"},
+    {"title": "Python Analyst", "company": "D", "description": "Dashboards", "location": "Remote"},
+]
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 4096])
+def test_iter_json_records_reads_arrays_and_json_lines(tmp_path, read_size):
+    array_path = tmp_path / "jobs.json"
+    array_path.write_text(json.dumps(RECORDS, indent=2), encoding="utf-8")
+    lines_path = tmp_path / "jobs.jsonl"
+    lines_path.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n", encoding="utf-8")
+
+    assert list(iter_json_records(array_path, read_size=read_size)) == RECORDS
+    assert list(iter_json_records(lines_path, read_size=read_size)) == RECORDS
+
+
+def test_iter_json_records_handles_tokens_split_across_reads(tmp_path):
+    records = [{"text": "caf\u00e9 \\ \"quoted\"", "flags": [True, False, None], "score": -1.5e3}, 12, "x" * 50]
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps(records), encoding="utf-8")
+
+    for read_size in range(1, 12):
+        assert list(iter_json_records(path, read_size=read_size)) == records
+
+
+def test_iter_json_records_rejects_malformed_record_without_reading_on(tmp_path):
+    path = tmp_path / "jobs.json"
+    tail = ", ".join(json.dumps(record) for record in RECORDS * 50)
+    path.write_text(f'[{{"title": "ok"}}, {{"title": , "company": "A"}}, {tail}]', encoding="utf-8")
+
+    records = iter_json_records(path, read_size=8, max_record_size=256)
+    assert next(records) == {"title": "ok"}
+    # Refilling until the end of the file would trip the record size limit instead.
+    with pytest.raises(ValueError, match="Invalid JSON array"):
+        next(records)
+
+
+def test_streaming_fetcher_stops_reading_after_max_results(tmp_path):
+    path = tmp_path / "jobs.json"
+    # The array ends in a malformed record, so the fetcher only succeeds if it
+    # stops reading once enough matches have been found.
+    path.write_text(json.dumps(RECORDS)[:-1] + ", {broken", encoding="utf-8")
+    config = JobSearchConfig(provider="local", keywords=["python"], location="remote", max_results=2)
+
+    jobs = list(LocalJobFetcher(config, dataset_path=path, streaming=True).search())
+
+    assert [job.title for job in jobs] == ["Python Engineer", "Data Engineer"]
+
+
+def test_load_static_jobs_streaming_is_lazy(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in RECORDS), encoding="utf-8")
+
+    jobs = load_static_jobs(path, streaming=True)
+
+    assert not isinstance(jobs, list)
+    assert [job.title for job in jobs] == [record["title"] for record in RECORDS]
+    assert load_static_jobs(path) == list(load_static_jobs(path, streaming=True))
@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from job_search_automation.tasks import DONE, FAILED, TaskManager, TaskQueueFull
+
+
+def test_wait_returns_partial_results_as_they_are_produced():
+    manager = TaskManager(max_workers=1)
+    gate = threading.Event()
+
+    def work():
+        yield [1, 2]
+        gate.wait(5)
+        yield [3]
+
+    task = manager.submit(work)
+    first = manager.wait(task.id, seen=0, timeout=5)
+    assert first.results == [1, 2] and not first.finished
+
+    gate.set()
+    rest = manager.wait(task.id, seen=2, timeout=5)
+    while not rest.finished:
+        rest = manager.wait(task.id, seen=2, timeout=5)
+    assert rest.status == DONE
+    assert manager.get(task.id).results == [1, 2, 3]
+    manager.shutdown()
+
+
+def test_failures_are_recorded_on_the_task():
+    manager = TaskManager(max_workers=1)
+
+    def work():
+        raise RuntimeError("boom")
+        yield []
+
+    task = manager.submit(work)
+    update = manager.wait(task.id, seen=0, timeout=5)
+    assert update.status == FAILED and update.error == "boom"
+    manager.shutdown()
+
+
+def test_submit_rejects_work_beyond_max_pending():
+    manager = TaskManager(max_workers=1, max_pending=2)
+    gate = threading.Event()
+
+    def work():
+        gate.wait(5)
+        yield [1]
+
+    first = manager.submit(work)
+    manager.submit(work)
+    with pytest.raises(TaskQueueFull):
+        manager.submit(work)
+
+    gate.set()
+    while not manager.wait(first.id, seen=1, timeout=5).finished:
+        pass
+    manager.submit(work)
+    manager.shutdown()
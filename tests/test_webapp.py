@@ -0,0 +1,109 @@
+import json
+import time
+
+import pytest
+
+pytest.importorskip("flask")
+
+from job_search_automation.metrics import Metrics  # noqa: E402
+from job_search_automation.service import MatchingService  # noqa: E402
+from job_search_automation.webapp import create_app  # noqa: E402
+
+RESUME = "Python developer building Flask APIs and data pipelines on AWS."
+
+
+@pytest.fixture
+def client(tmp_path):
+    records = [
+        {"title": f"Python Engineer {index}", "company": "Acme", "description": "Python Flask APIs", "url": f"u{index}"}
+        for index in range(7)
+    ]
+    dataset = tmp_path / "jobs.json"
+    dataset.write_text(json.dumps(records), encoding="utf-8")
+    app = create_app(service=MatchingService(dataset_path=dataset))
+    yield app.test_client()
+    app.extensions["match_tasks"].shutdown()
+
+
+def test_api_match_returns_ranked_results(client):
+    response = client.post("/api/match", json={"resume_text": RESUME, "keywords": "python"})
+
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    assert len(results) == 7
+    assert [item["similarity"] for item in results] == sorted((item["similarity"] for item in results), reverse=True)
+    assert client.post("/api/match", json={"keywords": ["python"]}).status_code == 400
+
+
+def test_api_match_rejects_malformed_payloads(client):
+    for payload in (
+        [RESUME],
+        {"resume_text": RESUME, "keywords": 5},
+        {"resume_text": RESUME, "keywords": [1, 2]},
+        {"resume_text": RESUME, "location": ["Remote"]},
+        {"resume_text": ["not", "text"]},
+        {"resume_text": RESUME, "async": "maybe"},
+    ):
+        response = client.post("/api/match", json=payload)
+        assert response.status_code == 400, payload
+        assert "error" in response.get_json()
+
+    response = client.post("/api/match", json={"resume_text": RESUME, "keywords": "python", "async": "false"})
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "done"
+
+
+def test_async_match_can_be_polled_and_streamed(client):
+    response = client.post("/api/match", json={"resume_text": RESUME, "keywords": ["python"], "async": True})
+    assert response.status_code == 202
+    task = response.get_json()
+
+    events = client.get(task["events_url"]).get_data(as_text=True)
+    batches = [json.loads(line[6:]) for line in events.splitlines() if line.startswith("data: [")]
+    assert sum(len(batch) for batch in batches) == 7
+    assert "event: done" in events
+
+    for _ in range(50):
+        status = client.get(task["status_url"]).get_json()
+        if status["status"] == "done":
+            break
+        time.sleep(0.01)
+    assert len(status["results"]) == 7
+    assert client.get("/api/match/unknown").status_code == 404
+
+
+def test_metrics_endpoint_exposes_request_and_stage_timings(tmp_path):
+    dataset = tmp_path / "jobs.json"
+    dataset.write_text(json.dumps([{"title": "Python Engineer", "description": "Python Flask APIs", "url": "u"}]))
+    app = create_app(service=MatchingService(dataset_path=dataset, metrics=Metrics()))
+    client = app.test_client()
+    try:
+        client.post("/api/match", json={"resume_text": RESUME, "keywords": ["python"]})
+        response = client.get("/metrics")
+    finally:
+        app.extensions["match_tasks"].shutdown()
+
+    body = response.get_data(as_text=True)
+    assert response.mimetype == "text/plain"
+    assert 'job_search_stage_seconds_count{stage="analyse"} 1' in body
+    assert 'job_search_http_server_request_seconds_count{endpoint="api_match",status="200"} 1' in body
+
+
+def test_metrics_endpoint_is_disabled_without_a_registry(client):
+    assert client.get("/metrics").status_code == 404
+
+
+def test_profiled_request_writes_a_profile(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROFILE_DIR", str(tmp_path / "profiles"))
+    dataset = tmp_path / "jobs.json"
+    dataset.write_text(json.dumps([{"title": "Python Engineer", "description": "Python Flask APIs", "url": "u"}]))
+    app = create_app(service=MatchingService(dataset_path=dataset))
+    client = app.test_client()
+    try:
+        plain = client.post("/api/match", json={"resume_text": RESUME})
+        profiled = client.post("/api/match?profile=1", json={"resume_text": RESUME})
+    finally:
+        app.extensions["match_tasks"].shutdown()
+
+    assert "X-Profile-Output" not in plain.headers
+    assert (tmp_path / "profiles" / profiled.headers["X-Profile-Output"]).exists()